@@ -0,0 +1,31 @@
+"""add token_version to user
+
+Revision ID: 2a7c9e4b1d35
+Revises: 1f02dc62ed2c
+Create Date: 2026-10-18 09:12:41.318220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a7c9e4b1d35'
+down_revision: Union[str, Sequence[str], None] = '1f02dc62ed2c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'user',
+        sa.Column('token_version', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user', 'token_version')
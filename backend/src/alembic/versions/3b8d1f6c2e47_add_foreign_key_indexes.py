@@ -0,0 +1,58 @@
+"""add foreign key indexes
+
+Revision ID: 3b8d1f6c2e47
+Revises: 2a7c9e4b1d35
+Create Date: 2026-10-18 11:04:27.509614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8d1f6c2e47'
+down_revision: Union[str, Sequence[str], None] = '2a7c9e4b1d35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ACTIVE = sa.text('is_active = true')
+
+# (index name, table, columns, partial predicate)
+INDEXES = [
+    ('ix_classroom_subject_classroom_id_subject_id', 'classroom_subject', ['classroom_id', 'subject_id'], None),
+    ('ix_classroom_subject_subject_id', 'classroom_subject', ['subject_id'], None),
+    ('ix_classroom_subject_teacher_id', 'classroom_subject', ['teacher_id'], None),
+    ('ix_classroom_subject_substitute_teacher_id', 'classroom_subject', ['substitute_teacher_id'], None),
+    ('ix_classroom_subject_active_classroom_id', 'classroom_subject', ['classroom_id'], ACTIVE),
+    ('ix_classroom_subject_student_classroom_subject_id_student_id', 'classroom_subject_student', ['classroom_subject_id', 'student_id'], None),
+    ('ix_classroom_subject_student_student_id', 'classroom_subject_student', ['student_id'], None),
+    ('ix_classroom_subject_student_active_student_id', 'classroom_subject_student', ['student_id'], ACTIVE),
+    ('ix_classroom_subject_student_active_classroom_subject_id', 'classroom_subject_student', ['classroom_subject_id'], ACTIVE),
+    ('ix_qualification_classroom_subject_student_id_created_at', 'qualification', ['classroom_subject_student_id', 'created_at'], None),
+    ('ix_qualification_teacher_id', 'qualification', ['teacher_id'], None),
+    ('ix_classes_classroom_id', 'classes', ['classroom_id'], None),
+    ('ix_classes_subject_id', 'classes', ['subject_id'], None),
+    ('ix_classes_teacher_id', 'classes', ['teacher_id'], None),
+    ('ix_classes_classroom_subject_id', 'classes', ['classroom_subject_id'], None),
+    ('ix_files_class_id', 'files', ['class_id'], None),
+    ('ix_classroom_tutor_id', 'classroom', ['tutor_id'], None),
+    ('ix_teacher_user_id', 'teacher', ['user_id'], None),
+    ('ix_student_user_id', 'student', ['user_id'], None),
+    ('ix_user_role_relation_role_id', 'user_role_relation', ['role_id'], None),
+    ('ix_role_permission_relation_permission_id', 'role_permission_relation', ['permission_id'], None),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns, where in INDEXES:
+        op.create_index(name, table, columns, unique=False, postgresql_where=where)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
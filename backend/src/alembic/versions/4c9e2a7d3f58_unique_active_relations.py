@@ -0,0 +1,108 @@
+"""unique active classroom subjects and enrollments
+
+Revision ID: 4c9e2a7d3f58
+Revises: 3b8d1f6c2e47
+Create Date: 2026-10-18 12:31:08.274193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c9e2a7d3f58'
+down_revision: Union[str, Sequence[str], None] = '3b8d1f6c2e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ACTIVE = sa.text('is_active = true')
+
+
+# Active rows that the unique indexes below would reject, one line per group
+DUPLICATE_CLASSROOM_SUBJECTS = sa.text(
+    """
+    SELECT classroom_id, subject_id, array_agg(id ORDER BY id) AS ids
+    FROM classroom_subject
+    WHERE is_active
+    GROUP BY classroom_id, subject_id
+    HAVING count(*) > 1
+    """
+)
+DUPLICATE_ENROLLMENTS = sa.text(
+    """
+    SELECT classroom_subject_id, student_id, array_agg(id ORDER BY id) AS ids
+    FROM classroom_subject_student
+    WHERE is_active
+    GROUP BY classroom_subject_id, student_id
+    HAVING count(*) > 1
+    """
+)
+
+
+def _check_no_active_duplicates() -> None:
+    """
+    Abort instead of deactivating duplicates: their enrollments and
+    qualifications would vanish from every active view. An operator has to
+    merge or deactivate them, then run the migration again.
+    """
+    connection = op.get_bind()
+    conflicts = [
+        f"classroom_subject classroom_id={row.classroom_id} "
+        f"subject_id={row.subject_id}: ids {list(row.ids)}"
+        for row in connection.execute(DUPLICATE_CLASSROOM_SUBJECTS)
+    ] + [
+        f"classroom_subject_student classroom_subject_id={row.classroom_subject_id} "
+        f"student_id={row.student_id}: ids {list(row.ids)}"
+        for row in connection.execute(DUPLICATE_ENROLLMENTS)
+    ]
+    if conflicts:
+        raise RuntimeError(
+            "Cannot create the unique active indexes; resolve these duplicate "
+            "active rows first:\n  " + "\n  ".join(conflicts)
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _check_no_active_duplicates()
+
+    # The unique indexes lead with the same columns, so they replace these
+    op.drop_index('ix_classroom_subject_active_classroom_id', table_name='classroom_subject')
+    op.drop_index('ix_classroom_subject_student_active_classroom_subject_id', table_name='classroom_subject_student')
+    op.create_index(
+        'uq_classroom_subject_active_classroom_id_subject_id',
+        'classroom_subject',
+        ['classroom_id', 'subject_id'],
+        unique=True,
+        postgresql_where=ACTIVE,
+    )
+    op.create_index(
+        'uq_classroom_subject_student_active_enrollment',
+        'classroom_subject_student',
+        ['classroom_subject_id', 'student_id'],
+        unique=True,
+        postgresql_where=ACTIVE,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_classroom_subject_student_active_enrollment', table_name='classroom_subject_student')
+    op.drop_index('uq_classroom_subject_active_classroom_id_subject_id', table_name='classroom_subject')
+    op.create_index(
+        'ix_classroom_subject_student_active_classroom_subject_id',
+        'classroom_subject_student',
+        ['classroom_subject_id'],
+        unique=False,
+        postgresql_where=ACTIVE,
+    )
+    op.create_index(
+        'ix_classroom_subject_active_classroom_id',
+        'classroom_subject',
+        ['classroom_id'],
+        unique=False,
+        postgresql_where=ACTIVE,
+    )
@@ -0,0 +1,74 @@
+"""add grade summary columns to classroom_subject_student
+
+Revision ID: 5d1b8e3f7a62
+Revises: 4c9e2a7d3f58
+Create Date: 2026-10-18 15:02:47.613094
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1b8e3f7a62'
+down_revision: Union[str, Sequence[str], None] = '4c9e2a7d3f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTERS = ['record_count', 'score_sum', 'score_count']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in COUNTERS:
+        op.add_column(
+            'classroom_subject_student',
+            sa.Column(column, sa.Integer(), server_default='0', nullable=False),
+        )
+    op.add_column(
+        'classroom_subject_student',
+        sa.Column('grades_updated_at', sa.DateTime(), nullable=True),
+    )
+
+    # Backfill from the existing history; scores mirror GRADE_TO_SCORE
+    op.execute(
+        """
+        UPDATE classroom_subject_student AS enrollment
+        SET record_count = history.record_count,
+            score_sum = history.score_sum,
+            score_count = history.score_count,
+            grades_updated_at = history.last_recorded_at
+        FROM (
+            SELECT classroom_subject_student_id,
+                   count(*) AS record_count,
+                   coalesce(sum(score), 0) AS score_sum,
+                   count(score) AS score_count,
+                   max(created_at) AS last_recorded_at
+            FROM (
+                SELECT classroom_subject_student_id,
+                       created_at,
+                       CASE upper(trim(grade))
+                           WHEN 'AD' THEN 20
+                           WHEN 'A' THEN 17
+                           WHEN 'B' THEN 14
+                           WHEN 'C' THEN 10
+                           WHEN 'D' THEN 5
+                       END AS score
+                FROM qualification
+                WHERE classroom_subject_student_id IS NOT NULL
+            ) AS scored
+            GROUP BY classroom_subject_student_id
+        ) AS history
+        WHERE history.classroom_subject_student_id = enrollment.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('classroom_subject_student', 'grades_updated_at')
+    for column in reversed(COUNTERS):
+        op.drop_column('classroom_subject_student', column)
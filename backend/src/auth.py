@@ -2,9 +2,11 @@ from dataclasses import dataclass
 from typing import List, Optional
 from fastapi import Depends, HTTPException, Request
 from jose import jwt, JWTError
-from src.services.auth import AuthService
+from src.services.auth import AuthService, get_auth_service
+from src.services.auth_cache import auth_context_cache
 from src.persistence.repositories.user_repository import UserRepository
-from src.database import AsyncSQLSession
+from src.database import async_session
+from src.config import configuration_variables
 
 
 @dataclass
@@ -19,14 +21,17 @@ class CurrentUserContext:
 
 async def get_current_user(
     request: Request,
-    session: AsyncSQLSession,
-    auth: AuthService = Depends(AuthService),
+    auth: AuthService = Depends(get_auth_service),
 ) -> CurrentUserContext:
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.lower().startswith("bearer "):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     token = auth_header.split(" ", 1)[1].strip()
+    cached = auth_context_cache.get(token)
+    if cached is not None:
+        return cached
+
     try:
         payload = jwt.decode(token, auth.secret_key, algorithms=[auth.algorithm])
     except JWTError:
@@ -37,9 +42,23 @@ async def get_current_user(
     if subject is None or email is None:
         raise HTTPException(status_code=401, detail="Invalid token claims")
 
-    # Use repository with eager loading to fetch user, roles, and permissions in one ORM call
-    user_repo = UserRepository(session)
-    user = await user_repo.get_with_roles_permissions_by_id(subject)
+    # A session of its own, closed before the route runs, so the connection is
+    # not held (inside an open transaction) for the rest of the request
+    async with async_session() as session:
+        user_repo = UserRepository(session)
+        # Tokens issued while the flag was off carry a version but no claims;
+        # they keep going through the lookup until the user logs in again
+        if (
+            configuration_variables.auth_stateless_tokens
+            and payload.get("type") == "access"
+            and payload.get("claims") is True
+            and payload.get("ver") is not None
+        ):
+            return await _get_stateless_user(user_repo, payload)
+
+        # Single aggregated row with the token pair, profile ids and role/permission codes
+        user = await user_repo.get_auth_context_by_id(subject)
+
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -47,38 +66,54 @@ async def get_current_user(
     if token not in {user.token, user.refresh_token}:
         raise HTTPException(status_code=401, detail="Token invalid or expired")
 
-    role_codes = [rel.role.code for rel in user.roles if rel.role is not None]
-    permission_codes: List[str] = []
-    for rel in getattr(user, "roles", []):
-        role = rel.role
-        if role is None:
-            continue
-        for rp in getattr(role, "permissions", []):
-            if rp.permission is not None:
-                permission_codes.append(rp.permission.code)
+    context = CurrentUserContext(
+        user_id=str(user.id),
+        email=user.email,
+        roles=sorted(user.roles or []),
+        permissions=sorted(user.permissions or []),
+        teacher_id=str(user.teacher_id) if user.teacher_id else None,
+        student_id=str(user.student_id) if user.student_id else None,
+    )
+    auth_context_cache.set(token, context, payload.get("exp"))
+    return context
+
 
-    teacher_id = str(user.teacher.id) if getattr(user, "teacher", None) else None
-    student_id = str(user.student.id) if getattr(user, "student", None) else None
+async def _get_stateless_user(
+    user_repo: UserRepository, payload: dict
+) -> CurrentUserContext:
+    """
+    Authorize an access token from its embedded claims. The only state checked
+    is the user's token version, which is cached so most calls skip the database.
+    """
+    subject = payload["sub"]
+    version = auth_context_cache.get_token_version(subject)
+    if version is None:
+        version = await user_repo.get_token_version(subject)
+        if version is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        auth_context_cache.set_token_version(subject, version)
+
+    if payload["ver"] != version:
+        raise HTTPException(status_code=401, detail="Token invalid or expired")
 
     return CurrentUserContext(
-        user_id=str(user.id),
-        email=user.email,
-        roles=sorted(set(role_codes)),
-        permissions=sorted(set(permission_codes)),
-        teacher_id=teacher_id,
-        student_id=student_id,
+        user_id=subject,
+        email=payload["email"],
+        roles=list(payload.get("roles") or []),
+        permissions=list(payload.get("perms") or []),
+        teacher_id=payload.get("tid"),
+        student_id=payload.get("sid"),
     )
 
 
 async def get_optional_current_user(
     request: Request,
-    session: AsyncSQLSession,
-    auth: AuthService = Depends(AuthService),
+    auth: AuthService = Depends(get_auth_service),
 ) -> Optional[CurrentUserContext]:
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.lower().startswith("bearer "):
         return None
 
-    return await get_current_user(request, session, auth)
+    return await get_current_user(request, auth)
 
 
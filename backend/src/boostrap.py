@@ -1,9 +1,18 @@
-from fastapi import FastAPI
+import json
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from typing import Dict
 
 from src.config import configuration_variables
+from src.database import mark_recent_writer, replica_engine
+from src.logger import logger
+from src.query_stats import start_query_stats
+from src.request_cancellation import CancelOnDisconnectMiddleware
+from src.services.auth import get_auth_service
+from src.services.cache_backends import cache_backend
+from src.services.cache_invalidation import invalidation_listener
 from src.routes.auth import router as auth_router
 from src.routes.users import router as users_router
 from src.routes.roles import router as roles_router
@@ -14,8 +23,22 @@ from src.routes.classrooms import router as classrooms_router
 from src.routes.subjects import router as subjects_router
 from src.routes.classroom_subject import router as classroom_subject_router
 from src.routes.classroom_subject_student import router as classroom_subject_student_router
+from src.routes.metrics import router as metrics_router
 
-app: FastAPI = FastAPI(redirect_slashes=False)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Process-wide services are built before the first request instead of during it
+    get_auth_service()
+    if configuration_variables.cache_invalidation_listen:
+        invalidation_listener.start()
+    yield
+    await invalidation_listener.stop()
+    await cache_backend.close()
+
+
+app: FastAPI = FastAPI(redirect_slashes=False, lifespan=lifespan)
 
 if configuration_variables.is_production:
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
@@ -32,9 +55,62 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-DB-Queries", "ETag"],
 )
 
 
+if configuration_variables.query_stats_enabled:
+
+    @app.middleware("http")
+    async def query_stats(request: Request, call_next):
+        stats = start_query_stats()
+        request.state.query_stats = stats
+        response = await call_next(request)
+
+        response.headers["Server-Timing"] = (
+            f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries"'
+        )
+        response.headers["X-DB-Queries"] = str(stats.count)
+        logger.info(
+            json.dumps(
+                {
+                    "event": "request_db_stats",
+                    "method": request.method,
+                    "path": request.url.path,
+                    "status": response.status_code,
+                    **stats.as_dict(),
+                }
+            )
+        )
+
+        # Same statement shape over and over in one request is usually an N+1 loop
+        if configuration_variables.is_development:
+            for shape, executions in stats.repeated(
+                configuration_variables.n_plus_one_threshold
+            ):
+                logger.warning(
+                    f"Possible N+1: statement executed {executions} times in "
+                    f"{request.method} {request.url.path}: {shape[:300]}"
+                )
+        return response
+
+
+if replica_engine is not None:
+
+    @app.middleware("http")
+    async def read_your_writes(request: Request, call_next):
+        response = await call_next(request)
+        # After a successful write, route this caller's reads to the primary for a while
+        if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+            mark_recent_writer(response)
+        return response
+
+
+if configuration_variables.cancel_on_disconnect:
+    # Outermost, so an abandoned request stops every layer below it
+    app.add_middleware(CancelOnDisconnectMiddleware)
+
+
 @app.get("/health")
 async def health_check() -> Dict[str, str]:
     return {"status": "healthy"}
@@ -48,4 +124,5 @@ app.include_router(students_router, prefix="/students")
 app.include_router(classrooms_router, prefix="/classrooms")
 app.include_router(subjects_router, prefix="/subjects")
 app.include_router(classroom_subject_router, prefix="/classroom-subject")
-app.include_router(classroom_subject_student_router, prefix="/classroom-subject-student")
\ No newline at end of file
+app.include_router(classroom_subject_student_router, prefix="/classroom-subject-student")
+app.include_router(metrics_router, prefix="/metrics")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Dict
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from functools import cached_property
@@ -10,6 +10,8 @@ def ofuscate(value: str) -> str:
 class ConfigurationVariables(BaseSettings):
     environment: Annotated[str, Field(alias="ENVIRONMENT", default="local")]
     database_url: Annotated[str, Field(alias="POSTGRES_URL")]
+    replica_database_url: Annotated[str, Field(alias="POSTGRES_REPLICA_URL", default="")]
+    read_your_writes_seconds: Annotated[float, Field(alias="READ_YOUR_WRITES_SECONDS", default=5.0)]
     log_sql_queries: Annotated[bool, Field(alias="LOG_SQL_QUERIES", default=False)]
     secret_key: Annotated[str, Field(alias="SECRET_KEY", default="")]
     algorithm: Annotated[str, Field(alias="ALGORITHM", default="HS256")]
@@ -17,6 +19,47 @@ class ConfigurationVariables(BaseSettings):
     aws_secret_access_key: Annotated[str, Field(alias="AWS_SECRET_ACCESS_KEY", default="")]
     aws_region: Annotated[str, Field(alias="AWS_REGION", default="us-east-1")]
     aws_file_bucket_name: Annotated[str, Field(alias="AWS_FILE_BUCKET_NAME", default="")]
+    auth_cache_ttl_seconds: Annotated[float, Field(alias="AUTH_CACHE_TTL_SECONDS", default=60.0)]
+    auth_cache_max_entries: Annotated[int, Field(alias="AUTH_CACHE_MAX_ENTRIES", default=10000)]
+    # "memory" keeps entries per worker; "redis" shares them through CACHE_URL
+    cache_backend: Annotated[str, Field(alias="CACHE_BACKEND", default="memory")]
+    cache_url: Annotated[str, Field(alias="CACHE_URL", default="redis://localhost:6379/0")]
+    cache_key_prefix: Annotated[str, Field(alias="CACHE_KEY_PREFIX", default="backend:")]
+    cache_max_entries: Annotated[int, Field(alias="CACHE_MAX_ENTRIES", default=10000)]
+    cache_invalidation_channel: Annotated[str, Field(alias="CACHE_INVALIDATION_CHANNEL", default="cache_invalidation")]
+    cache_invalidation_listen: Annotated[bool, Field(alias="CACHE_INVALIDATION_LISTEN", default=True)]
+    cache_invalidation_retry_seconds: Annotated[float, Field(alias="CACHE_INVALIDATION_RETRY_SECONDS", default=5.0)]
+    reference_cache_ttl_seconds: Annotated[float, Field(alias="REFERENCE_CACHE_TTL_SECONDS", default=300.0)]
+    # Cache-Control max-age for anonymous reference data responses; 0 forces revalidation
+    reference_cache_max_age_seconds: Annotated[int, Field(alias="REFERENCE_CACHE_MAX_AGE_SECONDS", default=60)]
+    grade_fingerprint_ttl_seconds: Annotated[float, Field(alias="GRADE_FINGERPRINT_TTL_SECONDS", default=30.0)]
+    auth_stateless_tokens: Annotated[bool, Field(alias="AUTH_STATELESS_TOKENS", default=False)]
+    auth_token_version_ttl_seconds: Annotated[float, Field(alias="AUTH_TOKEN_VERSION_TTL_SECONDS", default=30.0)]
+    password_hash_workers: Annotated[int, Field(alias="PASSWORD_HASH_WORKERS", default=2)]
+    password_hash_max_pending: Annotated[int, Field(alias="PASSWORD_HASH_MAX_PENDING", default=64)]
+    db_pool_size: Annotated[int, Field(alias="DB_POOL_SIZE", default=5)]
+    db_max_overflow: Annotated[int, Field(alias="DB_MAX_OVERFLOW", default=10)]
+    db_pool_timeout_seconds: Annotated[float, Field(alias="DB_POOL_TIMEOUT_SECONDS", default=30.0)]
+    db_pool_recycle_seconds: Annotated[int, Field(alias="DB_POOL_RECYCLE_SECONDS", default=1800)]
+    db_pool_pre_ping: Annotated[bool, Field(alias="DB_POOL_PRE_PING", default=True)]
+    page_size_default: Annotated[int, Field(alias="PAGE_SIZE_DEFAULT", default=100)]
+    page_size_max: Annotated[int, Field(alias="PAGE_SIZE_MAX", default=500)]
+    bulk_insert_chunk_size: Annotated[int, Field(alias="BULK_INSERT_CHUNK_SIZE", default=1000)]
+    bulk_copy_threshold: Annotated[int, Field(alias="BULK_COPY_THRESHOLD", default=10000)]
+    query_stats_enabled: Annotated[bool, Field(alias="QUERY_STATS_ENABLED", default=True)]
+    n_plus_one_threshold: Annotated[int, Field(alias="N_PLUS_ONE_THRESHOLD", default=10)]
+    slow_query_threshold_ms: Annotated[float, Field(alias="SLOW_QUERY_THRESHOLD_MS", default=500.0)]
+    slow_query_explain: Annotated[bool, Field(alias="SLOW_QUERY_EXPLAIN", default=False)]
+    slow_query_buffer_size: Annotated[int, Field(alias="SLOW_QUERY_BUFFER_SIZE", default=50)]
+    db_statement_timeout_ms: Annotated[int, Field(alias="DB_STATEMENT_TIMEOUT_MS", default=0)]
+    # JSON object of handler class name -> statement timeout in ms, e.g.
+    # {"GetTeacherClassroomStudentsHandler": 3000}
+    db_handler_statement_timeouts_ms: Annotated[Dict[str, int], Field(alias="DB_HANDLER_STATEMENT_TIMEOUTS_MS", default_factory=dict)]
+    cancel_on_disconnect: Annotated[bool, Field(alias="CANCEL_ON_DISCONNECT", default=True)]
+    db_driver: Annotated[str, Field(alias="DB_DRIVER", default="psycopg")]
+    db_prepared_statements: Annotated[bool, Field(alias="DB_PREPARED_STATEMENTS", default=True)]
+    db_prepare_threshold: Annotated[int, Field(alias="DB_PREPARE_THRESHOLD", default=5)]
+    db_prepared_statement_cache_size: Annotated[int, Field(alias="DB_PREPARED_STATEMENT_CACHE_SIZE", default=100)]
 
     @property
     def is_production(self) -> bool:
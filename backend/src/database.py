@@ -1,22 +1,200 @@
-from fastapi import Depends
+from functools import wraps
+from math import ceil
+from time import time
+from fastapi import Depends, Request, Response
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from .config import configuration_variables
-from typing import Annotated, AsyncGenerator
+from .pool_metrics import InstrumentedAsyncQueuePool
+from .query_stats import install_query_stats
+from .statement_timeouts import install_statement_timeouts
+from typing import Annotated, Any, Callable, Dict, Optional
 
-data_base_url = configuration_variables.database_url.replace(
-    "postgresql:", "postgresql+psycopg:"
+try:
+    import asyncpg  # noqa: F401
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
+
+DRIVERS = {
+    "psycopg": "postgresql+psycopg",
+    "asyncpg": "postgresql+asyncpg",
+}
+
+
+def _check_driver(driver: str) -> None:
+    if driver not in DRIVERS:
+        raise ValueError(
+            f"Unsupported DB_DRIVER {driver!r}; expected one of {', '.join(DRIVERS)}"
+        )
+    if driver == "asyncpg" and not ASYNCPG_AVAILABLE:
+        raise RuntimeError("DB_DRIVER=asyncpg requires the asyncpg extra (uv sync --extra asyncpg)")
+
+
+def _prepared_statement_cache_size() -> int:
+    if not configuration_variables.db_prepared_statements:
+        return 0
+    return configuration_variables.db_prepared_statement_cache_size
+
+
+def _async_url(url: str, driver: Optional[str] = None) -> str:
+    driver = driver or configuration_variables.db_driver
+    _check_driver(driver)
+    async_url = url.replace("postgresql:", f"{DRIVERS[driver]}:")
+    if driver == "asyncpg":
+        # SQLAlchemy's asyncpg adapter keeps its own prepared statement LRU per connection
+        separator = "&" if "?" in async_url else "?"
+        async_url += (
+            f"{separator}prepared_statement_cache_size={_prepared_statement_cache_size()}"
+        )
+    return async_url
+
+
+def _connect_args(driver: str) -> Dict[str, Any]:
+    timeout_ms = configuration_variables.db_statement_timeout_ms
+    if driver == "asyncpg":
+        connect_args: Dict[str, Any] = {
+            "statement_cache_size": _prepared_statement_cache_size()
+        }
+        if timeout_ms > 0:
+            connect_args["server_settings"] = {"statement_timeout": str(timeout_ms)}
+        return connect_args
+
+    # psycopg prepares a statement server-side once it ran `prepare_threshold`
+    # times on a connection; None turns that off (needed behind PgBouncer in
+    # transaction mode, which does not keep prepared statements across clients)
+    connect_args = {
+        "prepare_threshold": configuration_variables.db_prepare_threshold
+        if configuration_variables.db_prepared_statements
+        else None
+    }
+    if timeout_ms > 0:
+        # Server-side guard so a runaway query releases its connection back to the pool
+        connect_args["options"] = f"-c statement_timeout={timeout_ms}"
+    return connect_args
+
+
+def _create_engine(url: str, driver: Optional[str] = None):
+    driver = driver or configuration_variables.db_driver
+    async_engine = create_async_engine(
+        _async_url(url, driver),
+        echo=configuration_variables.log_sql_queries,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=configuration_variables.db_pool_size,
+        max_overflow=configuration_variables.db_max_overflow,
+        pool_timeout=configuration_variables.db_pool_timeout_seconds,
+        pool_recycle=configuration_variables.db_pool_recycle_seconds,
+        pool_pre_ping=configuration_variables.db_pool_pre_ping,
+        connect_args=_connect_args(driver),
+    )
+    if driver == "psycopg" and configuration_variables.db_prepared_statements:
+        cache_size = configuration_variables.db_prepared_statement_cache_size
+
+        @event.listens_for(async_engine.sync_engine, "connect")
+        def set_prepared_max(dbapi_connection, connection_record):
+            dbapi_connection.driver_connection.prepared_max = cache_size
+
+    if (
+        configuration_variables.query_stats_enabled
+        or configuration_variables.slow_query_threshold_ms > 0
+    ):
+        install_query_stats(async_engine.sync_engine)
+    return async_engine
+
+
+engine = _create_engine(configuration_variables.database_url)
+
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+# Optional streaming replica for read-only handlers; falls back to the primary
+replica_engine = (
+    _create_engine(configuration_variables.replica_database_url)
+    if configuration_variables.replica_database_url
+    else None
 )
 
-engine = create_async_engine(
-    data_base_url, echo=configuration_variables.log_sql_queries
+replica_async_session = (
+    async_sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+    if replica_engine is not None
+    else None
 )
 
-async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+install_statement_timeouts()
+
+# Callers that wrote recently keep reading from the primary until the replica
+# catches up. The write time travels in a cookie rather than in worker memory,
+# so whichever worker serves the next read sees it
+LAST_WRITE_COOKIE = "last_write_at"
+
+
+def mark_recent_writer(response: Response) -> None:
+    window = configuration_variables.read_your_writes_seconds
+    response.set_cookie(
+        LAST_WRITE_COOKIE,
+        f"{time():.3f}",
+        max_age=max(1, ceil(window)),
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def should_read_from_primary(request: Request) -> bool:
+    try:
+        written_at = float(request.cookies.get(LAST_WRITE_COOKIE, ""))
+    except ValueError:
+        return False
+    # A cookie from the future (clock skew, tampering) only costs primary reads
+    return time() - written_at < configuration_variables.read_your_writes_seconds
+
+
+SessionFactory = Callable[[], AsyncSession]
+
+
+class LazySession:
+    """
+    Stands in for an AsyncSession that is only created on first use, so work
+    rejected before it reaches the database never opens one. Its owner closes
+    it as soon as the database work is done, which hands the connection back
+    to the pool instead of holding it while the response is serialized.
+    """
+
+    def __init__(self, factory: SessionFactory):
+        self._factory = factory
+        self._session: Optional[AsyncSession] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._session is None:
+            self._session = self._factory()
+        return getattr(self._session, name)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+
+def releases_session(execute: Callable) -> Callable:
+    """Wrap a handler's `execute` so its LazySession is closed once it returns or raises."""
+
+    @wraps(execute)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await execute(self, *args, **kwargs)
+        finally:
+            await self.session.close()
+
+    return wrapper
+
+
+def get_session_factory() -> SessionFactory:
+    return async_session
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session() as session:
-        yield session
+def get_read_session_factory(request: Request) -> SessionFactory:
+    if replica_async_session is not None and not should_read_from_primary(request):
+        return replica_async_session
+    return async_session
 
 
-AsyncSQLSession = Annotated[AsyncSession, Depends(get_session)]
+AsyncSessionFactory = Annotated[SessionFactory, Depends(get_session_factory)]
+AsyncReadSessionFactory = Annotated[SessionFactory, Depends(get_read_session_factory)]
@@ -0,0 +1,50 @@
+from hashlib import sha256
+from typing import Any
+
+from fastapi import Request, Response
+
+
+def entity_tag(*parts: Any) -> str:
+    """
+    Weak ETag over whatever determines the response body. Weak, because the
+    same representation may be sent gzipped or not.
+    """
+    digest = sha256("\x1f".join(str(part) for part in parts).encode("utf-8"))
+    return f'W/"{digest.hexdigest()[:32]}"'
+
+
+def cache_control(private: bool, max_age: int = 0) -> str:
+    """
+    Responses that depend on the caller stay out of shared caches; everything
+    else may be reused for `max_age` seconds and then revalidated.
+    """
+    if private or max_age <= 0:
+        return f"{'private' if private else 'public'}, no-cache"
+    return f"public, max-age={max_age}"
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match uses weak comparison: the W/ prefix is ignored."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def set_cache_headers(response: Response, etag: str, control: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = control
+    # The body echoes the caller (requested_by) whenever a token is sent
+    response.headers["Vary"] = "Authorization"
+
+
+def not_modified(etag: str, control: str) -> Response:
+    response = Response(status_code=304)
+    set_cache_headers(response, etag, control)
+    return response
@@ -2,8 +2,11 @@ from uuid import uuid4
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError
 from src.boostrap import app
 from src.logger import logger
+from src.persistence.errors import is_query_canceled
+from src.persistence.pagination import InvalidCursorError
 from fastapi.exception_handlers import http_exception_handler
 
 @app.exception_handler(ValidationError)
@@ -15,6 +18,24 @@ async def unicorn_exception_handler(request: Request, exc: ValidationError):
     )
 
 
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_exception_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(DBAPIError)
+async def database_exception_handler(request: Request, exc: DBAPIError):
+    if is_query_canceled(exc):
+        logger.warning(
+            f"Statement timeout in {request.method} {request.url.path}: {exc.orig}"
+        )
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "The request took longer than its time budget"},
+        )
+    return await json_exception_handler(request, exc)
+
+
 @app.exception_handler(Exception)
 async def json_exception_handler(request: Request, exc: Exception):
     if isinstance(exc, HTTPException):
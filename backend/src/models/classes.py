@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from .base.base_int_model import BaseIntModel
@@ -13,6 +14,13 @@ if TYPE_CHECKING:
 
 
 class Classes(BaseIntModel, table=True):
+    __table_args__ = (
+        Index("ix_classes_classroom_id", "classroom_id"),
+        Index("ix_classes_subject_id", "subject_id"),
+        Index("ix_classes_teacher_id", "teacher_id"),
+        Index("ix_classes_classroom_subject_id", "classroom_subject_id"),
+    )
+
     classroom_id: UUID = Field(foreign_key="classroom.id")
     subject_id: int = Field(foreign_key="subject.id")
     teacher_id: UUID = Field(foreign_key="teacher.id")
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship
 
 from .base.base_int_model import BaseIntModel
@@ -12,6 +13,20 @@ if TYPE_CHECKING:
     from .classes import Classes
         
 class ClassroomSubject(BaseIntModel, table=True):
+    __table_args__ = (
+        Index("ix_classroom_subject_classroom_id_subject_id", "classroom_id", "subject_id"),
+        Index("ix_classroom_subject_subject_id", "subject_id"),
+        Index("ix_classroom_subject_teacher_id", "teacher_id"),
+        Index("ix_classroom_subject_substitute_teacher_id", "substitute_teacher_id"),
+        Index(
+            "uq_classroom_subject_active_classroom_id_subject_id",
+            "classroom_id",
+            "subject_id",
+            unique=True,
+            postgresql_where=text("is_active = true"),
+        ),
+    )
+
     classroom_id: UUID = Field(foreign_key="classroom.id")
     subject_id: int = Field(foreign_key="subject.id")
     teacher_id: Optional[UUID] = Field(default=None, foreign_key="teacher.id")
@@ -1,5 +1,7 @@
+from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship
 
 from .base.base_int_model import BaseIntModel
@@ -10,12 +12,39 @@ if TYPE_CHECKING:
     from .qualifications import Qualification
     
 class ClassroomSubjectStudent(BaseIntModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_classroom_subject_student_classroom_subject_id_student_id",
+            "classroom_subject_id",
+            "student_id",
+        ),
+        Index("ix_classroom_subject_student_student_id", "student_id"),
+        Index(
+            "ix_classroom_subject_student_active_student_id",
+            "student_id",
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "uq_classroom_subject_student_active_enrollment",
+            "classroom_subject_id",
+            "student_id",
+            unique=True,
+            postgresql_where=text("is_active = true"),
+        ),
+    )
+
     classroom_subject_id: int = Field(foreign_key="classroom_subject.id")
     student_id: UUID = Field(foreign_key="student.id")
     qualification: Optional[str] = None
     status: Optional[str] = None
     description: Optional[str] = None
     is_active: bool = Field(default=True)
+    # Running summary of the qualification history, kept in step by the
+    # qualification handlers; `src.persistence.grade_summaries` rebuilds it
+    record_count: int = Field(default=0, nullable=False)
+    score_sum: int = Field(default=0, nullable=False)
+    score_count: int = Field(default=0, nullable=False)
+    grades_updated_at: Optional[datetime] = None
 
     classroom_subject: "ClassroomSubject" = Relationship(back_populates="students")
     student: "Student" = Relationship(back_populates="classroom_subject_students")
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from .base.base_uuid_model import BaseUUIDModel
@@ -11,6 +12,10 @@ if TYPE_CHECKING:
 
 
 class Classroom(BaseUUIDModel, table=True):
+    __table_args__ = (
+        Index("ix_classroom_tutor_id", "tutor_id"),
+    )
+
     description: str
     level: str
     degree: str
@@ -1,5 +1,6 @@
 from enum import Enum
 from typing import Optional, TYPE_CHECKING
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from .base.base_uuid_model import BaseUUIDModel
@@ -20,6 +21,10 @@ class FileType(str, Enum):
 
 
 class Files(BaseUUIDModel, table=True):
+    __table_args__ = (
+        Index("ix_files_class_id", "class_id"),
+    )
+
     name: str
     description: Optional[str] = None
     size: Optional[int] = None
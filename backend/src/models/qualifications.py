@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from .base.base_int_model import BaseIntModel
@@ -8,8 +9,55 @@ if TYPE_CHECKING:
     from .classroom_subject_student import ClassroomSubjectStudent
     from .teachers import Teacher
 
+# Letter grades and the score each one counts as when averaging
+GRADE_TO_SCORE = {
+    "AD": 20,
+    "A": 17,
+    "B": 14,
+    "C": 10,
+    "D": 5,
+}
+GRADE_ORDER = ["AD", "A", "B", "C", "D"]
+
+
+def normalize_grade(raw: Optional[str]) -> Optional[str]:
+    if raw is None:
+        return None
+    value = raw.strip().upper()
+    return value if value in GRADE_TO_SCORE else None
+
+
+def grade_to_score(letter: Optional[str]) -> Optional[float]:
+    if not letter:
+        return None
+    return GRADE_TO_SCORE.get(letter.strip().upper())
+
+
+def score_to_grade(score: Optional[float]) -> Optional[str]:
+    """Closest letter grade, splitting at the midpoint between adjacent scores."""
+    if score is None:
+        return None
+    for index, grade in enumerate(GRADE_ORDER):
+        value = GRADE_TO_SCORE[grade]
+        if index == len(GRADE_ORDER) - 1:
+            return grade
+        next_value = GRADE_TO_SCORE[GRADE_ORDER[index + 1]]
+        midpoint = (value + next_value) / 2
+        if score >= midpoint:
+            return grade
+    return GRADE_ORDER[-1]
+
 
 class Qualification(BaseIntModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_qualification_classroom_subject_student_id_created_at",
+            "classroom_subject_student_id",
+            "created_at",
+        ),
+        Index("ix_qualification_teacher_id", "teacher_id"),
+    )
+
     classroom_subject_student_id: Optional[int] = Field(
         default=None, foreign_key="classroom_subject_student.id"
     )
@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from .base.base_model import BaseModel
@@ -8,6 +9,10 @@ if TYPE_CHECKING:
     from .permission import Permission
 
 class RolePermissionRelation(BaseModel, table=True):
+    __table_args__ = (
+        Index("ix_role_permission_relation_permission_id", "permission_id"),
+    )
+
     role_id: int = Field(foreign_key="role.id", primary_key=True)
     permission_id: int = Field(foreign_key="permission.id", primary_key=True)
     relation_type: str
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from .base.base_uuid_model import BaseUUIDModel
@@ -9,6 +10,10 @@ if TYPE_CHECKING:
     from .classroom_subject_student import ClassroomSubjectStudent
 
 class Student(BaseUUIDModel, table=True):
+    __table_args__ = (
+        Index("ix_student_user_id", "user_id"),
+    )
+
     code: str
     names: str
     father_last_name: str
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from .base.base_uuid_model import BaseUUIDModel
@@ -14,6 +15,10 @@ if TYPE_CHECKING:
 
 
 class Teacher(BaseUUIDModel, table=True):
+    __table_args__ = (
+        Index("ix_teacher_user_id", "user_id"),
+    )
+
     names: str
     father_last_name: str
     mother_last_name: str
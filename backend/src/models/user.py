@@ -18,6 +18,7 @@ class User(BaseUUIDModel, table=True):
     password: str = Field(nullable=False)
     token: str = Field(nullable=False)
     refresh_token: str = Field(nullable=False)
+    token_version: int = Field(default=0, nullable=False)
 
     roles: List["UserRoleRelation"] = Relationship(back_populates="user")
     teacher: Optional["Teacher"] = Relationship(
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from .base.base_model import BaseModel
@@ -9,6 +10,10 @@ if TYPE_CHECKING:
     from .role import Role
 
 class UserRoleRelation(BaseModel, table=True):
+    __table_args__ = (
+        Index("ix_user_role_relation_role_id", "role_id"),
+    )
+
     user_id: UUID = Field(foreign_key="user.id", primary_key=True)
     role_id: int = Field(foreign_key="role.id", primary_key=True)
     relation_type: str
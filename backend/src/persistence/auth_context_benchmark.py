@@ -0,0 +1,122 @@
+"""
+Compares the two ways of resolving a user's authorization context: the
+joinedload chain (`get_with_roles_permissions_by_id`) that get_current_user
+used before, and the aggregated row of `get_auth_context_by_id`. A user with
+`--roles` roles sharing `--permissions` permissions is seeded in a transaction
+that is rolled back, so it is safe against a development database:
+
+    uv run python -m src.persistence.auth_context_benchmark --roles 5 --permissions 100
+
+Reports the rows the database sent per lookup and the median and p95 latency.
+"""
+import argparse
+import asyncio
+from statistics import median, quantiles
+from time import perf_counter
+from typing import List
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import async_session, engine
+from ..models.permission import Permission
+from ..models.role import Role
+from ..models.role_permission_relation import RolePermissionRelation
+from ..models.user import User
+from ..models.user_role_relation import UserRoleRelation
+from .repositories.user_repository import UserRepository
+
+
+async def _seed(session: AsyncSession, role_count: int, permission_count: int) -> User:
+    suffix = uuid4().hex[:8]
+    user = User(
+        name="Benchmark",
+        last_name="User",
+        phone="000",
+        address="-",
+        email=f"auth-benchmark-{suffix}@example.com",
+        password="-",
+        token="-",
+        refresh_token="-",
+    )
+    roles = [
+        Role(name=f"Role {index}", code=f"bench_{suffix}_role_{index}", description="-")
+        for index in range(role_count)
+    ]
+    permissions = [
+        Permission(
+            name=f"Permission {index}",
+            code=f"bench_{suffix}_perm_{index}",
+            description="-",
+        )
+        for index in range(permission_count)
+    ]
+    session.add(user)
+    session.add_all(roles + permissions)
+    await session.flush()
+    # Every role grants every permission: the worst case for the join fan-out
+    session.add_all(
+        UserRoleRelation(user_id=user.id, role_id=role.id, relation_type="benchmark")
+        for role in roles
+    )
+    session.add_all(
+        RolePermissionRelation(
+            role_id=role.id, permission_id=permission.id, relation_type="benchmark"
+        )
+        for role in roles
+        for permission in permissions
+    )
+    await session.flush()
+    return user
+
+
+async def _time(session: AsyncSession, lookup, iterations: int, row_counts: List[int]):
+    timings = []
+    for _ in range(iterations):
+        row_counts.clear()
+        started_at = perf_counter()
+        await lookup()
+        timings.append((perf_counter() - started_at) * 1000)
+        # Hydrated entities would otherwise be reused by the next iteration
+        session.expunge_all()
+    return timings, sum(row_counts)
+
+
+async def main(role_count: int, permission_count: int, iterations: int) -> None:
+    row_counts: List[int] = []
+
+    def count_rows(conn, cursor, statement, parameters, context, executemany):
+        if cursor.description is not None:
+            row_counts.append(cursor.rowcount)
+
+    event.listen(engine.sync_engine, "after_cursor_execute", count_rows)
+    try:
+        async with async_session() as session:
+            user = await _seed(session, role_count, permission_count)
+            user_id = user.id
+            repository = UserRepository(session)
+            lookups = {
+                "joinedload": lambda: repository.get_with_roles_permissions_by_id(user_id),
+                "aggregated": lambda: repository.get_auth_context_by_id(user_id),
+            }
+            for name, lookup in lookups.items():
+                await _time(session, lookup, 5, row_counts)
+                timings, rows = await _time(session, lookup, iterations, row_counts)
+                print(
+                    f"{name:>10}: {rows} rows/lookup | p50 {median(timings):7.2f} ms | "
+                    f"p95 {quantiles(timings, n=20)[-1]:7.2f} ms"
+                )
+            await session.rollback()
+    finally:
+        event.remove(engine.sync_engine, "after_cursor_execute", count_rows)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--roles", type=int, default=5)
+    parser.add_argument("--permissions", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.roles, args.permissions, args.iterations))
@@ -0,0 +1,99 @@
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Postgres caps bind parameters per statement at 65535
+MAX_BIND_PARAMETERS = 65535
+
+
+def to_rows(entity_class: Type[Any], data: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Column values of each entity; ids left to the database are dropped."""
+    columns = [column.name for column in entity_class.__table__.columns]
+    rows = []
+    for item in data:
+        row = {column: getattr(item, column) for column in columns}
+        if row.get("id") is None:
+            row.pop("id", None)
+        rows.append(row)
+    return rows
+
+
+async def insert_rows(
+    session: AsyncSession,
+    entity_class: Type[Any],
+    rows: List[Dict[str, Any]],
+    chunk_size: int,
+    conflict_columns: Optional[Sequence[str]] = None,
+    conflict_where: Optional[Any] = None,
+) -> List[Any]:
+    """
+    Multi-row INSERT ... RETURNING per chunk. With `conflict_columns`, rows that
+    hit that unique index are skipped and missing from the result.
+    """
+    if not rows:
+        return []
+    chunk_size = max(1, min(chunk_size, MAX_BIND_PARAMETERS // len(rows[0])))
+
+    statement = insert(entity_class)
+    if conflict_columns:
+        statement = statement.on_conflict_do_nothing(
+            index_elements=list(conflict_columns), index_where=conflict_where
+        )
+    statement = statement.returning(entity_class).execution_options(
+        insertmanyvalues_page_size=chunk_size
+    )
+
+    created: List[Any] = []
+    for start in range(0, len(rows), chunk_size):
+        # One multi-row VALUES statement per chunk (SQLAlchemy "insertmanyvalues")
+        result = await session.execute(statement, rows[start : start + chunk_size])
+        created.extend(result.scalars().all())
+    return created
+
+
+async def copy_rows(
+    session: AsyncSession, entity_class: Type[Any], rows: List[Dict[str, Any]]
+) -> None:
+    """
+    Stream rows with COPY ... FROM STDIN on the session's connection, inside
+    its transaction, through psycopg's or asyncpg's COPY API. Serial ids are
+    reserved from the sequence up front and written into `rows`, since COPY
+    cannot return them.
+    """
+    if not rows:
+        return
+    table = entity_class.__table__
+
+    missing_ids = [row for row in rows if "id" not in row]
+    if missing_ids:
+        result = await session.execute(
+            text(
+                "SELECT nextval(pg_get_serial_sequence(:table, 'id')) "
+                "FROM generate_series(1, :count)"
+            ),
+            {"table": table.name, "count": len(missing_ids)},
+        )
+        for row, (reserved_id,) in zip(missing_ids, result.all()):
+            row["id"] = reserved_id
+
+    columns = list(rows[0].keys())
+    column_list = ", ".join(f'"{column}"' for column in columns)
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if connection.dialect.driver == "asyncpg":
+        await driver_connection.copy_records_to_table(
+            table.name,
+            records=[tuple(row[column] for column in columns) for row in rows],
+            columns=columns,
+        )
+        return
+    async with driver_connection.cursor() as cursor:
+        async with cursor.copy(
+            f'COPY "{table.name}" ({column_list}) FROM STDIN'
+        ) as copy:
+            for row in rows:
+                await copy.write_row([row[column] for column in columns])
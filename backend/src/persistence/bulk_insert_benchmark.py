@@ -0,0 +1,71 @@
+"""
+Times the two bulk insert strategies on ClassroomSubjectStudent rows. Every
+run is rolled back, so it is safe against a development database that has at
+least one classroom subject and one student:
+
+    uv run python -m src.persistence.bulk_insert_benchmark --rows 100000
+"""
+import argparse
+import asyncio
+from time import perf_counter
+
+from sqlmodel import select
+
+from ..config import configuration_variables
+from ..database import async_session, engine
+from ..models.classroom_subject import ClassroomSubject
+from ..models.classroom_subject_student import ClassroomSubjectStudent
+from ..models.students import Student
+from .bulk import copy_rows, insert_rows, to_rows
+
+
+async def _run(strategy: str, row_count: int, chunk_size: int) -> float:
+    async with async_session() as session:
+        classroom_subject_id = (
+            await session.execute(select(ClassroomSubject.id).limit(1))
+        ).scalar_one()
+        student_id = (await session.execute(select(Student.id).limit(1))).scalar_one()
+        # Inactive rows stay clear of the unique index on active enrollments
+        rows = to_rows(
+            ClassroomSubjectStudent,
+            [
+                ClassroomSubjectStudent(
+                    classroom_subject_id=classroom_subject_id,
+                    student_id=student_id,
+                    status="benchmark",
+                    is_active=False,
+                )
+                for _ in range(row_count)
+            ],
+        )
+
+        started_at = perf_counter()
+        if strategy == "copy":
+            await copy_rows(session, ClassroomSubjectStudent, rows)
+        else:
+            await insert_rows(session, ClassroomSubjectStudent, rows, chunk_size)
+        elapsed = perf_counter() - started_at
+        await session.rollback()
+        return elapsed
+
+
+async def main(row_count: int, chunk_size: int) -> None:
+    try:
+        for strategy in ("insert", "copy"):
+            elapsed = await _run(strategy, row_count, chunk_size)
+            print(
+                f"{strategy:>6}: {row_count} rows in {elapsed:.2f}s "
+                f"({row_count / elapsed:,.0f} rows/s)"
+            )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument(
+        "--chunk-size", type=int, default=configuration_variables.bulk_insert_chunk_size
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.chunk_size))
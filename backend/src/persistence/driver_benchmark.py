@@ -0,0 +1,130 @@
+"""
+Compares the async Postgres drivers on the repository queries behind our
+hottest endpoints, against a local database with the demo data loaded:
+
+    uv run --extra asyncpg python -m src.persistence.driver_benchmark --iterations 200
+
+Each driver gets its own engine, warmed up first so that connection setup
+and statement preparation are excluded. Then every scenario runs
+`--iterations` times and the median and p95 latencies are reported. The
+scenarios are the auth context lookup, the teacher classroom roster and a
+student's subject qualifications. asyncpg is an optional extra and is
+skipped when it is not installed.
+"""
+import argparse
+import asyncio
+from statistics import median, quantiles
+from time import perf_counter
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import select
+
+from ..config import configuration_variables
+from ..database import ASYNCPG_AVAILABLE, DRIVERS, _create_engine
+from ..models.classroom_subject import ClassroomSubject
+from ..models.classroom_subject_student import ClassroomSubjectStudent
+from ..models.teachers import Teacher
+from ..use_cases.students.get_subject_qualifications.get_student_subject_qualifications_handler import (
+    GetStudentSubjectQualificationsHandler,
+)
+from ..use_cases.students.get_subject_qualifications.get_student_subject_qualifications_request import (
+    GetStudentSubjectQualificationsRequest,
+)
+from ..use_cases.teachers.get_classroom_students.get_teacher_classroom_students_handler import (
+    GetTeacherClassroomStudentsHandler,
+)
+from ..use_cases.teachers.get_classroom_students.get_teacher_classroom_students_request import (
+    GetTeacherClassroomStudentsRequest,
+)
+from .repositories.user_repository import UserRepository
+
+Scenario = Callable[[async_sessionmaker], Awaitable[object]]
+
+
+async def _scenarios(session: AsyncSession) -> Dict[str, Scenario]:
+    """Pick real ids from the database so every driver runs identical queries."""
+    teacher_id, user_id, classroom_id = (
+        await session.execute(
+            select(Teacher.id, Teacher.user_id, ClassroomSubject.classroom_id)
+            .join(ClassroomSubject, ClassroomSubject.teacher_id == Teacher.id)
+            .limit(1)
+        )
+    ).one()
+    student_id = (
+        await session.execute(select(ClassroomSubjectStudent.student_id).limit(1))
+    ).scalar_one()
+
+    roster_request = GetTeacherClassroomStudentsRequest(
+        teacher_id=str(teacher_id),
+        classroom_id=str(classroom_id),
+        requesting_user_id=str(user_id),
+    )
+    qualifications_request = GetStudentSubjectQualificationsRequest(
+        student_id=student_id
+    )
+
+    async def auth_lookup(session_factory: async_sessionmaker) -> object:
+        async with session_factory() as session:
+            return await UserRepository(session).get_auth_context_by_id(user_id)
+
+    # Handlers open (and close) their session lazily, as they do per request
+    return {
+        "auth lookup": auth_lookup,
+        "teacher classroom students": lambda factory: GetTeacherClassroomStudentsHandler(
+            factory
+        ).execute(roster_request),
+        "student qualifications": lambda factory: GetStudentSubjectQualificationsHandler(
+            factory
+        ).execute(qualifications_request),
+    }
+
+
+async def _time(
+    session_factory: async_sessionmaker, scenario: Scenario, iterations: int
+) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        # A fresh session per call, like a request, so nothing is served from the identity map
+        started_at = perf_counter()
+        await scenario(session_factory)
+        timings.append((perf_counter() - started_at) * 1000)
+    return timings
+
+
+async def _run_driver(
+    driver: str, iterations: int, warmup: int
+) -> Dict[str, Tuple[float, float]]:
+    engine = _create_engine(configuration_variables.database_url, driver)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    try:
+        async with session_factory() as session:
+            scenarios = await _scenarios(session)
+        results = {}
+        for name, scenario in scenarios.items():
+            await _time(session_factory, scenario, warmup)
+            timings = await _time(session_factory, scenario, iterations)
+            results[name] = (median(timings), quantiles(timings, n=20)[-1])
+        return results
+    finally:
+        await engine.dispose()
+
+
+async def main(iterations: int, warmup: int) -> None:
+    for driver in DRIVERS:
+        if driver == "asyncpg" and not ASYNCPG_AVAILABLE:
+            print("asyncpg: skipped, package not installed (uv sync --extra asyncpg)")
+            continue
+        results = await _run_driver(driver, iterations, warmup)
+        for name, (p50, p95) in results.items():
+            print(f"{driver:>8} | {name:<28} | p50 {p50:7.2f} ms | p95 {p95:7.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.warmup))
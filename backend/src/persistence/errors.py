@@ -0,0 +1,42 @@
+from typing import Optional
+
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+FOREIGN_KEY_VIOLATION = "23503"
+UNIQUE_VIOLATION = "23505"
+QUERY_CANCELED = "57014"
+
+
+def _sqlstate(error: DBAPIError) -> Optional[str]:
+    return getattr(error.orig, "sqlstate", None)
+
+
+def _diagnostics(error: IntegrityError) -> object:
+    # psycopg exposes the server's error fields on `diag`; with asyncpg they are
+    # attributes of the driver exception SQLAlchemy's adapter wraps as `orig`
+    return getattr(error.orig, "diag", None) or getattr(error.orig, "orig", None)
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    return _sqlstate(error) == UNIQUE_VIOLATION
+
+
+def is_query_canceled(error: DBAPIError) -> bool:
+    """True when Postgres cancelled the statement, e.g. on its statement_timeout."""
+    return _sqlstate(error) == QUERY_CANCELED
+
+
+def foreign_key_violation_column(error: IntegrityError) -> Optional[str]:
+    """
+    Column of the foreign key that `error` violated, or None for any other
+    integrity error. Relies on Postgres' default `{table}_{column}_fkey` names.
+    """
+    if _sqlstate(error) != FOREIGN_KEY_VIOLATION:
+        return None
+    diag = _diagnostics(error)
+    constraint = getattr(diag, "constraint_name", None) or ""
+    table = getattr(diag, "table_name", None) or ""
+    prefix, suffix = f"{table}_", "_fkey"
+    if not (constraint.startswith(prefix) and constraint.endswith(suffix)):
+        return None
+    return constraint[len(prefix) : -len(suffix)]
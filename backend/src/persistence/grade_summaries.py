@@ -0,0 +1,52 @@
+"""
+Verifies, and optionally rebuilds, the grade summary columns of
+classroom_subject_student (record_count, score_sum, score_count) against the
+qualification history they summarize:
+
+    uv run python -m src.persistence.grade_summaries           # report drift
+    uv run python -m src.persistence.grade_summaries --rebuild # and fix it
+
+Exits with 1 when drift is found and not rebuilt.
+"""
+import argparse
+import asyncio
+import sys
+
+from ..database import async_session, engine
+from .unit_of_work import UnitOfWork
+
+
+async def main(rebuild: bool) -> int:
+    try:
+        async with async_session() as session:
+            unit_of_work = UnitOfWork(session)
+            repository = unit_of_work.classroom_subject_student_repository
+            drift = await repository.find_grade_summary_drift()
+            for row in drift:
+                print(
+                    f"  - enrollment {row.id}: "
+                    f"records {row.record_count} != {row.expected_record_count}, "
+                    f"score sum {row.score_sum} != {row.expected_score_sum}, "
+                    f"scored {row.score_count} != {row.expected_score_count}"
+                )
+            if not drift:
+                print("All enrollment grade summaries match their history.")
+                return 0
+            if not rebuild:
+                print(f"{len(drift)} enrollment grade summaries have drifted.")
+                return 1
+            fixed = await repository.rebuild_grade_summaries()
+            await unit_of_work.commit()
+            print(f"Rebuilt {fixed} enrollment grade summaries.")
+            return 0
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rebuild", action="store_true", help="recompute drifted summaries"
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.rebuild)))
@@ -0,0 +1,68 @@
+"""
+Checks that every foreign key in the SQLModel metadata is backed by an index.
+
+Repositories filter and selectin-load by foreign keys, so an unindexed one
+turns those lookups into sequential scans. Run it with:
+
+    uv run python -m src.persistence.index_coverage
+"""
+import sys
+from typing import Iterable, List, Sequence, Set, Tuple
+
+from sqlalchemy import MetaData, Table, UniqueConstraint
+from sqlmodel import SQLModel
+
+from .. import models  # noqa: F401  (registers every table on the metadata)
+
+# "table.column" foreign keys that are intentionally left without an index
+IGNORED_FOREIGN_KEYS: Set[str] = set()
+
+
+def _leading_column_sets(table: Table) -> List[Tuple[str, ...]]:
+    """Column tuples of the table's PK, unique constraints and full (non-partial) indexes."""
+    column_sets = [tuple(column.name for column in table.primary_key.columns)]
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            column_sets.append(tuple(column.name for column in constraint.columns))
+    for index in table.indexes:
+        if index.dialect_options["postgresql"].get("where") is not None:
+            continue
+        column_sets.append(tuple(column.name for column in index.columns))
+    return column_sets
+
+
+def _is_covered(fk_columns: Sequence[str], column_sets: Iterable[Tuple[str, ...]]) -> bool:
+    width = len(fk_columns)
+    return any(
+        len(columns) >= width and set(columns[:width]) == set(fk_columns)
+        for columns in column_sets
+    )
+
+
+def find_uncovered_foreign_keys(metadata: MetaData) -> List[str]:
+    missing = []
+    for table in metadata.sorted_tables:
+        column_sets = _leading_column_sets(table)
+        for constraint in table.foreign_key_constraints:
+            fk_columns = [column.name for column in constraint.columns]
+            label = f"{table.name}.{','.join(fk_columns)}"
+            if label in IGNORED_FOREIGN_KEYS:
+                continue
+            if not _is_covered(fk_columns, column_sets):
+                missing.append(f"{label} -> {constraint.referred_table.name}")
+    return missing
+
+
+def main() -> int:
+    missing = find_uncovered_foreign_keys(SQLModel.metadata)
+    if missing:
+        print("Foreign keys without a supporting index:")
+        for entry in missing:
+            print(f"  - {entry}")
+        return 1
+    print("All foreign keys are covered by an index.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Checks how many SELECTs each ClassroomSubject loader profile emits, on an
+in-memory SQLite database so it runs without Postgres:
+
+    uv run python -m src.persistence.loader_profiles
+
+Every selectinload adds exactly one statement, so a count that grows means
+a profile started loading more than its callers render. Exits with 1 when a
+profile's count differs from EXPECTED_SELECTS.
+"""
+import sys
+from typing import Dict
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel, select
+
+from .. import models  # noqa: F401  (registers every table on the metadata)
+from ..models.classroom_subject import ClassroomSubject
+from ..models.classroom_subject_student import ClassroomSubjectStudent
+from ..models.qualifications import Qualification
+from ..models.students import Student
+from .repositories.classroom_subject_repository import (
+    ClassroomSubjectLoad,
+    loader_options,
+)
+
+EXPECTED_SELECTS: Dict[ClassroomSubjectLoad, int] = {
+    # classroom subjects + subject, classroom, teacher, substitute teacher
+    ClassroomSubjectLoad.SUMMARY: 5,
+    # + enrollments, students, student users
+    ClassroomSubjectLoad.ROSTER: 8,
+    # + qualifications, qualification teachers
+    ClassroomSubjectLoad.GRADEBOOK: 10,
+}
+
+
+def _seed(session: Session) -> None:
+    # SQLite does not enforce foreign keys, so only the rows whose children
+    # get loaded are needed; the other ends only have to be referenced
+    student = Student(
+        code="S000001",
+        names="Student",
+        father_last_name="Father",
+        mother_last_name="Mother",
+        user_id=uuid4(),
+    )
+    classroom_subject = ClassroomSubject(
+        classroom_id=uuid4(),
+        subject_id=1,
+        teacher_id=uuid4(),
+        substitute_teacher_id=uuid4(),
+    )
+    session.add_all([student, classroom_subject])
+    session.flush()
+    enrollment = ClassroomSubjectStudent(
+        classroom_subject_id=classroom_subject.id, student_id=student.id
+    )
+    session.add(enrollment)
+    session.flush()
+    session.add(
+        Qualification(
+            classroom_subject_student_id=enrollment.id, teacher_id=uuid4(), grade="A"
+        )
+    )
+    session.commit()
+
+
+def count_selects(engine, load: ClassroomSubjectLoad) -> int:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with Session(engine) as session:
+            session.execute(
+                select(ClassroomSubject).options(*loader_options(load))
+            ).scalars().all()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+def main() -> int:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        _seed(session)
+
+    failed = False
+    for load, expected in EXPECTED_SELECTS.items():
+        actual = count_selects(engine, load)
+        status = "ok" if actual == expected else f"expected {expected}"
+        print(f"{load.value:>9}: {actual} SELECTs ({status})")
+        failed = failed or actual != expected
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
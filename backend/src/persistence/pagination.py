@@ -0,0 +1,40 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, List, Optional, TypeVar
+from uuid import UUID
+
+TItem = TypeVar("TItem")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client sends a cursor this API did not issue."""
+
+
+@dataclass
+class Page(Generic[TItem]):
+    items: List[TItem]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(key: Any) -> str:
+    """Opaque, URL-safe cursor holding the sort key of the last row of a page."""
+    value = key.isoformat() if isinstance(key, datetime) else key
+    if isinstance(value, UUID):
+        value = str(value)
+    payload = json.dumps({"k": value}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, python_type: type) -> Any:
+    """Sort key stored by `encode_cursor`, converted back to the column's type."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))["k"]
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        return python_type(value)
+    # AttributeError: a well-formed cursor holding the wrong JSON type, e.g. UUID(123)
+    except (ValueError, TypeError, KeyError, AttributeError) as error:
+        raise InvalidCursorError("Invalid cursor") from error
@@ -0,0 +1,153 @@
+"""
+Times saving a grade through ManageStudentQualificationHandler against the
+write path it replaced, which committed after every repository call and then
+reloaded the enrollment graph. Runs against a local database with the demo
+data loaded:
+
+    uv run python -m src.persistence.qualification_benchmark --iterations 100
+
+Both paths save a new record on the same enrollment, so every call really
+commits. The records are deleted afterwards, and the enrollment's grade, status
+and grade summary are restored.
+"""
+import argparse
+import asyncio
+from statistics import median, quantiles
+from time import perf_counter
+from typing import Dict, List
+from uuid import uuid4
+
+from sqlalchemy import delete
+from sqlmodel import select, update
+
+from ..database import async_session, engine
+from ..models.classroom_subject import ClassroomSubject
+from ..models.classroom_subject_student import ClassroomSubjectStudent
+from ..models.qualifications import Qualification
+from ..services.auth import get_auth_service
+from ..use_cases.teachers.manage_student_qualification.manage_student_qualification_handler import (
+    ManageStudentQualificationHandler,
+)
+from ..use_cases.teachers.manage_student_qualification.manage_student_qualification_request import (
+    ManageStudentQualificationRequest,
+)
+from .unit_of_work import UnitOfWork
+
+
+async def _commit_per_write(request: ManageStudentQualificationRequest) -> None:
+    """The handler's round trips before a use case committed once."""
+    async with async_session() as session:
+        unit_of_work = UnitOfWork(session)
+        repository = unit_of_work.classroom_subject_student_repository
+        enrollment = await repository.get_by_id_with_relations(
+            request.classroom_subject_student_id
+        )
+        enrollment.qualification = request.qualification
+        await repository.update(enrollment)
+        await unit_of_work.commit()
+        await session.refresh(enrollment)
+
+        record = Qualification(
+            classroom_subject_student_id=enrollment.id,
+            teacher_id=request.teacher_id,
+            description=request.qualification_record_description,
+            grade=request.qualification,
+        )
+        await unit_of_work.qualification_repository.create(record)
+        await unit_of_work.commit()
+        await session.refresh(record)
+
+        await repository.get_by_id_with_relations(enrollment.id)
+
+
+async def _single_commit(request: ManageStudentQualificationRequest) -> None:
+    await ManageStudentQualificationHandler(async_session, get_auth_service()).execute(
+        request
+    )
+
+
+PATHS = {
+    "commit per write": _commit_per_write,
+    "single commit": _single_commit,
+}
+
+
+async def _time(
+    request: ManageStudentQualificationRequest, iterations: int
+) -> Dict[str, List[float]]:
+    # Interleaved: each call adds a record, so the enrollment graph both paths
+    # load grows at the same pace
+    timings: Dict[str, List[float]] = {name: [] for name in PATHS}
+    for _ in range(iterations):
+        for name, path in PATHS.items():
+            started_at = perf_counter()
+            await path(request)
+            timings[name].append((perf_counter() - started_at) * 1000)
+    return timings
+
+
+async def _restore(enrollment: ClassroomSubjectStudent, description: str) -> None:
+    async with async_session() as session:
+        await session.execute(
+            delete(Qualification).where(
+                Qualification.classroom_subject_student_id == enrollment.id,
+                Qualification.description == description,
+            )
+        )
+        await session.execute(
+            update(ClassroomSubjectStudent)
+            .where(ClassroomSubjectStudent.id == enrollment.id)
+            .values(
+                qualification=enrollment.qualification,
+                status=enrollment.status,
+                record_count=enrollment.record_count,
+                score_sum=enrollment.score_sum,
+                score_count=enrollment.score_count,
+                grades_updated_at=enrollment.grades_updated_at,
+            )
+        )
+        await session.commit()
+
+
+async def main(iterations: int, warmup: int) -> None:
+    try:
+        async with async_session() as session:
+            enrollment, teacher_id = (
+                await session.execute(
+                    select(ClassroomSubjectStudent, ClassroomSubject.teacher_id)
+                    .join(
+                        ClassroomSubject,
+                        ClassroomSubject.id == ClassroomSubjectStudent.classroom_subject_id,
+                    )
+                    .where(ClassroomSubject.teacher_id.is_not(None))
+                    .limit(1)
+                )
+            ).one()
+
+        # Tags this run's records so only they are deleted afterwards
+        description = f"benchmark {uuid4().hex}"
+        request = ManageStudentQualificationRequest(
+            teacher_id=teacher_id,
+            classroom_subject_student_id=enrollment.id,
+            qualification="A",
+            qualification_record_description=description,
+        )
+        try:
+            await _time(request, warmup)
+            for name, timings in (await _time(request, iterations)).items():
+                print(
+                    f"{name:>16}: p50 {median(timings):7.2f} ms | "
+                    f"p95 {quantiles(timings, n=20)[-1]:7.2f} ms"
+                )
+        finally:
+            await _restore(enrollment, description)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.warmup))
@@ -1,7 +1,11 @@
+from ...config import configuration_variables
 from ...database import AsyncSession
-from typing import Generic, List, TypeVar, Type, Union
+from typing import Any, Generic, List, Optional, Sequence, TypeVar, Type, Union
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import select
 from ...models.base.base_model import BaseModel
+from ..bulk import copy_rows, insert_rows, to_rows
+from ..pagination import Page, decode_cursor, encode_cursor
 
 TEntity = TypeVar("TEntity", bound=BaseModel)
 
@@ -19,12 +23,68 @@ class BaseRepository(Generic[TEntity]):
         )
         return list(entities.scalars().all())
 
-    async def create(self, data: TEntity) -> TEntity:
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        options: Sequence[Any] = (),
+        columns: Sequence[Any] = (),
+    ) -> Page[Any]:
+        """
+        Keyset page ordered by id: rows after the cursor's id, plus one extra row
+        to tell whether another page exists. Raises InvalidCursorError.
+
+        With `columns` (which must include the id), plain rows of just those
+        columns are returned instead of tracked entities.
+        """
+        key = self._entity_class.id
+        query = select(*columns) if columns else select(self._entity_class)
+        query = query.order_by(key).limit(limit + 1)
+        if cursor:
+            query = query.where(key > decode_cursor(cursor, key.type.python_type))
+        if options:
+            query = query.options(*options)
+        result = await self._session.execute(query)
+        items = list(result.all() if columns else result.scalars().all())
+
+        next_cursor = encode_cursor(items[limit - 1].id) if len(items) > limit else None
+        return Page(items=items[:limit], next_cursor=next_cursor)
+
+    async def exists(self, entity_id: Union[str, int]) -> bool:
+        result = await self._session.execute(
+            select(self._entity_class.id).where(self._entity_class.id == entity_id)
+        )
+        return result.first() is not None
+
+    async def create(self, data: TEntity, refresh: bool = False) -> TEntity:
         self._session.add(data)
-        await self._session.commit()
-        await self._session.refresh(data)
+        await self._session.flush()
+        if refresh:
+            await self._session.refresh(data)
         return data
 
+    async def create_or_ignore(
+        self,
+        data: TEntity,
+        conflict_columns: Sequence[str],
+        conflict_where: Optional[Any] = None,
+    ) -> Optional[TEntity]:
+        """
+        Single-statement INSERT ... ON CONFLICT DO NOTHING RETURNING. Returns None
+        when a row matching the unique index on `conflict_columns` already exists.
+        Foreign key violations surface as IntegrityError.
+        """
+        statement = (
+            insert(self._entity_class)
+            .values(**data.model_dump(exclude={"id"}))
+            .on_conflict_do_nothing(
+                index_elements=list(conflict_columns), index_where=conflict_where
+            )
+            .returning(self._entity_class)
+        )
+        result = await self._session.execute(statement)
+        return result.scalars().first()
+
     async def get_by_id(self, entity_id: Union[str, int]) -> TEntity:
         entities = await self._session.execute(
             select(self._entity_class).where(self._entity_class.id == entity_id)
@@ -34,16 +94,41 @@ class BaseRepository(Generic[TEntity]):
     async def delete(self, entity_id: Union[str, int]) -> None:
         entity = await self.get_by_id(entity_id)
         await self._session.delete(entity)
-        await self._session.commit()
+        await self._session.flush()
 
-    async def update(self, data: TEntity) -> TEntity:
+    async def update(self, data: TEntity, refresh: bool = False) -> TEntity:
         self._session.add(data)
-        await self._session.commit()
-        await self._session.refresh(data)
+        await self._session.flush()
+        if refresh:
+            await self._session.refresh(data)
         return data
 
-    async def bulk_create(self, data: List[TEntity]) -> List[TEntity]:
-        for item in data:
-            self._session.add(item)
-        await self._session.commit()
-        return data
+    async def bulk_create(
+        self,
+        data: List[TEntity],
+        conflict_columns: Optional[Sequence[str]] = None,
+        conflict_where: Optional[Any] = None,
+    ) -> List[TEntity]:
+        """
+        Insert many rows without the ORM unit of work. Batches of at least
+        BULK_COPY_THRESHOLD rows are streamed with COPY and the given entities are
+        returned with their ids filled in; smaller batches, and any batch with
+        conflict handling, use chunked multi-row INSERT ... RETURNING and return
+        the inserted rows (skipping conflicting ones).
+        """
+        rows = to_rows(self._entity_class, data)
+        copy_threshold = configuration_variables.bulk_copy_threshold
+        if not conflict_columns and 0 < copy_threshold <= len(rows):
+            await copy_rows(self._session, self._entity_class, rows)
+            for item, row in zip(data, rows):
+                item.id = row["id"]
+            return data
+
+        return await insert_rows(
+            self._session,
+            self._entity_class,
+            rows,
+            chunk_size=configuration_variables.bulk_insert_chunk_size,
+            conflict_columns=conflict_columns,
+            conflict_where=conflict_where,
+        )
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy.orm import selectinload
@@ -6,6 +6,7 @@ from sqlmodel import select
 
 from ...models.classrooms import Classroom
 from ...models.teachers import Teacher
+from ..pagination import Page
 from .base_repository import BaseRepository
 
 
@@ -18,6 +19,13 @@ class ClassroomRepository(BaseRepository[Classroom]):
         )
         return list(result.scalars().all())
 
+    async def get_page_with_relations(
+        self, limit: int, cursor: Optional[str] = None
+    ) -> Page[Classroom]:
+        return await self.get_page(
+            limit, cursor, options=[selectinload(Classroom.tutor)]
+        )
+
     async def get_all_with_relations(self) -> List[Classroom]:
         query = select(self._entity_class).options(
             selectinload(Classroom.tutor)
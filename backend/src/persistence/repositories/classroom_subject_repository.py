@@ -1,6 +1,9 @@
-from typing import List
+from enum import Enum
+from typing import Any, Collection, List, Optional
 from uuid import UUID
 
+from sqlalchemy import exists, text
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
@@ -12,31 +15,56 @@ from ...models.classroom_subject_student import ClassroomSubjectStudent
 from ...models.qualifications import Qualification
 from ...models.students import Student
 from ...models.user import User
+from ..pagination import Page
 from .base_repository import BaseRepository
 
 
+class ClassroomSubjectLoad(str, Enum):
+    """
+    Relation graphs a ClassroomSubject query can eager-load, named after what
+    the caller renders. Each profile extends the previous one.
+    """
+
+    # classroom, subject and both teachers
+    SUMMARY = "summary"
+    # plus every enrollment with its student and the student's user
+    ROSTER = "roster"
+    # plus every enrollment's qualification history with its teacher
+    GRADEBOOK = "gradebook"
+
+
+def loader_options(load: ClassroomSubjectLoad) -> List[Any]:
+    options = [
+        selectinload(ClassroomSubject.subject),
+        selectinload(ClassroomSubject.classroom),
+        selectinload(ClassroomSubject.teacher),
+        selectinload(ClassroomSubject.substitute_teacher),
+    ]
+    if load is ClassroomSubjectLoad.SUMMARY:
+        return options
+
+    enrollment_options = [
+        selectinload(ClassroomSubjectStudent.student).selectinload(Student.user)
+    ]
+    if load is ClassroomSubjectLoad.GRADEBOOK:
+        enrollment_options.append(
+            selectinload(ClassroomSubjectStudent.qualifications).selectinload(
+                Qualification.teacher
+            )
+        )
+    options.append(
+        selectinload(ClassroomSubject.students).options(*enrollment_options)
+    )
+    return options
+
+
 class ClassroomSubjectRepository(BaseRepository[ClassroomSubject]):
     _entity_class = ClassroomSubject
 
-    def _default_options(self):
-        return [
-            selectinload(self._entity_class.subject),
-            selectinload(self._entity_class.classroom),
-            selectinload(self._entity_class.teacher).selectinload(Teacher.user),
-            selectinload(self._entity_class.substitute_teacher),
-            selectinload(self._entity_class.students).options(
-                selectinload(ClassroomSubjectStudent.student)
-                .selectinload(Student.user),
-                selectinload(ClassroomSubjectStudent.qualifications).options(
-                    selectinload(Qualification.teacher)
-                ),
-            ),
-        ]
-
     async def get_for_classroom(
         self,
         classroom_id: UUID,
-        with_relations: bool = False,
+        load: Optional[ClassroomSubjectLoad] = None,
         only_active: bool = True,
     ) -> List[ClassroomSubject]:
         query = select(self._entity_class).where(
@@ -44,21 +72,42 @@ class ClassroomSubjectRepository(BaseRepository[ClassroomSubject]):
         )
         if only_active:
             query = query.where(self._entity_class.is_active.is_(True))
-        if with_relations:
-            query = query.options(*self._default_options())
+        if load is not None:
+            query = query.options(*loader_options(load))
         result = await self._session.execute(query)
         return list(result.scalars().all())
 
-    async def get_all_with_relations(self) -> List[ClassroomSubject]:
-        query = select(self._entity_class).options(*self._default_options())
+    async def get_for_classrooms(
+        self,
+        classroom_ids: Collection[UUID],
+        load: Optional[ClassroomSubjectLoad] = None,
+        only_active: bool = True,
+    ) -> List[ClassroomSubject]:
+        """Classroom subjects of several classrooms in one IN query."""
+        if not classroom_ids:
+            return []
+        query = select(self._entity_class).where(
+            self._entity_class.classroom_id.in_(list(classroom_ids))
+        )
+        if only_active:
+            query = query.where(self._entity_class.is_active.is_(True))
+        if load is not None:
+            query = query.options(*loader_options(load))
         result = await self._session.execute(query)
         return list(result.scalars().all())
 
+    async def get_page_with_relations(
+        self, limit: int, cursor: Optional[str] = None
+    ) -> Page[ClassroomSubject]:
+        return await self.get_page(
+            limit, cursor, options=loader_options(ClassroomSubjectLoad.SUMMARY)
+        )
+
     async def get_for_teacher(
         self,
         teacher_id: UUID,
         include_substitute: bool = True,
-        with_relations: bool = False,
+        load: Optional[ClassroomSubjectLoad] = None,
         only_active: bool = True,
     ) -> List[ClassroomSubject]:
         condition = self._entity_class.teacher_id == teacher_id
@@ -69,16 +118,49 @@ class ClassroomSubjectRepository(BaseRepository[ClassroomSubject]):
         query = select(self._entity_class).where(condition)
         if only_active:
             query = query.where(self._entity_class.is_active.is_(True))
-        if with_relations:
-            query = query.options(*self._default_options())
+        if load is not None:
+            query = query.options(*loader_options(load))
         result = await self._session.execute(query)
         return list(result.scalars().all())
 
+    async def get_classroom_access(
+        self, teacher_id: UUID, classroom_id: UUID, only_active: bool = True
+    ) -> Row:
+        """
+        Everything needed to authorize a teacher against a classroom, in one
+        round trip: the teacher's user id (None when the teacher does not exist),
+        whether the classroom exists, its tutor and whether the teacher is
+        assigned to any of its subjects.
+        """
+        assigned = select(self._entity_class.id).where(
+            (self._entity_class.classroom_id == classroom_id)
+            & (
+                (self._entity_class.teacher_id == teacher_id)
+                | (self._entity_class.substitute_teacher_id == teacher_id)
+            )
+        )
+        if only_active:
+            assigned = assigned.where(self._entity_class.is_active.is_(True))
+        query = select(
+            select(Teacher.user_id)
+            .where(Teacher.id == teacher_id)
+            .scalar_subquery()
+            .label("teacher_user_id"),
+            exists().where(Classroom.id == classroom_id).label("classroom_exists"),
+            select(Classroom.tutor_id)
+            .where(Classroom.id == classroom_id)
+            .scalar_subquery()
+            .label("tutor_id"),
+            assigned.exists().label("is_assigned"),
+        )
+        result = await self._session.execute(query)
+        return result.one()
+
     async def get_by_classroom_and_subject(
         self,
         classroom_id: UUID,
         subject_id: int,
-        with_relations: bool = False,
+        load: Optional[ClassroomSubjectLoad] = None,
         only_active: bool = True,
     ) -> ClassroomSubject | None:
         query = select(self._entity_class).where(
@@ -87,8 +169,18 @@ class ClassroomSubjectRepository(BaseRepository[ClassroomSubject]):
         )
         if only_active:
             query = query.where(self._entity_class.is_active.is_(True))
-        if with_relations:
-            query = query.options(*self._default_options())
+        if load is not None:
+            query = query.options(*loader_options(load))
         result = await self._session.execute(query)
         return result.scalars().first()
 
+    async def create_if_not_exists(
+        self, classroom_subject: ClassroomSubject
+    ) -> ClassroomSubject | None:
+        """Insert the relation unless the classroom already has that subject active."""
+        # The predicate matches uq_classroom_subject_active_classroom_id_subject_id
+        return await self.create_or_ignore(
+            classroom_subject,
+            conflict_columns=["classroom_id", "subject_id"],
+            conflict_where=text("is_active = true"),
+        )
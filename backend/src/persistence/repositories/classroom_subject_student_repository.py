@@ -1,16 +1,32 @@
-from typing import List
+from datetime import UTC, datetime
+from typing import Any, Collection, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Float, case, cast, func, or_, text
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import aliased, selectinload
 from sqlmodel import select, update
 
 from ...models.classroom_subject import ClassroomSubject
 from ...models.classroom_subject_student import ClassroomSubjectStudent
-from ...models.qualifications import Qualification
+from ...models.qualifications import GRADE_TO_SCORE, Qualification, grade_to_score
 from ...models.students import Student
+from ...models.subjects import Subject
+from ...models.teachers import Teacher
 from ...models.user import User
 from .base_repository import BaseRepository
 
+# Values Python's float() would also accept as a plain decimal number
+_NUMERIC_PATTERN = r"^\s*[-+]?(\d+\.?\d*|\.\d+)\s*$"
+
+
+def grade_score(column: Any) -> Any:
+    """CASE expression scoring a letter grade column with GRADE_TO_SCORE (NULL otherwise)."""
+    return case(
+        {grade: score for grade, score in GRADE_TO_SCORE.items()},
+        value=func.upper(func.trim(column)),
+    )
+
 
 class ClassroomSubjectStudentRepository(
     BaseRepository[ClassroomSubjectStudent]
@@ -51,6 +67,43 @@ class ClassroomSubjectStudentRepository(
         result = await self._session.execute(query)
         return list(result.scalars().all())
 
+    async def get_student_fingerprint(
+        self, student_id: UUID, only_active: bool = True
+    ) -> str:
+        """
+        Freshness marker of the student subject and grade views, read from the
+        enrollment rows alone: their count and newest id, plus the grade summary
+        columns, which every record write shifts and stamps. Cost is bounded by
+        the student's enrollments, not their qualification history.
+        """
+        query = select(
+            func.count(),
+            func.max(self._entity_class.id),
+            func.sum(self._entity_class.record_count),
+            func.sum(self._entity_class.score_sum),
+            func.max(self._entity_class.grades_updated_at),
+        ).where(self._entity_class.student_id == student_id)
+        if only_active:
+            query = query.where(self._entity_class.is_active.is_(True))
+        result = await self._session.execute(query)
+        return ":".join(str(value) for value in result.one())
+
+    async def count_active_by_classroom_subject(
+        self, classroom_subject_ids: Collection[int]
+    ) -> Dict[int, int]:
+        """Active enrollments per classroom subject, in one grouped query."""
+        if not classroom_subject_ids:
+            return {}
+        result = await self._session.execute(
+            select(self._entity_class.classroom_subject_id, func.count())
+            .where(
+                self._entity_class.classroom_subject_id.in_(list(classroom_subject_ids)),
+                self._entity_class.is_active.is_(True),
+            )
+            .group_by(self._entity_class.classroom_subject_id)
+        )
+        return {classroom_subject_id: count for classroom_subject_id, count in result.all()}
+
     async def get_for_classroom_subject(
         self,
         classroom_subject_id: int,
@@ -73,6 +126,152 @@ class ClassroomSubjectStudentRepository(
         result = await self._session.execute(query)
         return list(result.scalars().all())
 
+    async def get_roster_rows(self, classroom_subject_id: int) -> List[Row]:
+        """
+        Enrollment and student columns of a classroom subject's roster, active and
+        inactive, as untracked rows instead of hydrated entities.
+        """
+        query = (
+            select(
+                self._entity_class.id,
+                self._entity_class.status,
+                self._entity_class.is_active,
+                self._entity_class.qualification,
+                Student.id.label("student_id"),
+                Student.code.label("student_code"),
+                Student.names,
+                Student.father_last_name,
+                Student.mother_last_name,
+                Student.email.label("student_email"),
+            )
+            .join(Student, Student.id == self._entity_class.student_id)
+            .where(self._entity_class.classroom_subject_id == classroom_subject_id)
+            .order_by(self._entity_class.id)
+        )
+        result = await self._session.execute(query)
+        return list(result.all())
+
+    async def get_classroom_gradebook_rows(
+        self, classroom_id: UUID, only_active: bool = True
+    ) -> List[Row]:
+        """
+        One row per enrollment in the classroom's subjects, with the subject,
+        both teachers' names and the grade aggregates computed by Postgres:
+
+        - `record_count` and `average_score` from the enrollment's grade summary
+          columns (falling back to the score of its current grade),
+        - `student_average`, the mean numeric qualification of the student across
+          the returned enrollments.
+        """
+        primary_teacher = aliased(Teacher)
+        substitute_teacher = aliased(Teacher)
+
+        numeric_qualification = case(
+            (
+                self._entity_class.qualification.regexp_match(_NUMERIC_PATTERN),
+                cast(func.trim(self._entity_class.qualification), Float),
+            )
+        )
+        summary_average = cast(self._entity_class.score_sum, Float) / func.nullif(
+            self._entity_class.score_count, 0
+        )
+
+        query = (
+            select(
+                self._entity_class.id,
+                self._entity_class.classroom_subject_id,
+                self._entity_class.qualification,
+                self._entity_class.status,
+                self._entity_class.is_active,
+                ClassroomSubject.subject_id,
+                ClassroomSubject.teacher_id,
+                ClassroomSubject.substitute_teacher_id,
+                Subject.name.label("subject_name"),
+                primary_teacher.names.label("teacher_names"),
+                primary_teacher.father_last_name.label("teacher_father_last_name"),
+                substitute_teacher.names.label("substitute_names"),
+                substitute_teacher.father_last_name.label(
+                    "substitute_father_last_name"
+                ),
+                Student.id.label("student_id"),
+                Student.code.label("student_code"),
+                Student.names,
+                Student.father_last_name,
+                Student.mother_last_name,
+                func.coalesce(Student.email, User.email).label("student_email"),
+                self._entity_class.record_count,
+                func.coalesce(
+                    summary_average,
+                    cast(grade_score(self._entity_class.qualification), Float),
+                ).label("average_score"),
+                func.avg(numeric_qualification)
+                .over(partition_by=Student.id)
+                .label("student_average"),
+            )
+            .join(
+                ClassroomSubject,
+                ClassroomSubject.id == self._entity_class.classroom_subject_id,
+            )
+            .join(Student, Student.id == self._entity_class.student_id)
+            .outerjoin(User, User.id == Student.user_id)
+            .outerjoin(Subject, Subject.id == ClassroomSubject.subject_id)
+            .outerjoin(
+                primary_teacher, primary_teacher.id == ClassroomSubject.teacher_id
+            )
+            .outerjoin(
+                substitute_teacher,
+                substitute_teacher.id == ClassroomSubject.substitute_teacher_id,
+            )
+            .where(ClassroomSubject.classroom_id == classroom_id)
+            .order_by(ClassroomSubject.id, self._entity_class.id)
+        )
+        if only_active:
+            query = query.where(
+                ClassroomSubject.is_active.is_(True),
+                self._entity_class.is_active.is_(True),
+            )
+        result = await self._session.execute(query)
+        return list(result.all())
+
+    async def get_classroom_history_rows(
+        self, classroom_id: UUID, only_active: bool = True
+    ) -> List[Row]:
+        """Qualification records of the classroom's enrollments, oldest first per enrollment."""
+        query = (
+            select(
+                Qualification.id,
+                Qualification.classroom_subject_student_id,
+                Qualification.grade,
+                Qualification.description,
+                Qualification.teacher_id,
+                Qualification.created_at,
+                Teacher.names.label("teacher_names"),
+                Teacher.father_last_name.label("teacher_father_last_name"),
+            )
+            .join(
+                self._entity_class,
+                self._entity_class.id == Qualification.classroom_subject_student_id,
+            )
+            .join(
+                ClassroomSubject,
+                ClassroomSubject.id == self._entity_class.classroom_subject_id,
+            )
+            .outerjoin(Teacher, Teacher.id == Qualification.teacher_id)
+            .where(ClassroomSubject.classroom_id == classroom_id)
+            .order_by(
+                Qualification.classroom_subject_student_id,
+                Qualification.created_at.asc().nulls_first(),
+                Qualification.id,
+            )
+        )
+        if only_active:
+            query = query.where(
+                ClassroomSubject.is_active.is_(True),
+                self._entity_class.is_active.is_(True),
+            )
+        result = await self._session.execute(query)
+        return list(result.all())
+
     async def get_by_unique_relation(
         self,
         classroom_subject_id: int,
@@ -97,6 +296,17 @@ class ClassroomSubjectStudentRepository(
         result = await self._session.execute(query)
         return result.scalars().first()
 
+    async def create_if_not_enrolled(
+        self, enrollment: ClassroomSubjectStudent
+    ) -> ClassroomSubjectStudent | None:
+        """Insert the enrollment unless the student is already actively enrolled."""
+        # The predicate matches uq_classroom_subject_student_active_enrollment
+        return await self.create_or_ignore(
+            enrollment,
+            conflict_columns=["classroom_subject_id", "student_id"],
+            conflict_where=text("is_active = true"),
+        )
+
     async def get_by_id_with_relations(
         self, enrollment_id: int
     ) -> ClassroomSubjectStudent | None:
@@ -113,13 +323,103 @@ class ClassroomSubjectStudentRepository(
         result = await self._session.execute(query)
         return result.scalars().first()
 
-    async def update_final_grade(
-        self, enrollment_id: int, qualification: str | None
+    async def shift_grade_summary(
+        self,
+        enrollment_id: int,
+        record_delta: int = 0,
+        added_grade: Optional[str] = None,
+        removed_grade: Optional[str] = None,
     ) -> None:
+        """
+        Adjust the enrollment's grade summary for one added, removed or regraded
+        record. The counters are incremented in place, so concurrent writers
+        never overwrite each other's changes.
+        """
+        added_score = grade_to_score(added_grade)
+        removed_score = grade_to_score(removed_grade)
+        score_delta = (added_score or 0) - (removed_score or 0)
+        scored_delta = (added_score is not None) - (removed_score is not None)
         await self._session.execute(
             update(self._entity_class)
             .where(self._entity_class.id == enrollment_id)
-            .values(qualification=qualification)
+            .values(
+                record_count=self._entity_class.record_count + record_delta,
+                score_sum=self._entity_class.score_sum + int(score_delta),
+                score_count=self._entity_class.score_count + scored_delta,
+                grades_updated_at=datetime.now(UTC),
+            )
+        )
+
+    def _expected_grade_summaries(self) -> Any:
+        """Grade summary of every enrollment recomputed from its qualification history."""
+        score = grade_score(Qualification.grade)
+        history = (
+            select(
+                Qualification.classroom_subject_student_id.label("enrollment_id"),
+                func.count(Qualification.id).label("record_count"),
+                func.coalesce(func.sum(score), 0).label("score_sum"),
+                func.count(score).label("score_count"),
+                func.max(Qualification.created_at).label("last_recorded_at"),
+            )
+            .group_by(Qualification.classroom_subject_student_id)
+            .subquery("history")
+        )
+        return (
+            select(
+                self._entity_class.id.label("enrollment_id"),
+                func.coalesce(history.c.record_count, 0).label("record_count"),
+                func.coalesce(history.c.score_sum, 0).label("score_sum"),
+                func.coalesce(history.c.score_count, 0).label("score_count"),
+                history.c.last_recorded_at,
+            )
+            .outerjoin(history, history.c.enrollment_id == self._entity_class.id)
+            .subquery("expected")
+        )
+
+    def _summary_differs(self, expected: Any) -> Any:
+        return or_(
+            self._entity_class.record_count != expected.c.record_count,
+            self._entity_class.score_sum != expected.c.score_sum,
+            self._entity_class.score_count != expected.c.score_count,
+        )
+
+    async def find_grade_summary_drift(self) -> List[Row]:
+        """Enrollments whose stored grade summary disagrees with their history."""
+        expected = self._expected_grade_summaries()
+        query = (
+            select(
+                self._entity_class.id,
+                self._entity_class.record_count,
+                self._entity_class.score_sum,
+                self._entity_class.score_count,
+                expected.c.record_count.label("expected_record_count"),
+                expected.c.score_sum.label("expected_score_sum"),
+                expected.c.score_count.label("expected_score_count"),
+            )
+            .join(expected, expected.c.enrollment_id == self._entity_class.id)
+            .where(self._summary_differs(expected))
+            .order_by(self._entity_class.id)
         )
-        await self._session.commit()
+        result = await self._session.execute(query)
+        return list(result.all())
 
+    async def rebuild_grade_summaries(self) -> int:
+        """Recompute drifted grade summaries from the history; returns the rows fixed."""
+        expected = self._expected_grade_summaries()
+        result = await self._session.execute(
+            update(self._entity_class)
+            .where(
+                self._entity_class.id == expected.c.enrollment_id,
+                self._summary_differs(expected),
+            )
+            .values(
+                record_count=expected.c.record_count,
+                score_sum=expected.c.score_sum,
+                score_count=expected.c.score_count,
+                grades_updated_at=func.coalesce(
+                    self._entity_class.grades_updated_at, expected.c.last_recorded_at
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -1,7 +1,92 @@
+from datetime import UTC, datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import case, delete, func
+from sqlalchemy.orm import aliased
+from sqlmodel import select, update
+
+from ...models.classroom_subject import ClassroomSubject
+from ...models.classroom_subject_student import ClassroomSubjectStudent
 from ...models.qualifications import Qualification
 from .base_repository import BaseRepository
+from .classroom_subject_student_repository import grade_score
 
 
 class QualificationRepository(BaseRepository[Qualification]):
     _entity_class = Qualification
 
+    async def delete_for_teacher(
+        self, qualification_id: int, teacher_id: UUID
+    ) -> Optional[UUID]:
+        """
+        Delete a qualification record, provided `teacher_id` teaches or substitutes
+        its classroom subject, and in the same transaction point the enrollment's
+        final grade at its latest remaining record and shift its grade summary.
+
+        Returns the enrollment's student id, or None when nothing was deleted
+        because the record does not exist, is not linked to an enrollment or the
+        teacher is not authorized.
+        """
+        # Lock the enrollment first: the delete below takes its snapshot once the
+        # lock is held, so a concurrent delete on the same enrollment has already
+        # committed and its record is not picked as the latest remaining one
+        locked = await self._session.execute(
+            select(ClassroomSubjectStudent.id)
+            .join(
+                self._entity_class,
+                self._entity_class.classroom_subject_student_id
+                == ClassroomSubjectStudent.id,
+            )
+            .join(
+                ClassroomSubject,
+                ClassroomSubject.id == ClassroomSubjectStudent.classroom_subject_id,
+            )
+            .where(
+                self._entity_class.id == qualification_id,
+                (ClassroomSubject.teacher_id == teacher_id)
+                | (ClassroomSubject.substitute_teacher_id == teacher_id),
+            )
+            .with_for_update(of=ClassroomSubjectStudent)
+        )
+        if locked.scalar_one_or_none() is None:
+            return None
+
+        deleted = (
+            delete(self._entity_class)
+            .where(self._entity_class.id == qualification_id)
+            .returning(
+                self._entity_class.classroom_subject_student_id,
+                self._entity_class.grade,
+            )
+            .cte("deleted")
+        )
+        remaining = aliased(self._entity_class)
+        latest_grade = (
+            select(remaining.grade)
+            .where(
+                remaining.classroom_subject_student_id == ClassroomSubjectStudent.id,
+                # Statements see the snapshot from before their own CTE's delete
+                remaining.id != qualification_id,
+            )
+            .order_by(remaining.created_at.desc().nulls_last(), remaining.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        removed_score = grade_score(deleted.c.grade)
+        result = await self._session.execute(
+            update(ClassroomSubjectStudent)
+            .where(ClassroomSubjectStudent.id == deleted.c.classroom_subject_student_id)
+            .values(
+                qualification=latest_grade,
+                record_count=ClassroomSubjectStudent.record_count - 1,
+                score_sum=ClassroomSubjectStudent.score_sum
+                - func.coalesce(removed_score, 0),
+                score_count=ClassroomSubjectStudent.score_count
+                - case((removed_score.is_not(None), 1), else_=0),
+                grades_updated_at=datetime.now(UTC),
+            )
+            .returning(ClassroomSubjectStudent.student_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none()
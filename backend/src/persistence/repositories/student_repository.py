@@ -1,5 +1,25 @@
+from sqlalchemy.engine import Row
+
 from ...models.students import Student
+from ..pagination import Page
 from .base_repository import BaseRepository
 
 class StudentRepository(BaseRepository[Student]):
-    _entity_class = Student
\ No newline at end of file
+    _entity_class = Student
+
+    async def get_summary_page(
+        self, limit: int, cursor: str | None = None
+    ) -> Page[Row]:
+        """Listing columns only, as untracked rows."""
+        return await self.get_page(
+            limit,
+            cursor,
+            columns=[
+                Student.id,
+                Student.code,
+                Student.names,
+                Student.father_last_name,
+                Student.mother_last_name,
+                Student.email,
+            ],
+        )
@@ -2,8 +2,12 @@ from ...models.user import User
 from ...models.user_role_relation import UserRoleRelation
 from ...models.role import Role
 from ...models.role_permission_relation import RolePermissionRelation
+from ...models.permission import Permission
+from ...models.teachers import Teacher
+from ...models.students import Student
 from .base_repository import BaseRepository
-from sqlmodel import select
+from sqlmodel import select, update
+from sqlalchemy import Row, distinct, func
 from sqlalchemy.orm import joinedload
 from uuid import UUID
 
@@ -31,3 +35,66 @@ class UserRepository(BaseRepository[User]):
         )
         result = await self._session.execute(query)
         return result.scalars().first()
+
+    async def get_auth_context_by_id(self, user_id: UUID) -> Row | None:
+        """
+        Resolve everything authorization needs in a single compact row: the
+        token pair, teacher/student ids and the distinct role and permission
+        codes aggregated by Postgres, instead of one row per role x permission.
+        """
+        query = (
+            select(
+                self._entity_class.id,
+                self._entity_class.email,
+                self._entity_class.token,
+                self._entity_class.refresh_token,
+                self._entity_class.token_version,
+                Teacher.id.label("teacher_id"),
+                Student.id.label("student_id"),
+                func.array_agg(distinct(Role.code))
+                .filter(Role.code.is_not(None))
+                .label("roles"),
+                func.array_agg(distinct(Permission.code))
+                .filter(Permission.code.is_not(None))
+                .label("permissions"),
+            )
+            .select_from(self._entity_class)
+            .outerjoin(UserRoleRelation, UserRoleRelation.user_id == self._entity_class.id)
+            .outerjoin(Role, Role.id == UserRoleRelation.role_id)
+            .outerjoin(RolePermissionRelation, RolePermissionRelation.role_id == Role.id)
+            .outerjoin(Permission, Permission.id == RolePermissionRelation.permission_id)
+            .outerjoin(Teacher, Teacher.user_id == self._entity_class.id)
+            .outerjoin(Student, Student.user_id == self._entity_class.id)
+            .where(self._entity_class.id == user_id)
+            .group_by(self._entity_class.id, Teacher.id, Student.id)
+        )
+        result = await self._session.execute(query)
+        return result.first()
+
+    async def get_token_version(self, user_id: UUID) -> int | None:
+        result = await self._session.execute(
+            select(self._entity_class.token_version).where(
+                self._entity_class.id == user_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def bump_token_version(self, user_id: UUID) -> None:
+        await self._session.execute(
+            update(self._entity_class)
+            .where(self._entity_class.id == user_id)
+            .values(token_version=self._entity_class.token_version + 1)
+        )
+
+    async def bump_token_version_for_role(self, role_id: int) -> None:
+        await self._session.execute(
+            update(self._entity_class)
+            .where(
+                self._entity_class.id.in_(
+                    select(UserRoleRelation.user_id).where(
+                        UserRoleRelation.role_id == role_id
+                    )
+                )
+            )
+            .values(token_version=self._entity_class.token_version + 1)
+        )
@@ -1,5 +1,9 @@
+from typing import Any, List, Tuple
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..services.cache_invalidation import apply_invalidation, publish_invalidation
+
 from .repositories.user_repository import UserRepository
 from .repositories.role_repository import RoleRepository
 from .repositories.permission_repository import PermissionRepository
@@ -27,6 +31,12 @@ from .repositories.files_repository import FilesRepository
 
 
 class UnitOfWork:
+    """
+    Owns the request's transaction. Repositories only flush, so a use case
+    commits exactly once, after all of its writes succeeded; an exception
+    before that leaves nothing behind when the session closes.
+    """
+
     def __init__(self, session: AsyncSession):
         self._session = session
         self.user_repository = UserRepository(session)
@@ -51,9 +61,25 @@ class UnitOfWork:
         self.classes_repository = ClassesRepository(session)
         self.qualification_repository = QualificationRepository(session)
         self.files_repository = FilesRepository(session)
+        self._invalidations: List[Tuple[str, Any]] = []
+
+    async def flush(self) -> None:
+        await self._session.flush()
+
+    async def invalidate(self, kind: str, key: Any = "") -> None:
+        """
+        Invalidate a cache entry once this transaction commits: other workers
+        are notified by Postgres at commit, this one right after commit().
+        """
+        await publish_invalidation(self._session, kind, key)
+        self._invalidations.append((kind, key))
 
     async def commit(self) -> None:
         await self._session.commit()
+        invalidations, self._invalidations = self._invalidations, []
+        for kind, key in invalidations:
+            await apply_invalidation(kind, key)
 
     async def rollback(self) -> None:
         await self._session.rollback()
+        self._invalidations.clear()
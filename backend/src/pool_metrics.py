@@ -0,0 +1,120 @@
+from bisect import bisect_left
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, List
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class LatencyHistogram:
+    """
+    Cumulative latency histogram with fixed millisecond bucket bounds, in the
+    same shape Prometheus uses (`le` upper bounds plus a `+Inf` bucket).
+    """
+
+    def __init__(self, bounds_ms: List[float]):
+        self.bounds_ms = sorted(bounds_ms)
+        self._counts = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self._counts[bisect_left(self.bounds_ms, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets: Dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip(self.bounds_ms + [float("inf")], self._counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else f"{bound:g}"] = cumulative
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets_ms": buckets,
+        }
+
+
+class PoolMetrics:
+    """Connection-acquire counters of one engine's pool, kept across recreates."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.acquired = 0
+        self.timeouts = 0
+        self.acquire_latency = LatencyHistogram(
+            [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+        )
+
+    def start_wait(self) -> None:
+        with self._lock:
+            self.waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self.waiting)
+
+    def end_wait(self, elapsed_seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            self.waiting -= 1
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.acquired += 1
+            self.acquire_latency.observe(elapsed_seconds * 1000)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "waiting": self.waiting,
+                "peak_waiting": self.peak_waiting,
+                "acquired": self.acquired,
+                "timeouts": self.timeouts,
+                "acquire_latency": self.acquire_latency.snapshot(),
+            }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    `AsyncAdaptedQueuePool` that times every checkout, including the time
+    spent waiting for a connection to be returned, opening a new one when the
+    pool may grow, and the pre-ping when it is enabled.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        # dispose() swaps in a new pool; keep the history of the old one
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self):
+        self.metrics.start_wait()
+        started_at = perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.metrics.end_wait(perf_counter() - started_at, timed_out)
+
+
+def pool_status(pool: Any) -> Dict[str, Any]:
+    return {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "timeout_seconds": pool.timeout(),
+        **pool.metrics.stats(),
+    }
@@ -0,0 +1,124 @@
+import re
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .slow_queries import slow_query_log
+
+_PARAMETER = re.compile(r"%\([^)]*\)s|\$\d+|\?")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so executions differing only in parameters compare equal."""
+    shape = _PARAMETER.sub("?", statement)
+    shape = _PARAMETER_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while serving one request."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    rows: int = 0
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, rowcount: int, elapsed_seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed_seconds
+        self.rows += max(rowcount, 0)
+        self.shapes[statement_shape(statement)] += 1
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_seconds * 1000
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "db_queries": self.count,
+            "db_time_ms": round(self.total_ms, 3),
+            "db_rows": self.rows,
+        }
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+_current_handler: ContextVar[Optional[str]] = ContextVar(
+    "current_handler", default=None
+)
+
+
+def track_handler(execute: Callable) -> Callable:
+    """Wrap a handler's `execute` so statements it runs are attributed to it."""
+
+    @wraps(execute)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        token = _current_handler.set(type(self).__name__)
+        try:
+            return await execute(self, *args, **kwargs)
+        finally:
+            _current_handler.reset(token)
+
+    return wrapper
+
+
+def current_handler() -> Optional[str]:
+    return _current_handler.get()
+
+
+def start_query_stats() -> QueryStats:
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def install_query_stats(engine: Engine) -> None:
+    """
+    Attach cursor hooks to a sync engine (`AsyncEngine.sync_engine`). The hooks
+    run in the greenlet of the awaiting task, which shares its context, so the
+    request's QueryStats and current handler are visible here.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_seconds = perf_counter() - conn.info["query_started_at"].pop()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, cursor.rowcount, elapsed_seconds)
+        slow_query_log.observe(
+            conn,
+            statement,
+            parameters,
+            executemany,
+            elapsed_seconds,
+            _current_handler.get(),
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started_at"):
+            conn.info["query_started_at"].pop()
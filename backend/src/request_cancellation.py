@@ -0,0 +1,81 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+from .logger import logger
+
+Message = Dict[str, Any]
+ASGIApp = Callable[
+    [Dict[str, Any], Callable[[], Awaitable[Message]], Callable[[Message], Awaitable[None]]],
+    Awaitable[None],
+]
+
+# Only requests that are safe to abandon half-way
+CANCELLABLE_METHODS = {"GET", "HEAD"}
+
+
+class CancelOnDisconnectMiddleware:
+    """
+    Cancels the handling of a read request as soon as its client disconnects.
+
+    The app runs in its own task while this middleware keeps reading the
+    connection. An `http.disconnect` that arrives before the response has been
+    completely sent cancels that task; after that, disconnects are ignored and
+    background tasks run to completion. The CancelledError reaches the
+    database driver in the middle of its await, and the driver cancels the
+    running query server-side, so neither the worker nor Postgres keep
+    computing a response nobody will read.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] not in CANCELLABLE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        # Request messages are forwarded to the app; the disconnect stays here
+        messages: asyncio.Queue = asyncio.Queue()
+        response_complete = asyncio.Event()
+
+        async def send_tracking(message: Message) -> None:
+            # Set before sending: uvicorn reports http.disconnect as soon as the
+            # final body is out, even while the app still runs background work
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete.set()
+            await send(message)
+
+        async def watch_disconnect() -> bool:
+            """True when the client left before the response was complete."""
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect" and not response_complete.is_set():
+                    return True
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    return False
+
+        handler = asyncio.create_task(self.app(scope, messages.get, send_tracking))
+        watcher = asyncio.create_task(watch_disconnect())
+        try:
+            await asyncio.wait({handler, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            if not handler.done() and not watcher.result():
+                # Response already sent: let post-response work finish
+                await handler
+        except asyncio.CancelledError:
+            handler.cancel()
+            raise
+        finally:
+            watcher.cancel()
+
+        if handler.done():
+            # Re-raises whatever the app raised
+            handler.result()
+            return
+
+        handler.cancel()
+        logger.info(f"Client disconnected, cancelled {scope['method']} {scope['path']}")
+        try:
+            await handler
+        except asyncio.CancelledError:
+            pass
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from src.config import configuration_variables
 from src.auth import get_current_user, CurrentUserContext
 from src.use_cases.classroom_subject.create.create_classroom_subject_handler import CreateClassroomSubjectHandler
 from src.use_cases.classroom_subject.create.create_classroom_subject_request import CreateClassroomSubjectRequest
@@ -24,13 +26,19 @@ async def create_classroom_subject(
 
 @router.get("")
 async def get_all_classroom_subjects(
+    limit: int = Query(
+        configuration_variables.page_size_default,
+        ge=1,
+        le=configuration_variables.page_size_max,
+    ),
+    cursor: Optional[str] = None,
     handler: GetAllClassroomSubjectsHandler = Depends(GetAllClassroomSubjectsHandler),
     current: CurrentUserContext = Depends(get_current_user),
 ):
     if "manage_users" not in current.permissions:
         raise HTTPException(status_code=403, detail="Forbidden")
     
-    request = GetAllClassroomSubjectsRequest()
+    request = GetAllClassroomSubjectsRequest(limit=limit, cursor=cursor)
     result = await handler.execute(request)
     return {**result.model_dump(), "requested_by": {"email": current.email, "roles": current.roles, "permissions": current.permissions}}
 
@@ -1,4 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from src.config import configuration_variables
+from src.http_caching import (
+    cache_control,
+    entity_tag,
+    is_not_modified,
+    not_modified,
+    set_cache_headers,
+)
 from src.auth import get_current_user, CurrentUserContext
 from src.use_cases.classrooms.create.create_classroom_handler import CreateClassroomHandler
 from src.use_cases.classrooms.create.create_classroom_request import CreateClassroomRequest
@@ -31,15 +40,31 @@ async def create_classroom(
 
 @router.get("")
 async def get_all_classrooms(
+    http_request: Request,
+    response: Response,
+    limit: int = Query(
+        configuration_variables.page_size_default,
+        ge=1,
+        le=configuration_variables.page_size_max,
+    ),
+    cursor: Optional[str] = None,
     handler: GetAllClassroomsHandler = Depends(GetAllClassroomsHandler),
     current: CurrentUserContext = Depends(get_current_user),
 ):
     if "manage_users" not in current.permissions:
         raise HTTPException(status_code=403, detail="Forbidden")
     
-    request = GetAllClassroomsRequest()
+    requested_by = {"email": current.email, "roles": current.roles, "permissions": current.permissions}
+    request = GetAllClassroomsRequest(limit=limit, cursor=cursor)
     result = await handler.execute(request)
-    return {**result.model_dump(), "requested_by": {"email": current.email, "roles": current.roles, "permissions": current.permissions}}
+    # Tagged by content, like the subjects list
+    etag = entity_tag(result.model_dump_json(), requested_by)
+    control = cache_control(private=True)
+    if is_not_modified(http_request, etag):
+        return not_modified(etag, control)
+
+    set_cache_headers(response, etag, control)
+    return {**result.model_dump(), "requested_by": requested_by}
 
 
 @router.get("/{classroom_id}")
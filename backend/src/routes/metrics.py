@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, HTTPException
+from src.auth import get_current_user, CurrentUserContext
+from src.database import engine, replica_engine
+from src.pool_metrics import pool_status
+from src.slow_queries import slow_query_log
+from src.services.auth_cache import auth_context_cache
+from src.services.password_hash_pool import password_hash_pool
+from src.services.cache_backends import cache_backend
+from src.services.cache_invalidation import invalidation_listener
+
+
+router = APIRouter()
+
+
+@router.get("/auth-cache")
+async def get_auth_cache_metrics(
+    current: CurrentUserContext = Depends(get_current_user),
+):
+    if "manage_users" not in current.permissions:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    return auth_context_cache.stats()
+
+
+@router.get("/cache")
+async def get_cache_metrics(
+    current: CurrentUserContext = Depends(get_current_user),
+):
+    if "manage_users" not in current.permissions:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    return {
+        **cache_backend.stats(),
+        "invalidation_listener": invalidation_listener.stats(),
+    }
+
+
+@router.get("/password-hashing")
+async def get_password_hashing_metrics(
+    current: CurrentUserContext = Depends(get_current_user),
+):
+    if "manage_users" not in current.permissions:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    return password_hash_pool.stats()
+
+
+@router.get("/pool")
+async def get_pool_metrics(
+    current: CurrentUserContext = Depends(get_current_user),
+):
+    if "manage_users" not in current.permissions:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    status = pool_status(engine.pool)
+    if replica_engine is not None:
+        status["replica"] = pool_status(replica_engine.pool)
+    return status
+
+
+@router.get("/slow-queries")
+async def get_slow_queries(
+    current: CurrentUserContext = Depends(get_current_user),
+):
+    if "manage_users" not in current.permissions:
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "explain": slow_query_log.explain,
+        "queries": slow_query_log.entries(),
+    }
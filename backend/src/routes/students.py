@@ -1,5 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from src.config import configuration_variables
 from src.auth import get_current_user, CurrentUserContext
+from src.http_caching import (
+    cache_control,
+    entity_tag,
+    is_not_modified,
+    not_modified,
+    set_cache_headers,
+)
 from src.use_cases.students.create.create_student_handler import CreateStudentHandler
 from src.use_cases.students.create.create_student_request import CreateStudentRequest
 from src.use_cases.students.get_all.get_all_students_handler import (
@@ -14,6 +23,12 @@ from src.use_cases.students.get_by_id.get_student_by_id_handler import (
 from src.use_cases.students.get_by_id.get_student_by_id_request import (
     GetStudentByIdRequest,
 )
+from src.use_cases.students.get_grades_fingerprint.get_student_grades_fingerprint_handler import (
+    GetStudentGradesFingerprintHandler,
+)
+from src.use_cases.students.get_grades_fingerprint.get_student_grades_fingerprint_request import (
+    GetStudentGradesFingerprintRequest,
+)
 from src.use_cases.students.get_subjects.get_student_subjects_handler import (
     GetStudentSubjectsHandler,
 )
@@ -53,10 +68,16 @@ async def create_student(
 
 @router.get("")
 async def get_all_students(
+    limit: int = Query(
+        configuration_variables.page_size_default,
+        ge=1,
+        le=configuration_variables.page_size_max,
+    ),
+    cursor: Optional[str] = None,
     handler: GetAllStudentsHandler = Depends(GetAllStudentsHandler),
     current: CurrentUserContext = Depends(get_current_user),
 ):
-    request = GetAllStudentsRequest()
+    request = GetAllStudentsRequest(limit=limit, cursor=cursor)
     result = await handler.execute(request)
     return {
         **result.model_dump(),
@@ -82,39 +103,69 @@ async def get_student_by_id(
 @router.get("/{student_id}/subjects")
 async def get_student_subjects(
     student_id: str,
+    http_request: Request,
+    response: Response,
     handler: GetStudentSubjectsHandler = Depends(GetStudentSubjectsHandler),
+    fingerprint_handler: GetStudentGradesFingerprintHandler = Depends(
+        GetStudentGradesFingerprintHandler
+    ),
     current: CurrentUserContext = Depends(get_current_user),
     include_inactive: bool = False,
 ):
     if current.student_id != student_id and "view_students" not in current.permissions:
         raise HTTPException(status_code=403, detail="Forbidden")
 
+    requested_by = {
+        "email": current.email,
+        "roles": current.roles,
+        "permissions": current.permissions,
+    }
+    fingerprint = await fingerprint_handler.execute(
+        GetStudentGradesFingerprintRequest(
+            student_id=student_id, include_inactive=include_inactive
+        )
+    )
+    etag = entity_tag("subjects", fingerprint.fingerprint, include_inactive, requested_by)
+    control = cache_control(private=True)
+    if is_not_modified(http_request, etag):
+        return not_modified(etag, control)
+
     request = GetStudentSubjectsRequest(
         student_id=student_id, include_inactive=include_inactive
     )
     result = await handler.execute(request)
-    return {
-        **result.model_dump(),
-        "requested_by": {
-            "email": current.email,
-            "roles": current.roles,
-            "permissions": current.permissions,
-        },
-    }
+    set_cache_headers(response, etag, control)
+    return {**result.model_dump(), "requested_by": requested_by}
 
 
 @router.get("/{student_id}/subjects/qualifications")
 async def get_student_subject_qualifications(
     student_id: str,
+    http_request: Request,
+    response: Response,
     handler: GetStudentSubjectQualificationsHandler = Depends(
         GetStudentSubjectQualificationsHandler
     ),
+    fingerprint_handler: GetStudentGradesFingerprintHandler = Depends(
+        GetStudentGradesFingerprintHandler
+    ),
     include_inactive: bool = False,
 ):
+    fingerprint = await fingerprint_handler.execute(
+        GetStudentGradesFingerprintRequest(
+            student_id=student_id, include_inactive=include_inactive
+        )
+    )
+    etag = entity_tag("qualifications", fingerprint.fingerprint, include_inactive)
+    control = cache_control(private=True)
+    if is_not_modified(http_request, etag):
+        return not_modified(etag, control)
+
     request = GetStudentSubjectQualificationsRequest(
         student_id=student_id, include_inactive=include_inactive
     )
     result = await handler.execute(request)
+    set_cache_headers(response, etag, control)
     return {**result.model_dump()}
 
 
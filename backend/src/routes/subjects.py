@@ -1,4 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from src.config import configuration_variables
+from src.http_caching import (
+    cache_control,
+    entity_tag,
+    is_not_modified,
+    not_modified,
+    set_cache_headers,
+)
 from src.auth import (
     get_current_user,
     CurrentUserContext,
@@ -39,19 +48,41 @@ async def create_subject(
 
 @router.get("")
 async def get_all_subjects(
+    http_request: Request,
+    response: Response,
+    limit: int = Query(
+        configuration_variables.page_size_default,
+        ge=1,
+        le=configuration_variables.page_size_max,
+    ),
+    cursor: Optional[str] = None,
     handler: GetAllSubjectsHandler = Depends(GetAllSubjectsHandler),
     current: CurrentUserContext | None = Depends(get_optional_current_user),
 ):
-    request = GetAllSubjectsRequest()
-    result = await handler.execute(request)
-    response = result.model_dump()
+    requested_by = None
     if current is not None:
-        response["requested_by"] = {
+        requested_by = {
             "email": current.email,
             "roles": current.roles,
             "permissions": current.permissions,
         }
-    return response
+    request = GetAllSubjectsRequest(limit=limit, cursor=cursor)
+    result = await handler.execute(request)
+    # Tagged by content, so every worker agrees on it and it only changes with
+    # the data; the page itself normally comes from the reference cache
+    etag = entity_tag(result.model_dump_json(), requested_by)
+    control = cache_control(
+        private=current is not None,
+        max_age=configuration_variables.reference_cache_max_age_seconds,
+    )
+    if is_not_modified(http_request, etag):
+        return not_modified(etag, control)
+
+    body = result.model_dump()
+    if requested_by is not None:
+        body["requested_by"] = requested_by
+    set_cache_headers(response, etag, control)
+    return body
 
 
 @router.get("/{subject_id}")
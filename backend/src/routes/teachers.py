@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from src.config import configuration_variables
 from uuid import UUID
 from src.auth import get_current_user, CurrentUserContext
 from src.use_cases.teachers.create.create_teacher_handler import CreateTeacherHandler
@@ -75,9 +77,15 @@ async def get_teacher_by_id(
 
 @router.get("")
 async def get_all_teachers(
+    limit: int = Query(
+        configuration_variables.page_size_default,
+        ge=1,
+        le=configuration_variables.page_size_max,
+    ),
+    cursor: Optional[str] = None,
     handler: GetAllTeachersHandler = Depends(GetAllTeachersHandler),
 ):
-    request = GetAllTeachersRequest()
+    request = GetAllTeachersRequest(limit=limit, cursor=cursor)
     result = await handler.execute(request)
     return {**result.model_dump()}
 
@@ -103,6 +111,7 @@ async def get_teacher_classroom_students(
         GetTeacherClassroomStudentsHandler
     ),
     include_inactive: bool = False,
+    include_history: bool = False,
     current: CurrentUserContext = Depends(get_current_user),
 ):
     request = GetTeacherClassroomStudentsRequest(
@@ -111,6 +120,7 @@ async def get_teacher_classroom_students(
         requesting_user_id=current.user_id,
         can_manage_any="manage_users" in current.permissions,
         include_inactive=include_inactive,
+        include_history=include_history,
     )
     result = await handler.execute(request)
     return {
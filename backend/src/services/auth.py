@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 from jose import jwt
 from passlib.context import CryptContext
@@ -7,6 +8,7 @@ from ..config import configuration_variables
 from fastapi import HTTPException
 from .schemas.auth.CreateAccessTokenResponse import CreateAccessTokenResponse
 from .schemas.auth.CreateAccessTokenRequest import CreateAccessTokenRequest, CreateAccessTokenData
+from .password_hash_pool import password_hash_pool
 
 class AuthService:
     def __init__(self):
@@ -21,6 +23,12 @@ class AuthService:
     def get_password_hash(self, password):
         return self.pwd_context.hash(password)
 
+    async def verify_password_async(self, plain_password, hashed_password):
+        return await password_hash_pool.run(self.verify_password, plain_password, hashed_password)
+
+    async def get_password_hash_async(self, password):
+        return await password_hash_pool.run(self.get_password_hash, password)
+
     def create_access_token(self, payload: CreateAccessTokenRequest) -> CreateAccessTokenResponse:
         now_utc = datetime.now(timezone.utc)
         access_expire_at = now_utc + payload.expires_delta
@@ -31,8 +39,14 @@ class AuthService:
             exp=int(access_expire_at.timestamp()),
             iat=int(now_utc.timestamp()),
             type="access",
+            claims=payload.data.claims,
+            roles=payload.data.roles,
+            perms=payload.data.perms,
+            tid=payload.data.tid,
+            sid=payload.data.sid,
+            ver=payload.data.ver,
         )
-        access_token = jwt.encode(access_claims.model_dump(), self.secret_key, algorithm=self.algorithm)
+        access_token = jwt.encode(access_claims.model_dump(exclude_none=True), self.secret_key, algorithm=self.algorithm)
 
         refresh_expire_at = now_utc + timedelta(days=7)
         refresh_claims = CreateAccessTokenData(
@@ -41,8 +55,9 @@ class AuthService:
             exp=int(refresh_expire_at.timestamp()),
             iat=int(now_utc.timestamp()),
             type="refresh",
+            ver=payload.data.ver,
         )
-        refresh_token = jwt.encode(refresh_claims.model_dump(), self.secret_key, algorithm=self.algorithm)
+        refresh_token = jwt.encode(refresh_claims.model_dump(exclude_none=True), self.secret_key, algorithm=self.algorithm)
 
         return CreateAccessTokenResponse(
             access_token=access_token,
@@ -67,4 +82,10 @@ class AuthService:
 
         # Create a conventional access token request using subject as the primary claim
         request = CreateAccessTokenRequest(data=CreateAccessTokenData(sub=subject, email=email))
-        return self.create_access_token(request)
\ No newline at end of file
+        return self.create_access_token(request)
+
+
+@lru_cache(maxsize=None)
+def get_auth_service() -> AuthService:
+    """Process-wide AuthService; building the CryptContext per request is wasted work."""
+    return AuthService()
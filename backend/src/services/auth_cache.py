@@ -0,0 +1,81 @@
+from hashlib import sha256
+from time import time
+from typing import Any, Dict, Optional, Set
+
+from ..config import configuration_variables
+from .cache import TTLCache
+
+
+class AuthContextCache:
+    """
+    Caches the resolved auth context of a bearer token so that repeated
+    requests with the same token skip the user/roles/permissions lookup.
+
+    Entries are keyed by a digest of the token and indexed by user id, so a
+    login, a role change or a profile deletion can drop every token of the
+    affected user at once.
+    """
+
+    def __init__(
+        self, ttl_seconds: float, max_entries: int, version_ttl_seconds: float
+    ):
+        self._cache: TTLCache[str, Any] = TTLCache(ttl_seconds, max_entries)
+        self._tokens_by_user: Dict[str, Set[str]] = {}
+        # Per-user token versions used to revoke stateless access tokens
+        self._versions: TTLCache[str, int] = TTLCache(version_ttl_seconds, max_entries)
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Any]:
+        key = self._key(token)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, context = entry
+        # Never serve a context past the token's own expiry, even within the TTL
+        if expires_at is not None and expires_at <= time():
+            self._cache.delete(key)
+            return None
+        return context
+
+    def set(self, token: str, context: Any, expires_at: Optional[int] = None) -> None:
+        key = self._key(token)
+        self._cache.set(key, (expires_at, context))
+        user_keys = self._tokens_by_user.setdefault(str(context.user_id), set())
+        # Drop keys that already expired or were evicted so the index stays small
+        user_keys.difference_update(
+            {cached for cached in user_keys if cached not in self._cache}
+        )
+        user_keys.add(key)
+
+    def get_token_version(self, user_id: Any) -> Optional[int]:
+        return self._versions.get(str(user_id))
+
+    def set_token_version(self, user_id: Any, version: int) -> None:
+        self._versions.set(str(user_id), version)
+
+    def invalidate_user(self, user_id: Any) -> None:
+        for key in self._tokens_by_user.pop(str(user_id), set()):
+            self._cache.delete(key)
+        self._versions.delete(str(user_id))
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._tokens_by_user.clear()
+        self._versions.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._cache.stats(),
+            "users": len(self._tokens_by_user),
+            "token_versions": self._versions.stats(),
+        }
+
+
+auth_context_cache = AuthContextCache(
+    ttl_seconds=configuration_variables.auth_cache_ttl_seconds,
+    max_entries=configuration_variables.auth_cache_max_entries,
+    version_ttl_seconds=configuration_variables.auth_token_version_ttl_seconds,
+)
@@ -0,0 +1,196 @@
+"""
+Key/value stores behind the application caches. The in-memory backend is per
+worker; the Redis one is shared by every worker and speaks plain RESP, so any
+compatible server (Redis, Valkey, KeyDB, or the `cache` compose service) can
+stand in locally. Check a backend against the same contract with:
+
+    CACHE_BACKEND=redis uv run --extra redis python -m src.services.cache_backends
+"""
+import asyncio
+import pickle
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from ..config import configuration_variables
+from .cache import TTLCache
+
+try:
+    from redis import asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+class CacheBackend(ABC):
+    # Whether all workers see the same entries; per-worker backends rely on
+    # invalidation events to stay coherent
+    shared: bool = False
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        pass
+
+    @abstractmethod
+    async def add(self, key: str, value: Any, ttl_seconds: float) -> bool:
+        """Store `value` only if `key` is absent; True when it was stored."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    def __init__(self, max_entries: int, default_ttl_seconds: float = 300.0):
+        self._cache: TTLCache[str, Any] = TTLCache(default_ttl_seconds, max_entries)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._cache.set(key, value, ttl_seconds)
+
+    async def add(self, key: str, value: Any, ttl_seconds: float) -> bool:
+        if key in self._cache:
+            return False
+        self._cache.set(key, value, ttl_seconds)
+        return True
+
+    async def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", **self._cache.stats()}
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Values are pickled, so the server must only be reachable by this
+    application. Every key is namespaced with `prefix`.
+    """
+
+    shared = True
+
+    def __init__(self, url: str, prefix: str):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("CACHE_BACKEND=redis requires the redis extra (uv sync --extra redis)")
+        self._client = redis_asyncio.from_url(url)
+        self._prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._client.get(self._prefix + key)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+        await self._client.set(
+            self._prefix + key, pickle.dumps(value), px=int(ttl_seconds * 1000)
+        )
+
+    async def add(self, key: str, value: Any, ttl_seconds: float) -> bool:
+        if ttl_seconds <= 0:
+            return False
+        stored = await self._client.set(
+            self._prefix + key,
+            pickle.dumps(value),
+            px=int(ttl_seconds * 1000),
+            nx=True,
+        )
+        return bool(stored)
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._prefix + key)
+
+    async def clear(self) -> None:
+        keys = [key async for key in self._client.scan_iter(match=self._prefix + "*")]
+        for start in range(0, len(keys), 500):
+            await self._client.delete(*keys[start : start + 500])
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "redis",
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def create_cache_backend(name: Optional[str] = None) -> CacheBackend:
+    name = name or configuration_variables.cache_backend
+    if name == "memory":
+        return MemoryCacheBackend(configuration_variables.cache_max_entries)
+    if name == "redis":
+        return RedisCacheBackend(
+            configuration_variables.cache_url, configuration_variables.cache_key_prefix
+        )
+    raise ValueError(f"Unsupported CACHE_BACKEND {name!r}; expected memory or redis")
+
+
+cache_backend = create_cache_backend()
+
+
+async def _check(backend: CacheBackend) -> List[str]:
+    key = "cache-backend-check"
+    failures = []
+    await backend.delete(key)
+    if await backend.get(key) is not None:
+        failures.append("deleted key still readable")
+    if not await backend.add(key, {"value": 1}, ttl_seconds=1):
+        failures.append("add on a missing key was refused")
+    if await backend.add(key, {"value": 2}, ttl_seconds=1):
+        failures.append("add overwrote an existing key")
+    if await backend.get(key) != {"value": 1}:
+        failures.append("value did not round-trip")
+    await backend.set(key, {"value": 3}, ttl_seconds=0.2)
+    if await backend.get(key) != {"value": 3}:
+        failures.append("set did not overwrite")
+    await asyncio.sleep(0.3)
+    if await backend.get(key) is not None:
+        failures.append("entry outlived its TTL")
+    await backend.delete(key)
+    return failures
+
+
+async def main() -> int:
+    try:
+        failures = await _check(cache_backend)
+    finally:
+        await cache_backend.close()
+    name = cache_backend.stats()["backend"]
+    for failure in failures:
+        print(f"{name}: {failure}")
+    print(f"{name}: {'FAILED' if failures else 'ok'}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,173 @@
+"""
+Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+A write queues its invalidations on the unit of work, which sends them with
+pg_notify inside the same transaction: Postgres delivers them only if, and
+when, the transaction commits. The writing worker applies them itself right
+after the commit; every other worker gets them from its listener.
+"""
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import uuid4
+
+import psycopg
+from psycopg import sql
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import configuration_variables
+from ..logger import logger
+from .auth_cache import auth_context_cache
+from .cache_backends import cache_backend
+from .grade_fingerprints import grade_fingerprint_cache
+from .reference_cache import reference_data_cache
+
+AUTH_USER = "auth_user"
+AUTH_ALL = "auth_all"
+REFERENCE = "reference"
+STUDENT_GRADES = "student_grades"
+
+# Tells this worker's own notifications apart, since it applied them already
+WORKER_ID = uuid4().hex
+
+
+async def _invalidate_auth_user(key: str) -> None:
+    auth_context_cache.invalidate_user(key)
+
+
+async def _invalidate_auth_all(key: str) -> None:
+    auth_context_cache.clear()
+
+
+async def _invalidate_reference(key: str) -> None:
+    await reference_data_cache.bump(key)
+
+
+async def _invalidate_student_grades(key: str) -> None:
+    await grade_fingerprint_cache.bump(key)
+
+
+_HANDLERS: Dict[str, Callable[[str], Awaitable[None]]] = {
+    AUTH_USER: _invalidate_auth_user,
+    AUTH_ALL: _invalidate_auth_all,
+    REFERENCE: _invalidate_reference,
+    STUDENT_GRADES: _invalidate_student_grades,
+}
+# Kept in the cache backend: with a shared backend the writer's bump already
+# reached every worker
+_BACKEND_KINDS = {REFERENCE, STUDENT_GRADES}
+
+
+async def publish_invalidation(session: AsyncSession, kind: str, key: Any) -> None:
+    if kind not in _HANDLERS:
+        raise ValueError(f"Unknown cache invalidation kind {kind!r}")
+    payload = json.dumps({"origin": WORKER_ID, "kind": kind, "key": str(key)})
+    await session.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {
+            "channel": configuration_variables.cache_invalidation_channel,
+            "payload": payload,
+        },
+    )
+
+
+async def apply_invalidation(kind: str, key: Any, remote: bool = False) -> None:
+    if remote and cache_backend.shared and kind in _BACKEND_KINDS:
+        return
+    await _HANDLERS[kind](str(key))
+
+
+async def reset_local_caches() -> None:
+    """Drop everything only this worker holds, e.g. after missing notifications."""
+    auth_context_cache.clear()
+    if not cache_backend.shared:
+        await cache_backend.clear()
+
+
+class InvalidationListener:
+    """
+    Background task holding one dedicated connection in LISTEN mode. It always
+    uses psycopg, whichever DB_DRIVER serves the pools, and needs a session
+    level connection: LISTEN does not work through PgBouncer in transaction mode.
+    """
+
+    def __init__(self, url: str, channel: str, retry_seconds: float):
+        self._url = url
+        self._channel = channel
+        self._retry_seconds = retry_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.connected = False
+        self.received = 0
+        self.reconnects = 0
+        self.last_error: Optional[str] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="cache-invalidation")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                self.last_error = str(error)
+                logger.warning(f"Cache invalidation listener disconnected: {error}")
+            self.connected = False
+            self.reconnects += 1
+            await asyncio.sleep(self._retry_seconds)
+
+    async def _listen(self) -> None:
+        async with await psycopg.AsyncConnection.connect(
+            self._url, autocommit=True
+        ) as connection:
+            await connection.execute(
+                sql.SQL("LISTEN {}").format(sql.Identifier(self._channel))
+            )
+            # Notifications sent while this worker was not listening are lost
+            await reset_local_caches()
+            self.connected = True
+            while True:
+                async for notify in connection.notifies(timeout=30):
+                    await self._dispatch(notify.payload)
+                # Quiet channel: make sure the connection is still alive
+                await connection.execute("SELECT 1")
+
+    async def _dispatch(self, payload: str) -> None:
+        self.received += 1
+        try:
+            event = json.loads(payload)
+            if event.get("origin") == WORKER_ID:
+                return
+            await apply_invalidation(event["kind"], event["key"], remote=True)
+        except Exception as error:
+            logger.warning(f"Ignoring cache invalidation {payload!r}: {error}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "channel": self._channel,
+            "running": self._task is not None,
+            "connected": self.connected,
+            "received": self.received,
+            "reconnects": self.reconnects,
+            "last_error": self.last_error,
+        }
+
+
+invalidation_listener = InvalidationListener(
+    configuration_variables.database_url,
+    configuration_variables.cache_invalidation_channel,
+    configuration_variables.cache_invalidation_retry_seconds,
+)
@@ -0,0 +1,87 @@
+"""
+Replays a login burst against bcrypt verification run inline on the event
+loop (as before the dedicated pool) and through `PasswordHashPool`:
+
+    uv run python -m src.services.password_hash_benchmark --logins 50 --workers 2
+
+Every login of the burst starts at once. Reported are the p50/p99 login
+latencies and the p99 delay of a probe that wakes every 5 ms, which stands in
+for the other requests the worker is serving meanwhile. No database needed.
+"""
+import argparse
+import asyncio
+from statistics import median, quantiles
+from time import perf_counter
+from typing import Awaitable, Callable, List, Tuple
+
+from .auth import AuthService
+from .password_hash_pool import PasswordHashPool
+
+PROBE_INTERVAL_SECONDS = 0.005
+
+Verify = Callable[[str, str], Awaitable[bool]]
+
+
+def _p99(values: List[float]) -> float:
+    return quantiles(values, n=100)[-1] if len(values) > 1 else values[0]
+
+
+async def _probe(done: asyncio.Event, delays: List[float]) -> None:
+    while not done.is_set():
+        started_at = perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+        delays.append((perf_counter() - started_at - PROBE_INTERVAL_SECONDS) * 1000)
+
+
+async def _burst(
+    verify: Verify, password: str, hashed: str, logins: int
+) -> Tuple[List[float], List[float]]:
+    # Latencies count from the start of the burst, as its clients see them
+    burst_started_at = perf_counter()
+
+    async def login() -> float:
+        if not await verify(password, hashed):
+            raise RuntimeError("password did not verify")
+        return (perf_counter() - burst_started_at) * 1000
+
+    done = asyncio.Event()
+    delays: List[float] = []
+    probe = asyncio.create_task(_probe(done, delays))
+    await asyncio.sleep(0)
+    try:
+        latencies = await asyncio.gather(*(login() for _ in range(logins)))
+    finally:
+        done.set()
+        await probe
+    return list(latencies), delays or [0.0]
+
+
+async def main(logins: int, workers: int) -> None:
+    auth_service = AuthService()
+    password = "burst-password"
+    hashed = auth_service.get_password_hash(password)
+    pool = PasswordHashPool(max_workers=workers, max_pending=logins)
+
+    async def inline(plain: str, hashed_password: str) -> bool:
+        return auth_service.verify_password(plain, hashed_password)
+
+    async def pooled(plain: str, hashed_password: str) -> bool:
+        return await pool.run(auth_service.verify_password, plain, hashed_password)
+
+    try:
+        for name, verify in (("inline", inline), (f"pool x{workers}", pooled)):
+            latencies, delays = await _burst(verify, password, hashed, logins)
+            print(
+                f"{name:>8} | {logins} logins | p50 {median(latencies):8.1f} ms | "
+                f"p99 {_p99(latencies):8.1f} ms | loop delay p99 {_p99(delays):8.1f} ms"
+            )
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.workers))
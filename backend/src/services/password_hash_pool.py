@@ -0,0 +1,107 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+from fastapi import HTTPException
+
+from ..config import configuration_variables
+
+
+class PasswordHashPool:
+    """
+    Runs bcrypt hashing and verification on a dedicated, size-bounded thread
+    pool so a login burst never blocks the event loop. bcrypt releases the GIL
+    while it works, so the worker threads run truly in parallel.
+
+    Requests beyond `max_workers + max_pending` are rejected with a 503 rather
+    than queued without bound.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+        self._lock = Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+        self.peak_queue_depth = 0
+        self._total_wait_seconds = 0.0
+        self._total_run_seconds = 0.0
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self.queued + self.active >= self.max_workers + self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=503, detail="Server busy, please retry"
+                )
+            self.queued += 1
+            self.peak_queue_depth = max(self.peak_queue_depth, self.queued)
+
+        submitted_at = perf_counter()
+        started = False
+        abandoned = False
+
+        def task() -> Any:
+            nonlocal started
+            started_at = perf_counter()
+            with self._lock:
+                # The caller stopped waiting before a worker picked this up
+                if abandoned:
+                    return None
+                started = True
+                self.queued -= 1
+                self.active += 1
+                self._total_wait_seconds += started_at - submitted_at
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+                    self._total_run_seconds += perf_counter() - started_at
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, task)
+        finally:
+            # Cancelled while still queued (timeout, shutdown, client abort):
+            # the executor may drop the task, so release its slot here
+            with self._lock:
+                if not started:
+                    abandoned = True
+                    self.queued -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            completed = self.completed
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "queue_depth": self.queued,
+                "active": self.active,
+                "peak_queue_depth": self.peak_queue_depth,
+                "completed": completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self._total_wait_seconds * 1000 / completed, 3)
+                if completed
+                else 0.0,
+                "avg_run_ms": round(self._total_run_seconds * 1000 / completed, 3)
+                if completed
+                else 0.0,
+            }
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=configuration_variables.password_hash_workers,
+    max_pending=configuration_variables.password_hash_max_pending,
+)
@@ -0,0 +1,13 @@
+from ..config import configuration_variables
+from .cache_backends import cache_backend
+from .versioned_cache import VersionedCache
+
+SUBJECTS = "subjects"
+CLASSROOMS = "classrooms"
+
+# Read-mostly catalogs (subjects, classrooms)
+reference_data_cache = VersionedCache(
+    cache_backend,
+    prefix="reference",
+    ttl_seconds=configuration_variables.reference_cache_ttl_seconds,
+)
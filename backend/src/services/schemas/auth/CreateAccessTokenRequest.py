@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import timedelta
-from typing import Optional
+from typing import List, Optional
 
 class CreateAccessTokenData(BaseModel):
     sub: str
@@ -8,6 +8,14 @@ class CreateAccessTokenData(BaseModel):
     exp: Optional[int] = None
     iat: Optional[int] = None
     type: Optional[str] = None
+    # Embedded authorization claims, only set when stateless tokens are enabled;
+    # `claims` marks a token that carries them
+    claims: Optional[bool] = None
+    roles: Optional[List[str]] = None
+    perms: Optional[List[str]] = None
+    tid: Optional[str] = None
+    sid: Optional[str] = None
+    ver: Optional[int] = None
 
 class CreateAccessTokenRequest(BaseModel):
     data: CreateAccessTokenData
@@ -0,0 +1,59 @@
+from typing import Awaitable, Callable, Hashable, TypeVar
+from uuid import uuid4
+
+from .cache_backends import CacheBackend
+
+TValue = TypeVar("TValue")
+
+
+class VersionedCache:
+    """
+    Read-through cache whose namespaces carry a version stamp. Entries are
+    keyed by it, so `bump` makes every entry of a namespace unreachable at
+    once; they age out of the backend. Stamps live in the backend too, so with
+    a shared backend all workers agree on them. They are random, so they are no
+    basis for ETags.
+    """
+
+    def __init__(self, backend: CacheBackend, prefix: str, ttl_seconds: float):
+        self._backend = backend
+        self._prefix = prefix
+        self.ttl_seconds = ttl_seconds
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self._prefix}:{namespace}:version"
+
+    async def version(self, namespace: str) -> str:
+        key = self._version_key(namespace)
+        version = await self._backend.get(key)
+        if version is not None:
+            return version
+        # Stamps outlive the entries stored under them; a lost stamp only costs misses
+        candidate = uuid4().hex
+        if await self._backend.add(key, candidate, self.ttl_seconds * 2):
+            return candidate
+        return await self._backend.get(key) or candidate
+
+    async def bump(self, namespace: str) -> None:
+        """Call after the commit that changed the namespace's rows."""
+        await self._backend.set(
+            self._version_key(namespace), uuid4().hex, self.ttl_seconds * 2
+        )
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[TValue]],
+    ) -> TValue:
+        # Stored under the stamp read before loading, so a bump during the load
+        # leaves a possibly outdated value unreachable
+        version = await self.version(namespace)
+        entry_key = f"{self._prefix}:{namespace}:{version}:{key!r}"
+        cached = await self._backend.get(entry_key)
+        if cached is not None:
+            return cached
+
+        value = await loader()
+        await self._backend.set(entry_key, value, self.ttl_seconds)
+        return value
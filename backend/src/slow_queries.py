@@ -0,0 +1,107 @@
+from collections import deque
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional
+
+from .config import configuration_variables
+from .logger import logger
+
+
+def parameter_shape(parameters: Any) -> Any:
+    """Types of the bound parameters, never their values."""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+class SlowQueryLog:
+    """
+    Logs statements slower than `threshold_ms` and keeps the most recent ones,
+    optionally with their EXPLAIN (ANALYZE, BUFFERS) plan, in a ring buffer.
+    """
+
+    def __init__(self, threshold_ms: float, capacity: int, explain: bool):
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0
+
+    def observe(
+        self,
+        conn: Any,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        elapsed_seconds: float,
+        handler: Optional[str],
+    ) -> None:
+        duration_ms = elapsed_seconds * 1000
+        if not self.enabled or duration_ms < self.threshold_ms:
+            return
+
+        entry = {
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "handler": handler,
+            "duration_ms": round(duration_ms, 3),
+            "statement": statement,
+            "parameters": parameter_shape(parameters),
+            "plan": None,
+        }
+        logger.warning(
+            f"Slow query ({entry['duration_ms']} ms) in {handler or 'unknown handler'}: "
+            f"{statement} -- parameters {entry['parameters']}"
+        )
+
+        if (
+            self.explain
+            and not executemany
+            and statement.lstrip().upper().startswith("SELECT")
+        ):
+            entry["plan"] = self._explain(conn, statement, parameters)
+
+        with self._lock:
+            self._entries.append(entry)
+
+    @staticmethod
+    def _explain(conn: Any, statement: str, parameters: Any) -> Optional[str]:
+        # Raw DBAPI cursor so the EXPLAIN does not go through the engine hooks again;
+        # the savepoint keeps a failing EXPLAIN from aborting the caller's transaction
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute(
+                    f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters or None
+                )
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+                cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+                return plan
+            except Exception as exc:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                logger.warning(f"Could not capture EXPLAIN for slow query: {exc}")
+                return None
+        finally:
+            cursor.close()
+
+    def entries(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=configuration_variables.slow_query_threshold_ms,
+    capacity=configuration_variables.slow_query_buffer_size,
+    # EXPLAIN ANALYZE runs the query a second time, so never in production
+    explain=configuration_variables.slow_query_explain
+    and not configuration_variables.is_production,
+)
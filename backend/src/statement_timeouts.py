@@ -0,0 +1,27 @@
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from .config import configuration_variables
+from .query_stats import current_handler
+
+_SET_TIMEOUT = text("SELECT set_config('statement_timeout', :timeout, true)")
+
+
+def install_statement_timeouts(session_class: type = Session) -> None:
+    """
+    Give each transaction the statement timeout budgeted for the handler that
+    opened it (DB_HANDLER_STATEMENT_TIMEOUTS_MS, keyed by handler class name).
+    The setting is transaction-local, so it ends with the transaction and never
+    leaks to the next user of the pooled connection; handlers without a budget
+    keep the connection-wide DB_STATEMENT_TIMEOUT_MS.
+    """
+    budgets = configuration_variables.db_handler_statement_timeouts_ms
+    if not budgets:
+        return
+
+    @event.listens_for(session_class, "after_begin")
+    def set_handler_timeout(session, transaction, connection):
+        handler = current_handler()
+        timeout_ms = budgets.get(handler) if handler is not None else None
+        if timeout_ms is not None:
+            connection.execute(_SET_TIMEOUT, {"timeout": str(timeout_ms)})
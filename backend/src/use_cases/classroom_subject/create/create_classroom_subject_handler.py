@@ -1,54 +1,46 @@
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 from uuid import UUID
 
 from ...shared.base_auth_handler import BaseAuthHandler
 from .create_classroom_subject_request import CreateClassroomSubjectRequest
 from .create_classroom_subject_response import CreateClassroomSubjectResponse
 from ....models.classroom_subject import ClassroomSubject
+from ....persistence.errors import foreign_key_violation_column
+
+NOT_FOUND_BY_COLUMN = {
+    "classroom_id": "Classroom not found",
+    "subject_id": "Subject not found",
+    "teacher_id": "Teacher not found",
+    "substitute_teacher_id": "Substitute teacher not found",
+}
 
 
 class CreateClassroomSubjectHandler(BaseAuthHandler[CreateClassroomSubjectRequest, CreateClassroomSubjectResponse]):
     async def execute(self, request: CreateClassroomSubjectRequest) -> CreateClassroomSubjectResponse:
-        classroom_id = UUID(request.classroom_id)
-        classroom = await self.unit_of_work.classroom_repository.get_by_id(classroom_id)
-        if not classroom:
-            raise HTTPException(status_code=404, detail="Classroom not found")
-
-        subject = await self.unit_of_work.subject_repository.get_by_id(request.subject_id)
-        if not subject:
-            raise HTTPException(status_code=404, detail="Subject not found")
-
-        teacher_id = None
-        if request.teacher_id:
-            teacher_id = UUID(request.teacher_id)
-            teacher = await self.unit_of_work.teacher_repository.get_by_id(teacher_id)
-            if not teacher:
-                raise HTTPException(status_code=404, detail="Teacher not found")
-
-        substitute_teacher_id = None
-        if request.substitute_teacher_id:
-            substitute_teacher_id = UUID(request.substitute_teacher_id)
-            substitute_teacher = await self.unit_of_work.teacher_repository.get_by_id(substitute_teacher_id)
-            if not substitute_teacher:
-                raise HTTPException(status_code=404, detail="Substitute teacher not found")
-
-        # Check if already exists
-        existing = await self.unit_of_work.classroom_subject_repository.get_by_classroom_and_subject(
-            classroom_id, request.subject_id
-        )
-        if existing:
-            raise HTTPException(status_code=400, detail="Classroom-subject relation already exists")
-
         classroom_subject = ClassroomSubject(
-            classroom_id=classroom_id,
+            classroom_id=UUID(request.classroom_id),
             subject_id=request.subject_id,
-            teacher_id=teacher_id,
-            substitute_teacher_id=substitute_teacher_id,
+            teacher_id=UUID(request.teacher_id) if request.teacher_id else None,
+            substitute_teacher_id=UUID(request.substitute_teacher_id) if request.substitute_teacher_id else None,
             is_active=request.is_active,
         )
 
-        created = await self.unit_of_work.classroom_subject_repository.create(classroom_subject)
-        
+        # One INSERT ... ON CONFLICT: the foreign keys replace the existence checks
+        # and the partial unique index replaces the duplicate check
+        try:
+            created = await self.unit_of_work.classroom_subject_repository.create_if_not_exists(classroom_subject)
+            await self.unit_of_work.commit()
+        except IntegrityError as error:
+            await self.unit_of_work.rollback()
+            detail = NOT_FOUND_BY_COLUMN.get(foreign_key_violation_column(error))
+            if detail is None:
+                raise
+            raise HTTPException(status_code=404, detail=detail)
+
+        if created is None:
+            raise HTTPException(status_code=400, detail="Classroom-subject relation already exists")
+
         return CreateClassroomSubjectResponse(
             id=created.id,
             classroom_id=str(created.classroom_id),
@@ -57,4 +49,3 @@ class CreateClassroomSubjectHandler(BaseAuthHandler[CreateClassroomSubjectReques
             substitute_teacher_id=str(created.substitute_teacher_id) if created.substitute_teacher_id else None,
             is_active=created.is_active,
         )
-
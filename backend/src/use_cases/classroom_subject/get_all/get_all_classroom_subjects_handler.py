@@ -1,16 +1,21 @@
-from ...shared.base_auth_handler import BaseAuthHandler
+from ...shared.base_read_handler import BaseReadHandler
 from ....persistence.unit_of_work import UnitOfWork
 from .get_all_classroom_subjects_request import GetAllClassroomSubjectsRequest
 from .get_all_classroom_subjects_response import GetAllClassroomSubjectsResponse, ClassroomSubjectSummary
 
 
-class GetAllClassroomSubjectsHandler(BaseAuthHandler[GetAllClassroomSubjectsRequest, GetAllClassroomSubjectsResponse]):
+class GetAllClassroomSubjectsHandler(BaseReadHandler[GetAllClassroomSubjectsRequest, GetAllClassroomSubjectsResponse]):
     async def execute(self, request: GetAllClassroomSubjectsRequest) -> GetAllClassroomSubjectsResponse:
         unit_of_work = UnitOfWork(self.session)
-        classroom_subjects = await unit_of_work.classroom_subject_repository.get_all_with_relations()
+        page = await unit_of_work.classroom_subject_repository.get_page_with_relations(
+            request.limit, request.cursor
+        )
+        student_counts = await unit_of_work.classroom_subject_student_repository.count_active_by_classroom_subject(
+            [cs.id for cs in page.items]
+        )
 
         summaries = []
-        for cs in classroom_subjects:
+        for cs in page.items:
             teacher_name = None
             if cs.teacher:
                 teacher_name = f"{cs.teacher.names} {cs.teacher.father_last_name or ''}".strip()
@@ -19,8 +24,6 @@ class GetAllClassroomSubjectsHandler(BaseAuthHandler[GetAllClassroomSubjectsRequ
             if cs.substitute_teacher:
                 substitute_teacher_name = f"{cs.substitute_teacher.names} {cs.substitute_teacher.father_last_name or ''}".strip()
             
-            student_count = len([s for s in cs.students if s.is_active]) if cs.students else 0
-            
             summaries.append(
                 ClassroomSubjectSummary(
                     id=cs.id,
@@ -33,8 +36,8 @@ class GetAllClassroomSubjectsHandler(BaseAuthHandler[GetAllClassroomSubjectsRequ
                     substitute_teacher_id=str(cs.substitute_teacher_id) if cs.substitute_teacher_id else None,
                     substitute_teacher_name=substitute_teacher_name,
                     is_active=cs.is_active,
-                    student_count=student_count,
+                    student_count=student_counts.get(cs.id, 0),
                 )
             )
-        return GetAllClassroomSubjectsResponse(classroom_subjects=summaries)
+        return GetAllClassroomSubjectsResponse(classroom_subjects=summaries, next_cursor=page.next_cursor)
 
@@ -1,6 +1,9 @@
+from typing import Optional
+
 from ...shared.base_data_transfer import BaseDataTransfer
 
 
 class GetAllClassroomSubjectsRequest(BaseDataTransfer):
-    pass
+    limit: int
+    cursor: Optional[str] = None
 
@@ -19,4 +19,5 @@ class ClassroomSubjectSummary(BaseDataTransfer):
 
 class GetAllClassroomSubjectsResponse(BaseDataTransfer):
     classroom_subjects: List[ClassroomSubjectSummary]
+    next_cursor: Optional[str] = None
 
@@ -1,42 +1,34 @@
 from fastapi import HTTPException
 
-from ...shared.base_auth_handler import BaseAuthHandler
+from ...shared.base_read_handler import BaseReadHandler
 from ....persistence.unit_of_work import UnitOfWork
 from .get_all_classroom_subject_students_request import GetAllClassroomSubjectStudentsRequest
 from .get_all_classroom_subject_students_response import GetAllClassroomSubjectStudentsResponse, ClassroomSubjectStudentSummary
 
 
-class GetAllClassroomSubjectStudentsHandler(BaseAuthHandler[GetAllClassroomSubjectStudentsRequest, GetAllClassroomSubjectStudentsResponse]):
+class GetAllClassroomSubjectStudentsHandler(BaseReadHandler[GetAllClassroomSubjectStudentsRequest, GetAllClassroomSubjectStudentsResponse]):
     async def execute(self, request: GetAllClassroomSubjectStudentsRequest) -> GetAllClassroomSubjectStudentsResponse:
         unit_of_work = UnitOfWork(self.session)
         
-        classroom_subject = await unit_of_work.classroom_subject_repository.get_by_id(request.classroom_subject_id)
-        if not classroom_subject:
+        if not await unit_of_work.classroom_subject_repository.exists(request.classroom_subject_id):
             raise HTTPException(status_code=404, detail="Classroom-subject not found")
         
-        enrollments = await unit_of_work.classroom_subject_student_repository.get_for_classroom_subject(
-            request.classroom_subject_id,
-            with_relations=True,
-            only_active=False,  # Show all students, active and inactive
+        # Show all students, active and inactive; only the listed columns are loaded
+        rows = await unit_of_work.classroom_subject_student_repository.get_roster_rows(
+            request.classroom_subject_id
         )
 
-        summaries = []
-        for enrollment in enrollments:
-            student = enrollment.student
-            if not student:
-                continue
-            
-            summaries.append(
-                ClassroomSubjectStudentSummary(
-                    id=enrollment.id,
-                    student_id=str(student.id),
-                    student_code=student.code,
-                    student_name=f"{student.names} {student.father_last_name or ''} {student.mother_last_name or ''}".strip(),
-                    student_email=student.email,
-                    status=enrollment.status,
-                    is_active=enrollment.is_active,
-                    qualification=enrollment.qualification,
-                )
+        summaries = [
+            ClassroomSubjectStudentSummary(
+                id=row.id,
+                student_id=str(row.student_id),
+                student_code=row.student_code,
+                student_name=f"{row.names} {row.father_last_name or ''} {row.mother_last_name or ''}".strip(),
+                student_email=row.student_email,
+                status=row.status,
+                is_active=row.is_active,
+                qualification=row.qualification,
             )
+            for row in rows
+        ]
         return GetAllClassroomSubjectStudentsResponse(students=summaries)
-
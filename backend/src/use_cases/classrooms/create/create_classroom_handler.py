@@ -2,6 +2,8 @@ from ...shared.base_auth_handler import BaseAuthHandler
 from .create_classroom_request import CreateClassroomRequest
 from .create_classroom_response import CreateClassroomResponse
 from ....models.classrooms import Classroom
+from ....services.cache_invalidation import REFERENCE
+from ....services.reference_cache import CLASSROOMS
 
 
 class CreateClassroomHandler(BaseAuthHandler[CreateClassroomRequest, CreateClassroomResponse]):
@@ -16,6 +18,8 @@ class CreateClassroomHandler(BaseAuthHandler[CreateClassroomRequest, CreateClass
         )
 
         created = await self.unit_of_work.classroom_repository.create(classroom)
+        await self.unit_of_work.invalidate(REFERENCE, CLASSROOMS)
+        await self.unit_of_work.commit()
         return CreateClassroomResponse(
             id=str(created.id),
             description=created.description,
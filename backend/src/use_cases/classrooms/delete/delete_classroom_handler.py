@@ -4,6 +4,8 @@ from uuid import UUID
 from ...shared.base_auth_handler import BaseAuthHandler
 from .delete_classroom_request import DeleteClassroomRequest
 from .delete_classroom_response import DeleteClassroomResponse
+from ....services.cache_invalidation import REFERENCE
+from ....services.reference_cache import CLASSROOMS
 
 
 class DeleteClassroomHandler(BaseAuthHandler[DeleteClassroomRequest, DeleteClassroomResponse]):
@@ -15,6 +17,8 @@ class DeleteClassroomHandler(BaseAuthHandler[DeleteClassroomRequest, DeleteClass
             raise HTTPException(status_code=404, detail="Classroom not found")
 
         await self.unit_of_work.classroom_repository.delete(classroom_id)
+        await self.unit_of_work.invalidate(REFERENCE, CLASSROOMS)
+        await self.unit_of_work.commit()
         
         return DeleteClassroomResponse(deleted=True, classroom_id=request.classroom_id)
 
@@ -1,16 +1,26 @@
 from ...shared.base_handler import BaseHandler
 from ....persistence.unit_of_work import UnitOfWork
+from ....services.reference_cache import CLASSROOMS, reference_data_cache
 from .get_all_classrooms_request import GetAllClassroomsRequest
 from .get_all_classrooms_response import GetAllClassroomsResponse, ClassroomSummary
 
 
+# Misses read the primary: a lagging replica could otherwise pin rows from before
+# a bump under the new version
 class GetAllClassroomsHandler(BaseHandler[GetAllClassroomsRequest, GetAllClassroomsResponse]):
     async def execute(self, request: GetAllClassroomsRequest) -> GetAllClassroomsResponse:
+        return await reference_data_cache.get_or_load(
+            CLASSROOMS, (request.limit, request.cursor), lambda: self._load(request)
+        )
+
+    async def _load(self, request: GetAllClassroomsRequest) -> GetAllClassroomsResponse:
         unit_of_work = UnitOfWork(self.session)
-        classrooms = await unit_of_work.classroom_repository.get_all_with_relations()
+        page = await unit_of_work.classroom_repository.get_page_with_relations(
+            request.limit, request.cursor
+        )
 
         summaries = []
-        for classroom in classrooms:
+        for classroom in page.items:
             tutor_name = None
             if classroom.tutor:
                 tutor_name = f"{classroom.tutor.names} {classroom.tutor.father_last_name or ''}".strip()
@@ -25,5 +35,5 @@ class GetAllClassroomsHandler(BaseHandler[GetAllClassroomsRequest, GetAllClassro
                     tutor_name=tutor_name,
                 )
             )
-        return GetAllClassroomsResponse(classrooms=summaries)
+        return GetAllClassroomsResponse(classrooms=summaries, next_cursor=page.next_cursor)
 
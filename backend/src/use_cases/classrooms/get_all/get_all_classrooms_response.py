@@ -14,4 +14,5 @@ class ClassroomSummary(BaseDataTransfer):
 
 class GetAllClassroomsResponse(BaseDataTransfer):
     classrooms: List[ClassroomSummary]
+    next_cursor: Optional[str] = None
 
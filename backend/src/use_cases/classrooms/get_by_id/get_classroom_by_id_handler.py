@@ -1,12 +1,12 @@
 from fastapi import HTTPException
 from uuid import UUID
 
-from ...shared.base_auth_handler import BaseAuthHandler
+from ...shared.base_read_handler import BaseReadHandler
 from .get_classroom_by_id_request import GetClassroomByIdRequest
 from .get_classroom_by_id_response import GetClassroomByIdResponse
 
 
-class GetClassroomByIdHandler(BaseAuthHandler[GetClassroomByIdRequest, GetClassroomByIdResponse]):
+class GetClassroomByIdHandler(BaseReadHandler[GetClassroomByIdRequest, GetClassroomByIdResponse]):
     async def execute(self, request: GetClassroomByIdRequest) -> GetClassroomByIdResponse:
         classroom_id = UUID(request.id)
         classroom = await self.unit_of_work.classroom_repository.get_by_id(classroom_id)
@@ -4,6 +4,8 @@ from uuid import UUID
 from ...shared.base_auth_handler import BaseAuthHandler
 from .update_classroom_request import UpdateClassroomRequest
 from .update_classroom_response import UpdateClassroomResponse
+from ....services.cache_invalidation import REFERENCE
+from ....services.reference_cache import CLASSROOMS
 
 
 class UpdateClassroomHandler(BaseAuthHandler[UpdateClassroomRequest, UpdateClassroomResponse]):
@@ -31,6 +33,8 @@ class UpdateClassroomHandler(BaseAuthHandler[UpdateClassroomRequest, UpdateClass
             classroom.tutor_id = request.tutor_id
 
         updated = await self.unit_of_work.classroom_repository.update(classroom)
+        await self.unit_of_work.invalidate(REFERENCE, CLASSROOMS)
+        await self.unit_of_work.commit()
         
         return UpdateClassroomResponse(
             id=str(updated.id),
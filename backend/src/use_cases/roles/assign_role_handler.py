@@ -1,6 +1,7 @@
 from ..shared.base_auth_handler import BaseAuthHandler
 from .assign_role_request import AssignRoleRequest
 from .assign_role_response import AssignRoleResponse
+from ...services.cache_invalidation import AUTH_USER
 from fastapi import HTTPException
 
 
@@ -24,6 +25,9 @@ class AssignRoleHandler(BaseAuthHandler[AssignRoleRequest, AssignRoleResponse]):
             await self.unit_of_work.user_role_relation_repository.link(
                 user.id, role.id, request.relation_type or "direct"
             )
+            await self.unit_of_work.user_repository.bump_token_version(user.id)
+            await self.unit_of_work.invalidate(AUTH_USER, user.id)
+            await self.unit_of_work.commit()
 
         return AssignRoleResponse(
             user_id=str(user.id), role_id=role.id, role_code=role.code
@@ -1,6 +1,7 @@
 from ..shared.base_auth_handler import BaseAuthHandler
 from .assign_permission_request import AssignPermissionRequest
 from .assign_permission_response import AssignPermissionResponse
+from ...services.cache_invalidation import AUTH_ALL
 from fastapi import HTTPException
 
 
@@ -24,6 +25,10 @@ class AssignPermissionHandler(BaseAuthHandler[AssignPermissionRequest, AssignPer
             await self.unit_of_work.role_permission_relation_repository.link(
                 role.id, permission.id, request.relation_type or "direct"
             )
+            # Every user holding the role is affected, so drop all cached contexts
+            await self.unit_of_work.user_repository.bump_token_version_for_role(role.id)
+            await self.unit_of_work.invalidate(AUTH_ALL)
+            await self.unit_of_work.commit()
 
         return AssignPermissionResponse(
             role_id=role.id,
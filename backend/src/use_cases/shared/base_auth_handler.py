@@ -1,10 +1,11 @@
 from abc import abstractmethod
 from typing import Generic, TypeVar
-from ...database import AsyncSQLSession
+from ...database import AsyncSessionFactory, LazySession, releases_session
 from .base_data_transfer import BaseDataTransfer
 from fastapi import Depends
-from ...services.auth import AuthService
+from ...services.auth import AuthService, get_auth_service
 from ...persistence.unit_of_work import UnitOfWork
+from ...query_stats import track_handler
 
 TRequest = TypeVar("TRequest", bound=BaseDataTransfer)
 TResponse = TypeVar("TResponse", bound=BaseDataTransfer)
@@ -13,13 +14,18 @@ TResponse = TypeVar("TResponse", bound=BaseDataTransfer)
 class BaseAuthHandler(Generic[TRequest, TResponse]):
     def __init__(
         self,
-        session: AsyncSQLSession,
-        auth_service: AuthService = Depends(AuthService),
+        session_factory: AsyncSessionFactory,
+        auth_service: AuthService = Depends(get_auth_service),
     ):
-        self.session = session
+        self.session = LazySession(session_factory)
         self.auth_service = auth_service
-        self.unit_of_work = UnitOfWork(session)
+        self.unit_of_work = UnitOfWork(self.session)
         
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "execute" in cls.__dict__:
+            cls.execute = track_handler(releases_session(cls.__dict__["execute"]))
+
     @abstractmethod
     async def execute(self, request: TRequest) -> TResponse:
         pass
@@ -2,7 +2,8 @@ from abc import abstractmethod
 from typing import Generic, TypeVar
 
 from ...persistence.unit_of_work import UnitOfWork
-from ...database import AsyncSQLSession
+from ...query_stats import track_handler
+from ...database import AsyncSessionFactory, LazySession, releases_session
 from .base_data_transfer import BaseDataTransfer
 from fastapi import Depends
 
@@ -14,11 +15,16 @@ class BaseHandler(Generic[TRequest, TResponse]):
 
     def __init__(
         self,
-        session: AsyncSQLSession,
+        session_factory: AsyncSessionFactory,
     ):
-        self.session = session
-        self.unit_of_work = UnitOfWork(session)
+        self.session = LazySession(session_factory)
+        self.unit_of_work = UnitOfWork(self.session)
         
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "execute" in cls.__dict__:
+            cls.execute = track_handler(releases_session(cls.__dict__["execute"]))
+
     @abstractmethod
     async def execute(self, request: TRequest) -> TResponse:
         pass
@@ -0,0 +1,33 @@
+from abc import abstractmethod
+from typing import Generic, TypeVar
+
+from ...persistence.unit_of_work import UnitOfWork
+from ...query_stats import track_handler
+from ...database import AsyncReadSessionFactory, LazySession, releases_session
+from .base_data_transfer import BaseDataTransfer
+
+TRequest = TypeVar("TRequest", bound=BaseDataTransfer)
+TResponse = TypeVar("TResponse", bound=BaseDataTransfer)
+
+
+class BaseReadHandler(Generic[TRequest, TResponse]):
+    """
+    Base for read-only use cases. The session comes from the replica pool when
+    one is configured, unless the caller wrote recently (read-your-writes).
+    """
+
+    def __init__(
+        self,
+        session_factory: AsyncReadSessionFactory,
+    ):
+        self.session = LazySession(session_factory)
+        self.unit_of_work = UnitOfWork(self.session)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "execute" in cls.__dict__:
+            cls.execute = track_handler(releases_session(cls.__dict__["execute"]))
+
+    @abstractmethod
+    async def execute(self, request: TRequest) -> TResponse:
+        pass
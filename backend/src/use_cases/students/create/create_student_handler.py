@@ -6,6 +6,7 @@ from .create_student_request import CreateStudentRequest
 from .create_student_response import CreateStudentResponse
 from ....models.students import Student
 from ....models.user import User
+from ....services.cache_invalidation import AUTH_USER
 
 
 class CreateStudentHandler(BaseAuthHandler[CreateStudentRequest, CreateStudentResponse]):
@@ -19,7 +20,7 @@ class CreateStudentHandler(BaseAuthHandler[CreateStudentRequest, CreateStudentRe
                 raise HTTPException(status_code=400, detail="Email already registered")
             
             # Create user
-            hashed = self.auth_service.get_password_hash(request.user_password)
+            hashed = await self.auth_service.get_password_hash_async(request.user_password)
             user = User(
                 name=request.names,
                 last_name=request.father_last_name or "",
@@ -58,6 +59,10 @@ class CreateStudentHandler(BaseAuthHandler[CreateStudentRequest, CreateStudentRe
         )
 
         created = await self.unit_of_work.student_repository.create(student)
+        # The user now resolves to a student profile
+        await self.unit_of_work.user_repository.bump_token_version(created.user_id)
+        await self.unit_of_work.invalidate(AUTH_USER, created.user_id)
+        await self.unit_of_work.commit()
         return CreateStudentResponse(
             id=str(created.id),
             code=created.code,
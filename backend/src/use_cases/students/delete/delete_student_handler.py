@@ -4,6 +4,7 @@ from uuid import UUID
 from ...shared.base_auth_handler import BaseAuthHandler
 from .delete_student_request import DeleteStudentRequest
 from .delete_student_response import DeleteStudentResponse
+from ....services.cache_invalidation import AUTH_USER
 
 
 class DeleteStudentHandler(BaseAuthHandler[DeleteStudentRequest, DeleteStudentResponse]):
@@ -15,6 +16,9 @@ class DeleteStudentHandler(BaseAuthHandler[DeleteStudentRequest, DeleteStudentRe
             raise HTTPException(status_code=404, detail="Student not found")
 
         await self.unit_of_work.student_repository.delete(student_id)
+        await self.unit_of_work.user_repository.bump_token_version(student.user_id)
+        await self.unit_of_work.invalidate(AUTH_USER, student.user_id)
+        await self.unit_of_work.commit()
         
         return DeleteStudentResponse(deleted=True, student_id=request.student_id)
 
@@ -2,7 +2,7 @@ from io import BytesIO
 from fastapi import HTTPException
 from fastapi.responses import Response
 
-from ...shared.base_auth_handler import BaseAuthHandler
+from ...shared.base_read_handler import BaseReadHandler
 from ....persistence.unit_of_work import UnitOfWork
 from .generate_notes_pdf_request import GenerateNotesPdfRequest
 
@@ -13,7 +13,7 @@ except ImportError:
     FPDF_AVAILABLE = False
 
 
-class GenerateNotesPdfHandler(BaseAuthHandler[GenerateNotesPdfRequest, Response]):
+class GenerateNotesPdfHandler(BaseReadHandler[GenerateNotesPdfRequest, Response]):
     async def execute(self, request: GenerateNotesPdfRequest) -> Response:
         if not FPDF_AVAILABLE:
             raise HTTPException(
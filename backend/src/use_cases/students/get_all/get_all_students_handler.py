@@ -1,26 +1,26 @@
-from ...shared.base_handler import BaseHandler
+from ...shared.base_read_handler import BaseReadHandler
 from ....persistence.unit_of_work import UnitOfWork
 from .get_all_students_request import GetAllStudentsRequest
 from .get_all_students_response import GetAllStudentsResponse, StudentSummary
 
 
-class GetAllStudentsHandler(BaseHandler[GetAllStudentsRequest, GetAllStudentsResponse]):
+class GetAllStudentsHandler(BaseReadHandler[GetAllStudentsRequest, GetAllStudentsResponse]):
     async def execute(self, request: GetAllStudentsRequest) -> GetAllStudentsResponse:
         unit_of_work = UnitOfWork(self.session)
-        students = await unit_of_work.student_repository.get_all()
+        page = await unit_of_work.student_repository.get_summary_page(request.limit, request.cursor)
 
         summaries = [
             StudentSummary(
-                id=str(student.id),
-                code=student.code,
-                names=student.names,
-                father_last_name=student.father_last_name,
-                mother_last_name=student.mother_last_name,
-                email=student.email,
+                id=str(row.id),
+                code=row.code,
+                names=row.names,
+                father_last_name=row.father_last_name,
+                mother_last_name=row.mother_last_name,
+                email=row.email,
             )
-            for student in students
+            for row in page.items
         ]
 
-        return GetAllStudentsResponse(students=summaries)
+        return GetAllStudentsResponse(students=summaries, next_cursor=page.next_cursor)
 
 
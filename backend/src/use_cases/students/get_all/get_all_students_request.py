@@ -1,7 +1,10 @@
+from typing import Optional
+
 from ...shared.base_data_transfer import BaseDataTransfer
 
 
 class GetAllStudentsRequest(BaseDataTransfer):
-    pass
+    limit: int
+    cursor: Optional[str] = None
 
 
@@ -14,5 +14,6 @@ class StudentSummary(BaseDataTransfer):
 
 class GetAllStudentsResponse(BaseDataTransfer):
     students: List[StudentSummary]
+    next_cursor: Optional[str] = None
 
 
@@ -1,10 +1,10 @@
-from ...shared.base_auth_handler import BaseAuthHandler
+from ...shared.base_read_handler import BaseReadHandler
 from .get_student_by_id_request import GetStudentByIdRequest
 from .get_student_by_id_response import GetStudentByIdResponse
 from fastapi import HTTPException
 
 
-class GetStudentByIdHandler(BaseAuthHandler[GetStudentByIdRequest, GetStudentByIdResponse]):
+class GetStudentByIdHandler(BaseReadHandler[GetStudentByIdRequest, GetStudentByIdResponse]):
     async def execute(self, request: GetStudentByIdRequest) -> GetStudentByIdResponse:
         student = await self.unit_of_work.student_repository.get_by_id(
             str(request.id)
@@ -0,0 +1,40 @@
+from ...shared.base_handler import BaseHandler
+from ....services.grade_fingerprints import grade_fingerprint_cache
+from .get_student_grades_fingerprint_request import (
+    GetStudentGradesFingerprintRequest,
+)
+from .get_student_grades_fingerprint_response import (
+    GetStudentGradesFingerprintResponse,
+)
+
+
+class GetStudentGradesFingerprintHandler(
+    BaseHandler[
+        GetStudentGradesFingerprintRequest, GetStudentGradesFingerprintResponse
+    ]
+):
+    """
+    Change fingerprint of a student's subjects and grades, so a polling client
+    can be answered 304 without building the full enrollment graph. Cached
+    per student until a grade or enrollment write bumps it. Misses read the
+    primary: a lagging replica could otherwise pin the fingerprint from before
+    a bump under the new version.
+    """
+
+    async def execute(
+        self, request: GetStudentGradesFingerprintRequest
+    ) -> GetStudentGradesFingerprintResponse:
+        fingerprint = await grade_fingerprint_cache.get_or_load(
+            str(request.student_id),
+            request.include_inactive,
+            lambda: self._load(request),
+        )
+        return GetStudentGradesFingerprintResponse(fingerprint=fingerprint)
+
+    async def _load(self, request: GetStudentGradesFingerprintRequest) -> str:
+        return await (
+            self.unit_of_work.classroom_subject_student_repository.get_student_fingerprint(
+                request.student_id,
+                only_active=not request.include_inactive,
+            )
+        )
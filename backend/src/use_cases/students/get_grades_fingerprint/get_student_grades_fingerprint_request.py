@@ -0,0 +1,8 @@
+from uuid import UUID
+
+from ...shared.base_data_transfer import BaseDataTransfer
+
+
+class GetStudentGradesFingerprintRequest(BaseDataTransfer):
+    student_id: UUID
+    include_inactive: bool = False
@@ -0,0 +1,5 @@
+from ...shared.base_data_transfer import BaseDataTransfer
+
+
+class GetStudentGradesFingerprintResponse(BaseDataTransfer):
+    fingerprint: str
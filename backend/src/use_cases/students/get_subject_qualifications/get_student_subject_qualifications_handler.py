@@ -11,6 +11,8 @@ from .get_student_subject_qualifications_response import (
 )
 
 
+# Reads the primary, like its grade fingerprint: a lagging replica could
+# otherwise serve rows from before a write under the ETag that follows it
 class GetStudentSubjectQualificationsHandler(
     BaseHandler[
         GetStudentSubjectQualificationsRequest,
@@ -1,4 +1,4 @@
-from ...shared.base_auth_handler import BaseAuthHandler
+from ...shared.base_handler import BaseHandler
 from .get_student_subjects_request import GetStudentSubjectsRequest
 from .get_student_subjects_response import (
     GetStudentSubjectsResponse,
@@ -6,8 +6,10 @@ from .get_student_subjects_response import (
 )
 
 
+# Reads the primary, like its grade fingerprint: a lagging replica could
+# otherwise serve rows from before a write under the ETag that follows it
 class GetStudentSubjectsHandler(
-    BaseAuthHandler[GetStudentSubjectsRequest, GetStudentSubjectsResponse]
+    BaseHandler[GetStudentSubjectsRequest, GetStudentSubjectsResponse]
 ):
     async def execute(
         self, request: GetStudentSubjectsRequest
@@ -47,6 +47,7 @@ class UpdateStudentHandler(BaseAuthHandler[UpdateStudentRequest, UpdateStudentRe
             student.responsible_address = request.responsible_address
 
         updated = await self.unit_of_work.student_repository.update(student)
+        await self.unit_of_work.commit()
         
         return UpdateStudentResponse(
             id=str(updated.id),
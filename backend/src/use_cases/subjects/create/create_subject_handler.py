@@ -2,6 +2,8 @@ from ...shared.base_auth_handler import BaseAuthHandler
 from .create_subject_request import CreateSubjectRequest
 from .create_subject_response import CreateSubjectResponse
 from ....models.subjects import Subject
+from ....services.cache_invalidation import REFERENCE
+from ....services.reference_cache import SUBJECTS
 
 
 class CreateSubjectHandler(BaseAuthHandler[CreateSubjectRequest, CreateSubjectResponse]):
@@ -12,6 +14,8 @@ class CreateSubjectHandler(BaseAuthHandler[CreateSubjectRequest, CreateSubjectRe
         )
 
         created = await self.unit_of_work.subject_repository.create(subject)
+        await self.unit_of_work.invalidate(REFERENCE, SUBJECTS)
+        await self.unit_of_work.commit()
         return CreateSubjectResponse(
             id=created.id,
             name=created.name,
@@ -3,6 +3,8 @@ from fastapi import HTTPException
 from ...shared.base_auth_handler import BaseAuthHandler
 from .delete_subject_request import DeleteSubjectRequest
 from .delete_subject_response import DeleteSubjectResponse
+from ....services.cache_invalidation import REFERENCE
+from ....services.reference_cache import SUBJECTS
 
 
 class DeleteSubjectHandler(BaseAuthHandler[DeleteSubjectRequest, DeleteSubjectResponse]):
@@ -13,6 +15,8 @@ class DeleteSubjectHandler(BaseAuthHandler[DeleteSubjectRequest, DeleteSubjectRe
             raise HTTPException(status_code=404, detail="Subject not found")
 
         await self.unit_of_work.subject_repository.delete(request.subject_id)
+        await self.unit_of_work.invalidate(REFERENCE, SUBJECTS)
+        await self.unit_of_work.commit()
         
         return DeleteSubjectResponse(deleted=True, subject_id=request.subject_id)
 
@@ -1,13 +1,21 @@
 from ...shared.base_handler import BaseHandler
 from ....persistence.unit_of_work import UnitOfWork
+from ....services.reference_cache import SUBJECTS, reference_data_cache
 from .get_all_subjects_request import GetAllSubjectsRequest
 from .get_all_subjects_response import GetAllSubjectsResponse, SubjectSummary
 
 
+# Misses read the primary: a lagging replica could otherwise pin rows from before
+# a bump under the new version
 class GetAllSubjectsHandler(BaseHandler[GetAllSubjectsRequest, GetAllSubjectsResponse]):
     async def execute(self, request: GetAllSubjectsRequest) -> GetAllSubjectsResponse:
+        return await reference_data_cache.get_or_load(
+            SUBJECTS, (request.limit, request.cursor), lambda: self._load(request)
+        )
+
+    async def _load(self, request: GetAllSubjectsRequest) -> GetAllSubjectsResponse:
         unit_of_work = UnitOfWork(self.session)
-        subjects = await unit_of_work.subject_repository.get_all()
+        page = await unit_of_work.subject_repository.get_page(request.limit, request.cursor)
 
         summaries = [
             SubjectSummary(
@@ -15,8 +23,6 @@ class GetAllSubjectsHandler(BaseHandler[GetAllSubjectsRequest, GetAllSubjectsRes
                 name=subject.name,
                 description=subject.description,
             )
-            for subject in subjects
+            for subject in page.items
         ]
-        return GetAllSubjectsResponse(subjects=summaries)
-
-
+        return GetAllSubjectsResponse(subjects=summaries, next_cursor=page.next_cursor)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from ...shared.base_data_transfer import BaseDataTransfer
 
@@ -11,5 +11,6 @@ class SubjectSummary(BaseDataTransfer):
 
 class GetAllSubjectsResponse(BaseDataTransfer):
     subjects: List[SubjectSummary]
+    next_cursor: Optional[str] = None
 
 
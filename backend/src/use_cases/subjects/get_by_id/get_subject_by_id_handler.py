@@ -1,11 +1,11 @@
 from fastapi import HTTPException
 
-from ...shared.base_auth_handler import BaseAuthHandler
+from ...shared.base_read_handler import BaseReadHandler
 from .get_subject_by_id_request import GetSubjectByIdRequest
 from .get_subject_by_id_response import GetSubjectByIdResponse
 
 
-class GetSubjectByIdHandler(BaseAuthHandler[GetSubjectByIdRequest, GetSubjectByIdResponse]):
+class GetSubjectByIdHandler(BaseReadHandler[GetSubjectByIdRequest, GetSubjectByIdResponse]):
     async def execute(self, request: GetSubjectByIdRequest) -> GetSubjectByIdResponse:
         subject = await self.unit_of_work.subject_repository.get_by_id(request.id)
         
@@ -3,6 +3,8 @@ from fastapi import HTTPException
 from ...shared.base_auth_handler import BaseAuthHandler
 from .update_subject_request import UpdateSubjectRequest
 from .update_subject_response import UpdateSubjectResponse
+from ....services.cache_invalidation import REFERENCE
+from ....services.reference_cache import SUBJECTS
 
 
 class UpdateSubjectHandler(BaseAuthHandler[UpdateSubjectRequest, UpdateSubjectResponse]):
@@ -21,6 +23,8 @@ class UpdateSubjectHandler(BaseAuthHandler[UpdateSubjectRequest, UpdateSubjectRe
             subject.description = request.description
 
         updated = await self.unit_of_work.subject_repository.update(subject)
+        await self.unit_of_work.invalidate(REFERENCE, SUBJECTS)
+        await self.unit_of_work.commit()
         
         return UpdateSubjectResponse(
             id=updated.id,
@@ -6,6 +6,7 @@ from .create_teacher_request import CreateTeacherRequest
 from .create_teacher_response import CreateTeacherResponse
 from ....models.teachers import Teacher
 from ....models.user import User
+from ....services.cache_invalidation import AUTH_USER
 
 
 class CreateTeacherHandler(BaseAuthHandler[CreateTeacherRequest, CreateTeacherResponse]):
@@ -19,7 +20,7 @@ class CreateTeacherHandler(BaseAuthHandler[CreateTeacherRequest, CreateTeacherRe
                 raise HTTPException(status_code=400, detail="Email already registered")
             
             # Create user
-            hashed = self.auth_service.get_password_hash(request.user_password)
+            hashed = await self.auth_service.get_password_hash_async(request.user_password)
             user = User(
                 name=request.names,
                 last_name=request.father_last_name or "",
@@ -50,6 +51,10 @@ class CreateTeacherHandler(BaseAuthHandler[CreateTeacherRequest, CreateTeacherRe
         )
         
         created = await self.unit_of_work.teacher_repository.create(teacher)
+        # The user now resolves to a teacher profile
+        await self.unit_of_work.user_repository.bump_token_version(created.user_id)
+        await self.unit_of_work.invalidate(AUTH_USER, created.user_id)
+        await self.unit_of_work.commit()
         return CreateTeacherResponse(
             id=str(created.id),
             names=created.names,
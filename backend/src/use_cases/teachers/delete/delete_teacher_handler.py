@@ -4,6 +4,8 @@ from uuid import UUID
 from ...shared.base_auth_handler import BaseAuthHandler
 from .delete_teacher_request import DeleteTeacherRequest
 from .delete_teacher_response import DeleteTeacherResponse
+from ....services.cache_invalidation import AUTH_USER, REFERENCE
+from ....services.reference_cache import CLASSROOMS
 
 
 class DeleteTeacherHandler(BaseAuthHandler[DeleteTeacherRequest, DeleteTeacherResponse]):
@@ -15,6 +17,10 @@ class DeleteTeacherHandler(BaseAuthHandler[DeleteTeacherRequest, DeleteTeacherRe
             raise HTTPException(status_code=404, detail="Teacher not found")
 
         await self.unit_of_work.teacher_repository.delete(teacher_id)
+        await self.unit_of_work.user_repository.bump_token_version(teacher.user_id)
+        await self.unit_of_work.invalidate(AUTH_USER, teacher.user_id)
+        await self.unit_of_work.invalidate(REFERENCE, CLASSROOMS)
+        await self.unit_of_work.commit()
         
         return DeleteTeacherResponse(deleted=True, teacher_id=request.teacher_id)
 
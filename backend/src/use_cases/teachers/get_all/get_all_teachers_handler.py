@@ -1,10 +1,10 @@
-from ...shared.base_handler import BaseHandler
+from ...shared.base_read_handler import BaseReadHandler
 from .get_all_teachers_request import GetAllTeachersRequest
 from .get_all_teachers_response import GetAllTeachersResponse, TeacherSummary
 
-class GetAllTeachersHandler(BaseHandler[GetAllTeachersRequest, GetAllTeachersResponse]):
+class GetAllTeachersHandler(BaseReadHandler[GetAllTeachersRequest, GetAllTeachersResponse]):
     async def execute(self, request: GetAllTeachersRequest) -> GetAllTeachersResponse:
-        teachers = await self.unit_of_work.teacher_repository.get_all()
+        page = await self.unit_of_work.teacher_repository.get_page(request.limit, request.cursor)
         
         teacher_summaries = [
             TeacherSummary(
@@ -15,7 +15,7 @@ class GetAllTeachersHandler(BaseHandler[GetAllTeachersRequest, GetAllTeachersRes
                 document_type=teacher.document_type,
                 document_number=teacher.document_number,
             )
-            for teacher in teachers
+            for teacher in page.items
         ]
         
-        return GetAllTeachersResponse(teachers=teacher_summaries)
+        return GetAllTeachersResponse(teachers=teacher_summaries, next_cursor=page.next_cursor)
@@ -1,5 +1,8 @@
+from typing import Optional
+
 from ...shared.base_data_transfer import BaseDataTransfer
 
 
 class GetAllTeachersRequest(BaseDataTransfer):
-    pass
+    limit: int
+    cursor: Optional[str] = None
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from ...shared.base_data_transfer import BaseDataTransfer
 
@@ -14,3 +14,4 @@ class TeacherSummary(BaseDataTransfer):
 
 class GetAllTeachersResponse(BaseDataTransfer):
     teachers: List[TeacherSummary]
+    next_cursor: Optional[str] = None
@@ -1,10 +1,10 @@
-from ...shared.base_auth_handler import BaseAuthHandler
+from ...shared.base_read_handler import BaseReadHandler
 from .get_teacher_by_id_request import GetTeacherByIdRequest
 from .get_teacher_by_id_response import GetTeacherByIdResponse
 from fastapi import HTTPException
 
 
-class GetTeacherByIdHandler(BaseAuthHandler[GetTeacherByIdRequest, GetTeacherByIdResponse]):
+class GetTeacherByIdHandler(BaseReadHandler[GetTeacherByIdRequest, GetTeacherByIdResponse]):
     async def execute(self, request: GetTeacherByIdRequest) -> GetTeacherByIdResponse:
         teacher = await self.unit_of_work.teacher_repository.get_by_id(
             str(request.id)
@@ -7,4 +7,5 @@ class GetTeacherClassroomStudentsRequest(BaseDataTransfer):
     requesting_user_id: str
     can_manage_any: bool = False
     include_inactive: bool = False
+    include_history: bool = False
 
@@ -16,7 +16,9 @@ class TeacherClassroomStudentSubject(BaseDataTransfer):
     can_manage: bool
     average_grade: Optional[str] = None
     average_score: Optional[float] = None
-    history: List["TeacherQualificationRecord"]
+    record_count: int = 0
+    # Only filled in when the request asks for the qualification history
+    history: List["TeacherQualificationRecord"] = []
 
 
 class TeacherClassroomStudentSummary(BaseDataTransfer):
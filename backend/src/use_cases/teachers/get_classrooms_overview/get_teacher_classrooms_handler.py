@@ -1,7 +1,10 @@
 from collections import defaultdict
 from typing import Optional
 
-from ...shared.base_auth_handler import BaseAuthHandler
+from ....persistence.repositories.classroom_subject_repository import (
+    ClassroomSubjectLoad,
+)
+from ...shared.base_read_handler import BaseReadHandler
 from .get_teacher_classrooms_request import GetTeacherClassroomsRequest
 from .get_teacher_classrooms_response import (
     GetTeacherClassroomsResponse,
@@ -11,7 +14,7 @@ from .get_teacher_classrooms_response import (
 
 
 class GetTeacherClassroomsHandler(
-    BaseAuthHandler[
+    BaseReadHandler[
         GetTeacherClassroomsRequest,
         GetTeacherClassroomsResponse,
     ]
@@ -19,12 +22,8 @@ class GetTeacherClassroomsHandler(
     async def execute(
         self, request: GetTeacherClassroomsRequest
     ) -> GetTeacherClassroomsResponse:
-        classroom_subjects = await self.unit_of_work.classroom_subject_repository.get_for_teacher(
-            request.teacher_id,
-            include_substitute=True,
-            with_relations=True,
-            only_active=not request.include_inactive,
-        )
+        only_active = not request.include_inactive
+        repository = self.unit_of_work.classroom_subject_repository
 
         tutor_classrooms = {
             classroom.id
@@ -32,6 +31,23 @@ class GetTeacherClassroomsHandler(
                 request.teacher_id
             )
         }
+        assigned_relations = await repository.get_for_teacher(
+            request.teacher_id,
+            include_substitute=True,
+            load=ClassroomSubjectLoad.SUMMARY,
+            only_active=only_active,
+        )
+        # Every subject of the classrooms the teacher tutors, in one query
+        tutored_relations = await repository.get_for_classrooms(
+            tutor_classrooms,
+            load=ClassroomSubjectLoad.SUMMARY,
+            only_active=only_active,
+        )
+        # A relation both assigned and tutored is the same identity-mapped object
+        relations = {
+            relation.id: relation
+            for relation in [*assigned_relations, *tutored_relations]
+        }
 
         def build_subject_entry(relation) -> Optional[TeacherClassroomSubject]:
             classroom = relation.classroom
@@ -58,7 +74,7 @@ class GetTeacherClassroomsHandler(
         grouped = defaultdict(list)
         classroom_cache = {}
 
-        for relation in classroom_subjects:
+        for relation in relations.values():
             entry = build_subject_entry(relation)
             if not entry:
                 continue
@@ -66,23 +82,6 @@ class GetTeacherClassroomsHandler(
             classroom_cache[classroom.id] = classroom
             grouped[classroom.id].append(entry)
 
-        # Augment with classroom subjects for classrooms where the teacher is a tutor
-        for tutor_classroom_id in tutor_classrooms:
-            extra_relations = await self.unit_of_work.classroom_subject_repository.get_for_classroom(
-                tutor_classroom_id,
-                with_relations=True,
-                only_active=not request.include_inactive,
-            )
-            existing_ids = {
-                subject.classroom_subject_id for subject in grouped[tutor_classroom_id]
-            }
-            for relation in extra_relations:
-                entry = build_subject_entry(relation)
-                if not entry or entry.classroom_subject_id in existing_ids:
-                    continue
-                classroom_cache[relation.classroom.id] = relation.classroom
-                grouped[relation.classroom.id].append(entry)
-
         classrooms: list[TeacherClassroomSummary] = []
         for classroom_id, subjects in grouped.items():
             classroom = classroom_cache.get(classroom_id)
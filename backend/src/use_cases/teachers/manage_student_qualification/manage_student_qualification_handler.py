@@ -1,8 +1,9 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from fastapi import HTTPException
 
 from ...shared.base_auth_handler import BaseAuthHandler
-from ....models.qualifications import Qualification
+from ....models.qualifications import Qualification, normalize_grade
+from ....services.cache_invalidation import STUDENT_GRADES
 from .manage_student_qualification_request import (
     ManageStudentQualificationRequest,
 )
@@ -11,22 +12,6 @@ from .manage_student_qualification_response import (
     QualificationRecordSummary,
 )
 
-GRADE_TO_SCORE = {
-    "AD": 20,
-    "A": 17,
-    "B": 14,
-    "C": 10,
-    "D": 5,
-}
-GRADE_ORDER = ["AD", "A", "B", "C", "D"]
-
-
-def normalize_grade(raw: str | None) -> str | None:
-    if raw is None:
-        return None
-    value = raw.strip().upper()
-    return value if value in GRADE_TO_SCORE else None
-
 
 class ManageStudentQualificationHandler(
     BaseAuthHandler[
@@ -82,6 +67,8 @@ class ManageStudentQualificationHandler(
             updated = True
 
         if updated:
+            # Moves the student's grade fingerprint for status-only changes too
+            enrollment.grades_updated_at = datetime.now(UTC)
             await self.unit_of_work.classroom_subject_student_repository.update(
                 enrollment
             )
@@ -89,6 +76,12 @@ class ManageStudentQualificationHandler(
         should_create_record = grade_value is not None
 
         if should_create_record:
+            # Authorization above guarantees this is one of the preloaded teachers
+            teacher = (
+                relation.teacher
+                if relation.teacher_id == request.teacher_id
+                else relation.substitute_teacher
+            )
             if request.qualification_record_id is not None:
                 record = await self.unit_of_work.qualification_repository.get_by_id(
                     request.qualification_record_id
@@ -97,12 +90,19 @@ class ManageStudentQualificationHandler(
                     raise HTTPException(
                         status_code=404, detail="Qualification record not found"
                     )
+                previous_grade = record.grade
                 if record_description is not None:
                     record.description = record_description
                 record.teacher_id = request.teacher_id
+                record.teacher = teacher
                 if grade_value is not None:
                     record.grade = grade_value
                 await self.unit_of_work.qualification_repository.update(record)
+                await self.unit_of_work.classroom_subject_student_repository.shift_grade_summary(
+                    enrollment.id,
+                    added_grade=record.grade,
+                    removed_grade=previous_grade,
+                )
             else:
                 record = Qualification(
                     classroom_subject_student_id=enrollment.id,
@@ -110,14 +110,16 @@ class ManageStudentQualificationHandler(
                     description=record_description,
                     grade=grade_value,
                 )
+                record.teacher = teacher
+                # Keep the loaded collection current instead of reloading the enrollment graph
+                enrollment.qualifications.append(record)
                 await self.unit_of_work.qualification_repository.create(record)
-
-            # refresh enrollment to include latest records
-            enrollment = (
-                await self.unit_of_work.classroom_subject_student_repository.get_by_id_with_relations(
-                    enrollment.id
+                await self.unit_of_work.classroom_subject_student_repository.shift_grade_summary(
+                    enrollment.id, record_delta=1, added_grade=record.grade
                 )
-            )
+
+        await self.unit_of_work.invalidate(STUDENT_GRADES, enrollment.student_id)
+        await self.unit_of_work.commit()
 
         records = []
         for record in enrollment.qualifications:
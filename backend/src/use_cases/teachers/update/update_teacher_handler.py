@@ -4,6 +4,8 @@ from uuid import UUID
 from ...shared.base_auth_handler import BaseAuthHandler
 from .update_teacher_request import UpdateTeacherRequest
 from .update_teacher_response import UpdateTeacherResponse
+from ....services.cache_invalidation import REFERENCE
+from ....services.reference_cache import CLASSROOMS
 
 
 class UpdateTeacherHandler(BaseAuthHandler[UpdateTeacherRequest, UpdateTeacherResponse]):
@@ -30,6 +32,8 @@ class UpdateTeacherHandler(BaseAuthHandler[UpdateTeacherRequest, UpdateTeacherRe
             teacher.gender = request.gender
 
         updated = await self.unit_of_work.teacher_repository.update(teacher)
+        await self.unit_of_work.invalidate(REFERENCE, CLASSROOMS)
+        await self.unit_of_work.commit()
         
         return UpdateTeacherResponse(
             id=str(updated.id),
@@ -13,7 +13,7 @@ class CreateUserHandler(BaseAuthHandler[CreateUserRequest, CreateUserResponse]):
         if existing:
             raise HTTPException(status_code=400, detail="Email already registered")
 
-        hashed = self.auth_service.get_password_hash(request.password)
+        hashed = await self.auth_service.get_password_hash_async(request.password)
         user = User(
             name=request.name,
             last_name=request.last_name,
@@ -25,6 +25,7 @@ class CreateUserHandler(BaseAuthHandler[CreateUserRequest, CreateUserResponse]):
             refresh_token=uuid4().hex,
         )
         created = await self.unit_of_work.user_repository.create(user)
+        await self.unit_of_work.commit()
         return CreateUserResponse(id=str(created.id), email=created.email)
 
 
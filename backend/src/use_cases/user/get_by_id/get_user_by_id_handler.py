@@ -1,11 +1,11 @@
-from ...shared.base_auth_handler import BaseAuthHandler
+from ...shared.base_read_handler import BaseReadHandler
 from .get_user_by_id_request import GetUserByIdRequest
 from .get_user_by_id_response import GetUserByIdResponse, RoleWithPermissions
 from fastapi import HTTPException
 from uuid import UUID
 
 
-class GetUserByIdHandler(BaseAuthHandler[GetUserByIdRequest, GetUserByIdResponse]):
+class GetUserByIdHandler(BaseReadHandler[GetUserByIdRequest, GetUserByIdResponse]):
     async def execute(self, request: GetUserByIdRequest) -> GetUserByIdResponse:
         user_id = request.id if isinstance(request.id, UUID) else UUID(str(request.id))
         user = await self.unit_of_work.user_repository.get_with_roles_permissions_by_id(user_id)
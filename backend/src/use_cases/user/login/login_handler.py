@@ -2,30 +2,51 @@ from ...shared.base_auth_handler import BaseAuthHandler
 from .login_request import LoginRequest
 from .login_response import LoginResponse
 from fastapi import HTTPException
+from ....config import configuration_variables
 from ....services.schemas.auth.CreateAccessTokenRequest import CreateAccessTokenRequest, CreateAccessTokenData
+from ....services.cache_invalidation import AUTH_USER
 
 class LoginHandler(BaseAuthHandler[LoginRequest, LoginResponse]):
     async def execute(self, request: LoginRequest) -> LoginResponse:
         user = await self.unit_of_work.user_repository.get_by_email(request.email)
         if user is None:
             raise HTTPException(status_code=401, detail="Invalid credentials")
-        if not self.auth_service.verify_password(request.password, user.password):
+        if not await self.auth_service.verify_password_async(request.password, user.password):
             raise HTTPException(status_code=401, detail="Invalid credentials")
+
+        # A new login revokes every token issued before it, stateless ones included
+        user.token_version = (user.token_version or 0) + 1
+        token_data = CreateAccessTokenData(
+            sub=str(user.id),
+            email=user.email,
+            ver=user.token_version,
+        )
+        if configuration_variables.auth_stateless_tokens:
+            await self._embed_authorization_claims(token_data)
+
         token_response = self.auth_service.create_access_token(
-            CreateAccessTokenRequest(
-                data=CreateAccessTokenData(
-                    sub=str(user.id),
-                    email=user.email,
-                )
-            )
+            CreateAccessTokenRequest(data=token_data)
         )
         # Persist tokens on login
         user.token = token_response.access_token
         user.refresh_token = token_response.refresh_token
         await self.unit_of_work.user_repository.update(user)
+        # Previous tokens are no longer valid for this user
+        await self.unit_of_work.invalidate(AUTH_USER, user.id)
+        await self.unit_of_work.commit()
 
         return LoginResponse(
             access_token=token_response.access_token,
             refresh_token=token_response.refresh_token,
             expires_at=token_response.expires_at,
-        )
\ No newline at end of file
+        )
+
+    async def _embed_authorization_claims(self, token_data: CreateAccessTokenData) -> None:
+        context = await self.unit_of_work.user_repository.get_auth_context_by_id(
+            token_data.sub
+        )
+        token_data.claims = True
+        token_data.roles = sorted(context.roles or [])
+        token_data.perms = sorted(context.permissions or [])
+        token_data.tid = str(context.teacher_id) if context.teacher_id else None
+        token_data.sid = str(context.student_id) if context.student_id else None
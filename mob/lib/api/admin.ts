@@ -9,6 +9,20 @@ import {
   CreateUserPayload,
 } from "../types/api";
 
+// List endpoints are cursor-paginated; follow next_cursor until the last page
+const fetchAllPages = async <TKey extends string, TItem>(url: string, key: TKey): Promise<TItem[]> => {
+  const items: TItem[] = [];
+  let cursor: string | null | undefined;
+  do {
+    const response = await apiClient.get<Record<TKey, TItem[]> & { next_cursor?: string | null }>(url, {
+      params: { limit: 500, ...(cursor ? { cursor } : {}) },
+    });
+    items.push(...response.data[key]);
+    cursor = response.data.next_cursor;
+  } while (cursor);
+  return items;
+};
+
 export const createUser = async (payload: CreateUserPayload) => {
   const response = await apiClient.post("/users", payload);
   return response.data;
@@ -46,23 +60,19 @@ export const assignPermission = async (payload: AssignPermissionPayload) => {
 
 // List fetching functions
 export const fetchAllStudents = async () => {
-  const response = await apiClient.get<{ students: Array<{ id: string; code: string; names: string; father_last_name: string; mother_last_name: string; email?: string | null }> }>("/students");
-  return response.data.students;
+  return fetchAllPages<"students", { id: string; code: string; names: string; father_last_name: string; mother_last_name: string; email?: string | null }>("/students", "students");
 };
 
 export const fetchAllTeachers = async () => {
-  const response = await apiClient.get<{ teachers: Array<{ id: string; names: string; father_last_name: string; mother_last_name: string; document_type: string; document_number: string }> }>("/teachers");
-  return response.data.teachers;
+  return fetchAllPages<"teachers", { id: string; names: string; father_last_name: string; mother_last_name: string; document_type: string; document_number: string }>("/teachers", "teachers");
 };
 
 export const fetchAllSubjects = async () => {
-  const response = await apiClient.get<{ subjects: Array<{ id: number; name: string; description: string }> }>("/subjects");
-  return response.data.subjects;
+  return fetchAllPages<"subjects", { id: number; name: string; description: string }>("/subjects", "subjects");
 };
 
 export const fetchAllClassrooms = async () => {
-  const response = await apiClient.get<{ classrooms: Array<{ id: string; description: string; level: string; degree: string; tutor_id?: string | null; tutor_name?: string | null }> }>("/classrooms");
-  return response.data.classrooms;
+  return fetchAllPages<"classrooms", { id: string; description: string; level: string; degree: string; tutor_id?: string | null; tutor_name?: string | null }>("/classrooms", "classrooms");
 };
 
 // Update functions
@@ -141,8 +151,7 @@ export const getClassroomById = async (classroomId: string) => {
 
 // Get all classroom-subjects
 export const fetchAllClassroomSubjects = async () => {
-  const response = await apiClient.get<{ classroom_subjects: Array<{ id: number; classroom_id: string; classroom_description: string; subject_id: number; subject_name: string; teacher_id?: string | null; teacher_name?: string | null; substitute_teacher_id?: string | null; substitute_teacher_name?: string | null; is_active: boolean; student_count: number }> }>("/classroom-subject");
-  return response.data.classroom_subjects;
+  return fetchAllPages<"classroom_subjects", { id: number; classroom_id: string; classroom_description: string; subject_id: number; subject_name: string; teacher_id?: string | null; teacher_name?: string | null; substitute_teacher_id?: string | null; substitute_teacher_name?: string | null; is_active: boolean; student_count: number }>("/classroom-subject", "classroom_subjects");
 };
 
 // Get all students in a classroom-subject
@@ -92,6 +92,28 @@ apiClient.interceptors.response.use(
   }
 );
 
+// Polled views revalidate with If-None-Match; a 304 reuses the payload last seen
+const revalidationCache = new Map<string, { etag: string; data: unknown }>();
+
+export const getWithRevalidation = async <T>(url: string, params: Record<string, unknown> = {}): Promise<T> => {
+  const key = `${url}?${JSON.stringify(params)}`;
+  const cached = revalidationCache.get(key);
+  const response = await apiClient.get<T>(url, {
+    params,
+    headers: cached ? { "If-None-Match": cached.etag } : undefined,
+    validateStatus: (status) => (status >= 200 && status < 300) || (status === 304 && !!cached),
+  });
+
+  if (response.status === 304 && cached) {
+    return cached.data as T;
+  }
+  const etag = response.headers["etag"];
+  if (etag) {
+    revalidationCache.set(key, { etag, data: response.data });
+  }
+  return response.data;
+};
+
 const attemptRefresh = async (refreshToken: string): Promise<TokenBundle | null> => {
   try {
     const refreshed = await refreshAccessToken(refreshToken);
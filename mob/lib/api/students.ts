@@ -1,4 +1,4 @@
-import { apiClient } from "./client";
+import { apiClient, getWithRevalidation } from "./client";
 import {
   StudentProfileEnvelope,
   StudentSubjectsEnvelope,
@@ -11,14 +11,9 @@ export const fetchStudentSubjects = async (
   studentId: string,
   includeInactive = false
 ): Promise<StudentSubjectsEnvelope> => {
-  const response = await apiClient.get<StudentSubjectsEnvelope>(
-    `/students/${studentId}/subjects`,
-    {
-      params: { include_inactive: includeInactive },
-    }
-  );
-
-  return response.data;
+  return getWithRevalidation<StudentSubjectsEnvelope>(`/students/${studentId}/subjects`, {
+    include_inactive: includeInactive,
+  });
 };
 
 export const fetchStudentById = async (
@@ -32,14 +27,10 @@ export const fetchStudentSubjectQualifications = async (
   studentId: string,
   includeInactive = false
 ): Promise<StudentSubjectQualificationsEnvelope> => {
-  const response = await apiClient.get<StudentSubjectQualificationsEnvelope>(
+  return getWithRevalidation<StudentSubjectQualificationsEnvelope>(
     `/students/${studentId}/subjects/qualifications`,
-    {
-      params: { include_inactive: includeInactive },
-    }
+    { include_inactive: includeInactive }
   );
-
-  return response.data;
 };
 
 export const downloadNotesPdf = async (
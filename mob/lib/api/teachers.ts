@@ -36,12 +36,13 @@ export const deleteTeacherQualification = async (
 export const fetchTeacherClassroomStudents = async (
   teacherId: string,
   classroomId: string,
-  includeInactive = false
+  includeInactive = false,
+  includeHistory = false
 ): Promise<TeacherClassroomStudentsEnvelope> => {
   const response = await apiClient.get<TeacherClassroomStudentsEnvelope>(
     `/teachers/${teacherId}/classrooms/${classroomId}/students`,
     {
-      params: { include_inactive: includeInactive },
+      params: { include_inactive: includeInactive, include_history: includeHistory },
     }
   );
 
@@ -108,6 +108,7 @@ const TeacherGradingScreen: React.FC = () => {
   );
   const [description, setDescription] = React.useState("");
   const [feedbackMessage, setFeedbackMessage] = React.useState<string | null>(null);
+  const [isHistoryOpen, setIsHistoryOpen] = React.useState(false);
 
   const { refetch: refetchRoster, isFetching: isRefreshingHistory } = useQuery({
     queryKey: [
@@ -120,7 +121,7 @@ const TeacherGradingScreen: React.FC = () => {
       if (!user?.teacherId || !classroomId) {
         throw new Error("Missing identifiers for history refresh.");
       }
-      return fetchTeacherClassroomStudents(user.teacherId, classroomId, true);
+      return fetchTeacherClassroomStudents(user.teacherId, classroomId, true, true);
     },
     enabled: false,
   });
@@ -167,6 +168,15 @@ const TeacherGradingScreen: React.FC = () => {
     }
   }, [refetchRoster, updateHistoryFromEnvelope]);
 
+  // History is the roster's expensive part, so it is only requested once the
+  // teacher opens this section
+  const toggleHistory = React.useCallback(() => {
+    if (!isHistoryOpen) {
+      refreshHistory();
+    }
+    setIsHistoryOpen(!isHistoryOpen);
+  }, [isHistoryOpen, refreshHistory]);
+
   const invalidateRelatedQueries = React.useCallback(() => {
     if (user?.teacherId) {
       queryClient.invalidateQueries({ queryKey: ["teacher-classroom-students"] });
@@ -338,8 +348,20 @@ const TeacherGradingScreen: React.FC = () => {
           <Text style={styles.feedback}>{feedbackMessage}</Text>
         ) : null}
         <View style={styles.historySection}>
-          <Text style={styles.sectionHeading}>Calificaciones registradas</Text>
-          {isRefreshingHistory ? (
+          <Text
+            onPress={toggleHistory}
+            accessibilityRole="button"
+            accessibilityState={{ expanded: isHistoryOpen }}
+            style={styles.sectionHeading}
+          >
+            Calificaciones registradas{" "}
+            <MaterialIcons
+              name={isHistoryOpen ? "expand-less" : "expand-more"}
+              size={20}
+              color="#1F2937"
+            />
+          </Text>
+          {!isHistoryOpen ? null : isRefreshingHistory ? (
             <Text style={styles.historyMeta}>Actualizando…</Text>
           ) : historyRecords.length === 0 ? (
             <Text style={styles.historyEmpty}>Aún no se registran notas.</Text>
@@ -162,6 +162,7 @@ export interface TeacherClassroomStudentSubjectSummary {
   can_manage: boolean;
   average_grade?: GradeLetter | null;
   average_score?: number | null;
+  record_count: number;
   history: TeacherQualificationRecordSummary[];
 }
 